@@ -93,20 +93,31 @@ def macd(
 def bollinger(
     values: Sequence[float], window: int = 20, num_std: float = 2.0
 ) -> tuple[list[float | None], list[float | None], list[float | None]]:
-    # Compute SMA and rolling std deviation without numpy
-    ma = sma(values, window)
-    out_mid = ma
-    out_upper: list[float | None] = [None] * len(values)
-    out_lower: list[float | None] = [None] * len(values)
-    for i in range(len(values)):
-        if i < window - 1:
-            continue
-        window_vals = [float(x) for x in values[i - window + 1 : i + 1]]
-        m = float(out_mid[i]) if out_mid[i] is not None else sum(window_vals) / window
-        var = sum((x - m) ** 2 for x in window_vals) / window
-        std = var**0.5
-        out_upper[i] = m + num_std * std
-        out_lower[i] = m - num_std * std
+    # SMA et écart-type glissants en un seul passage, sans numpy: moyenne et somme des carrés
+    # des écarts (M2) mises à jour à chaque pas façon Welford. Contrairement à
+    # sum(x²)/n - m², pas de perte de précision quand les prix sont grands devant leur écart
+    xs = [float(x) for x in values]
+    out_mid = sma(xs, window)
+    out_upper: list[float | None] = [None] * len(xs)
+    out_lower: list[float | None] = [None] * len(xs)
+    mean = 0.0
+    m2 = 0.0
+    for i, x in enumerate(xs):
+        if i < window:
+            d = x - mean
+            mean += d / (i + 1)
+            m2 += d * (x - mean)
+        else:
+            old = xs[i - window]
+            new_mean = mean + (x - old) / window
+            m2 += (x - old) * (x - new_mean + old - mean)
+            mean = new_mean
+        if i >= window - 1:
+            m = out_mid[i]
+            # max(): l'arrondi peut rendre M2 très légèrement négatif sur une série plate
+            std = (max(0.0, m2) / window) ** 0.5
+            out_upper[i] = m + num_std * std
+            out_lower[i] = m - num_std * std
     return out_upper, out_mid, out_lower
 
 
@@ -21,16 +21,18 @@ import requests
 class NewsAPIClient:
     """Client for NewsAPI.org - financial news and sentiment."""
 
-    def __init__(self, api_key: str | None = None):
+    def __init__(self, api_key: str | None = None, http_client=None):
         self.api_key = api_key or os.getenv('NEWS_API_KEY')
         self.base_url = 'https://newsapi.org/v2'
-        # pooled HTTP client
-        try:
-            from utils.http_client import HTTPClient  # type: ignore
+        # pooled HTTP client (optionally shared by APIManager)
+        self._http = http_client
+        if self._http is None:
+            try:
+                from utils.http_client import HTTPClient  # type: ignore
 
-            self._http = HTTPClient(headers={'Accept': 'application/json'})
-        except Exception:
-            self._http = None  # type: ignore
+                self._http = HTTPClient(headers={'Accept': 'application/json'})
+            except Exception:
+                self._http = None  # type: ignore
         # opt-in flag to force HTTPClient exclusively (keeps compatibility by default)
         try:
             self._http_only = os.getenv('WSAPP_HTTPCLIENT_ONLY', '0').strip().lower() in (
@@ -168,15 +170,17 @@ class NewsAPIClient:
 class AlphaVantageClient:
     """Client for Alpha Vantage - market data and indicators."""
 
-    def __init__(self, api_key: str | None = None):
+    def __init__(self, api_key: str | None = None, http_client=None):
         self.api_key = api_key or os.getenv('ALPHA_VANTAGE_KEY')
         self.base_url = 'https://www.alphavantage.co/query'
-        try:
-            from utils.http_client import HTTPClient  # type: ignore
+        self._http = http_client
+        if self._http is None:
+            try:
+                from utils.http_client import HTTPClient  # type: ignore
 
-            self._http = HTTPClient(headers={'Accept': 'application/json'})
-        except Exception:
-            self._http = None  # type: ignore
+                self._http = HTTPClient(headers={'Accept': 'application/json'})
+            except Exception:
+                self._http = None  # type: ignore
         try:
             self._http_only = os.getenv('WSAPP_HTTPCLIENT_ONLY', '0').strip().lower() in (
                 '1',
@@ -952,6 +956,14 @@ class TelegramNotifier:
         self._last_update_id = None
         # Error tracking for throttling
         self._err_count = 0
+        # Optional shared requests.Session (injected by APIManager); None -> module-level requests
+        self._session = None
+
+    def _post(self, url: str, data: dict):
+        sess = self._session
+        if sess is not None:
+            return sess.post(url, json=data, timeout=10)
+        return requests.post(url, json=data, timeout=10)
 
     def send_message(self, text: str, parse_mode: str = 'HTML') -> bool:
         """Send message to configured chat."""
@@ -961,7 +973,7 @@ class TelegramNotifier:
         try:
             url = f"{self.base_url}/sendMessage"
             data = {'chat_id': self.chat_id, 'text': text, 'parse_mode': parse_mode}
-            response = requests.post(url, json=data, timeout=10)
+            response = self._post(url, data)
             response.raise_for_status()
             return True
         except Exception as e:
@@ -988,7 +1000,7 @@ class TelegramNotifier:
         try:
             url = f"{self.base_url}/setMyCommands"
             data = {"commands": commands}
-            resp = requests.post(url, json=data, timeout=10)
+            resp = self._post(url, data)
             resp.raise_for_status()
             return True
         except Exception as e:
@@ -1050,7 +1062,7 @@ class TelegramNotifier:
         try:
             url = f"{self.base_url}/sendMessage"
             data = {'chat_id': chat_id, 'text': text, 'parse_mode': parse_mode}
-            response = requests.post(url, json=data, timeout=10)
+            response = self._post(url, data)
             response.raise_for_status()
             return True
         except Exception as e:
@@ -1068,7 +1080,8 @@ class TelegramNotifier:
             params = {'timeout': timeout}
             if self._last_update_id is not None:
                 params['offset'] = self._last_update_id + 1
-            resp = requests.get(f"{self.base_url}/getUpdates", params=params, timeout=timeout + 5)
+            getter = self._session.get if self._session is not None else requests.get
+            resp = getter(f"{self.base_url}/getUpdates", params=params, timeout=timeout + 5)
             resp.raise_for_status()
             data = resp.json() or {}
             updates = data.get('result', []) or []
@@ -1535,8 +1548,18 @@ class APIManager:
     """Central manager for all external APIs."""
 
     def __init__(self):
-        self.news = NewsAPIClient()
-        self.alpha_vantage = AlphaVantageClient()
+        # One pooled keep-alive transport shared by the JSON clients and Telegram, instead of
+        # one connection pool per client (TradeExecutor goes through this manager too)
+        try:
+            from utils.http_client import HTTPClient, pooled_session  # type: ignore
+
+            self._http = HTTPClient(headers={'Accept': 'application/json'})
+            self.http = pooled_session()
+        except Exception:
+            self._http = None  # type: ignore
+            self.http = None
+        self.news = NewsAPIClient(http_client=self._http)
+        self.alpha_vantage = AlphaVantageClient(http_client=self._http)
         self.yahoo = YahooFinanceClient()
         # Optional async HTTP client scaffold (may be used by async batch APIs later)
         try:
@@ -1571,6 +1594,7 @@ class APIManager:
         provider = provider.lower()
         self.market = self.alpha_vantage if provider == 'alpha' else self.yahoo
         self.telegram = TelegramNotifier()
+        self.telegram._session = self.http
         # Micro-memoization caches for recent results (short-lived)
         self._memo_quote: dict[str, tuple[float, dict]] = {}
         self._memo_series: dict[str, tuple[float, dict]] = {}
@@ -1658,6 +1682,20 @@ class APIManager:
     def start_telegram_commands(self, agent, allowed_chat_id: str | None = None) -> bool:
         return self.telegram.start_command_handler(agent, allowed_chat_id=allowed_chat_id)
 
+    def close(self) -> None:
+        """Close pooled HTTP connections (best-effort, called on app exit)."""
+        for client in (
+            self._http,
+            getattr(self.yahoo, '_http', None),
+            getattr(self.yahoo, '_session', None),
+            self.http,
+        ):
+            try:
+                if client is not None:
+                    client.close()
+            except Exception:
+                pass
+
     # ---------- Resilient wrappers with fallback ----------
     def _yahoo_quote_with_suffixes(self, symbol: str) -> dict:
         for suf in ("", ".TO", ".CN", ".NE"):
@@ -0,0 +1,58 @@
+from ai_agent import Signal
+from wsapp_gui.agent_ui import AgentUI
+
+
+class FakeTree:
+    def __init__(self):
+        self.rows = {}
+        self.detached = []
+        self._n = 0
+
+    def get_children(self):
+        return list(self.rows)
+
+    def delete(self, iid):
+        self.rows.pop(iid, None)
+
+    def insert(self, parent, where, values=(), tags=()):  # noqa: ARG002
+        self._n += 1
+        iid = f"I{self._n}"
+        self.rows[iid] = values
+        return iid
+
+    def item(self, iid, option=None):  # pragma: no cover - must not be used by the filter
+        raise AssertionError('filter should use the shadow values')
+
+    def detach(self, *iids):
+        self.detached.extend(iids)
+
+
+class DummyAgent:
+    def __init__(self, signals):
+        self._signals = signals
+
+    def get_signals(self):
+        return self._signals
+
+
+def test_agent_ui_tracks_values_and_filters_without_tree_reads():
+    sigs = [
+        Signal(ts=0, level='INFO', code='A', message='a', meta={'symbol': 'AAPL'}),
+        Signal(ts=0, level='ALERT', code='B', message='b'),
+        Signal(ts=0, level='WARN', code='C', message='c'),
+    ]
+    tree = FakeTree()
+    ui = AgentUI(DummyAgent(sigs), tree)
+    ui.refresh_signals()
+    assert len(ui.row_values) == 3
+    assert [v[1] for v in ui.row_values.values()] == ['INFO', 'ALERT', 'WARN']
+
+    ui.filter_level('alert')
+    kept = set(ui.row_values) - set(tree.detached)
+    assert [ui.row_values[i][3] for i in kept] == ['B']
+
+    # A refresh resets the shadow dict in place
+    shadow = ui.row_values
+    ui.agent = DummyAgent(sigs[:1])
+    ui.refresh_signals()
+    assert ui.row_values is shadow and len(shadow) == 1
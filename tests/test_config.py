@@ -81,3 +81,62 @@ def test_default_merge_is_non_destructive(tmp_path):
     assert isinstance(appcfg.get('notifications'), dict)
     # Existing notifications.info preserved
     assert appcfg.get('notifications.info') is True
+
+
+def test_set_without_save_defers_persistence(tmp_path):
+    cfg_path = tmp_path / 'cfg.json'
+    appcfg = AppConfig(str(cfg_path))
+
+    appcfg.set('ui.auto_refresh.enabled', True, save=False)
+    appcfg.set('ui.auto_refresh.seconds', 45, save=False)
+    assert appcfg.get('ui.auto_refresh.seconds') == 45
+    assert not cfg_path.exists()
+
+    appcfg.save_config()
+    reloaded = AppConfig(str(cfg_path))
+    assert reloaded.get('ui.auto_refresh.enabled') is True
+    assert reloaded.get('ui.auto_refresh.seconds') == 45
+
+
+def test_write_behind_coalesces_saves(tmp_path, monkeypatch):
+    cfg_path = tmp_path / 'cfg.json'
+    appcfg = AppConfig(str(cfg_path))
+    appcfg.enable_write_behind(delay=60)
+    saves = []
+    real_save = appcfg.save_config
+    monkeypatch.setattr(appcfg, 'save_config', lambda: (saves.append(1), real_save()))
+
+    for n in range(5):
+        appcfg.set('ui.movers.top_n', n)
+    assert saves == [] and not cfg_path.exists()
+    assert appcfg.get('ui.movers.top_n') == 4
+
+    appcfg._timer.cancel()
+    appcfg.flush()
+    appcfg.flush()  # rien en attente: pas de seconde écriture
+    assert saves == [1]
+    assert AppConfig(str(cfg_path)).get('ui.movers.top_n') == 4
+
+
+def test_get_cache_is_invalidated_by_set(tmp_path):
+    appcfg = AppConfig(str(tmp_path / 'cfg.json'))
+
+    assert appcfg.get('ui.charts.sma_window', 20) == 20  # absence mise en cache
+    appcfg.set('ui.charts.sma_window', 14, save=False)
+    assert appcfg.get('ui.charts.sma_window', 20) == 14
+
+    assert appcfg.get('ui.charts.show_grid') is None
+    appcfg.set('ui.charts', {'show_grid': True}, save=False)  # remplace le sous-arbre
+    assert appcfg.get('ui.charts.show_grid') is True
+    assert appcfg.get('ui.charts.sma_window', 20) == 20
+
+
+def test_snapshot_returns_section_copy(tmp_path):
+    appcfg = AppConfig(str(tmp_path / 'cfg.json'))
+    appcfg.set('strategy_runner.fast', 12, save=False)
+
+    snap = appcfg.snapshot('strategy_runner')
+    assert snap == {'fast': 12}
+    snap['fast'] = 99  # copie: la configuration n'est pas modifiée
+    assert appcfg.get('strategy_runner.fast') == 12
+    assert appcfg.snapshot('theme') == {} and appcfg.snapshot('missing') == {}
@@ -203,3 +203,17 @@ def test_clients_without_keys_return_empty(monkeypatch):
     assert news.get_company_news('AAPL') == []
     assert av.get_quote('AAPL') is None
     assert av.get_time_series('AAPL') is None
+
+
+def test_api_manager_shares_pooled_transport():
+    from external_apis import APIManager
+
+    am = APIManager()
+    try:
+        assert am.news._http is am.alpha_vantage._http
+        if am.http is not None:
+            assert am.telegram._session is am.http
+            adapter = am.http.get_adapter('https://api.telegram.org')
+            assert adapter._pool_maxsize == 8
+    finally:
+        am.close()
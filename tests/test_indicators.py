@@ -0,0 +1,37 @@
+import random
+
+from analytics.indicators import bollinger
+
+
+def test_bollinger_matches_windowed_std():
+    rng = random.Random(7)
+    closes = [100 + rng.uniform(-5, 5) for _ in range(300)]
+    window = 20
+    up, mid, lo = bollinger(closes, window=window, num_std=2.0)
+
+    assert up[: window - 1] == [None] * (window - 1)
+    for i in range(window - 1, len(closes)):
+        vals = closes[i - window + 1 : i + 1]
+        m = sum(vals) / window
+        std = (sum((x - m) ** 2 for x in vals) / window) ** 0.5
+        assert abs(mid[i] - m) < 1e-9
+        assert abs(up[i] - (m + 2 * std)) < 1e-6
+        assert abs(lo[i] - (m - 2 * std)) < 1e-6
+
+
+def test_bollinger_flat_series_has_zero_width():
+    up, mid, lo = bollinger([50.0] * 30, window=10)
+    assert up[-1] == mid[-1] == lo[-1] == 50.0
+
+
+def test_bollinger_keeps_precision_on_large_low_volatility_prices():
+    rng = random.Random(11)
+    closes = [1e7 + rng.gauss(0, 0.3) for _ in range(200)]
+    window = 20
+    up, mid, _lo = bollinger(closes, window=window, num_std=1.0)
+
+    for i in range(window - 1, len(closes)):
+        vals = closes[i - window + 1 : i + 1]
+        m = sum(vals) / window
+        std = (sum((x - m) ** 2 for x in vals) / window) ** 0.5
+        assert abs((up[i] - mid[i]) - std) < 1e-3 * std
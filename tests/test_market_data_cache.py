@@ -0,0 +1,41 @@
+from ws_api import WealthsimpleAPI, WSAPISession
+
+
+def _api(monkeypatch):
+    api = WealthsimpleAPI(WSAPISession())
+    calls = []
+
+    def fake_query(name, variables, data_response_path, expect_type, **_kw):  # noqa: ARG001
+        calls.append(variables['id'])
+        return {'id': variables['id'], 'allowedOrderSubtypes': ['MARKET', 'LIMIT']}
+
+    monkeypatch.setattr(api, 'do_graphql_query', fake_query)
+    return api, calls
+
+
+def test_market_data_cache_hits_and_lru_bound(monkeypatch):
+    api, calls = _api(monkeypatch)
+    api._md_cache_max = 2
+
+    api.get_security_market_data('A')
+    api.get_security_market_data('A')
+    assert calls == ['A']
+
+    api.get_security_market_data('B')
+    api.get_security_market_data('A')  # refresh recency of A
+    api.get_security_market_data('C')  # evicts B (least recently used)
+    assert list(api._md_cache) == ['A', 'C']
+    assert calls == ['A', 'B', 'C']
+
+
+def test_allowed_subtypes_cached_and_invalidated(monkeypatch):
+    api, calls = _api(monkeypatch)
+
+    assert api.get_allowed_order_subtypes('X') == ['MARKET', 'LIMIT']
+    api._md_cache.clear()  # market data expired; subtypes still cached
+    assert api.get_allowed_order_subtypes('X') == ['MARKET', 'LIMIT']
+    assert calls == ['X']
+
+    api.invalidate_market_data('X')
+    api.get_allowed_order_subtypes('X')
+    assert calls == ['X', 'X']
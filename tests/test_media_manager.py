@@ -55,3 +55,84 @@ def test_logo_caching(monkeypatch):
 
     assert calls["count"] == 1, "Expected cached image reuse"
     assert len(results) >= 2
+
+
+def test_logos_batch_dedupes_and_uses_cache(monkeypatch):
+    urls = []
+
+    import utils.http_client as http_client
+
+    class DummyHTTP:
+        def get(self, url, params=None):  # noqa: ARG002
+            urls.append(url)
+            return DummyResp(200, b"\x89PNG\r\n\x1a\n")
+
+    monkeypatch.setattr(http_client, 'HTTPClient', lambda **kw: DummyHTTP())
+    mm = MediaManager(ttl_sec=9999)
+
+    batches = []
+    mm.get_logos_async(['aaa', 'AAA', 'BBB', '', 'CCC'], batches.append)
+    assert len(batches) == 1
+    assert set(batches[0]) == {'AAA', 'BBB', 'CCC'}
+    assert len(urls) == 3
+
+    # Everything cached now: resolved immediately without new requests
+    mm.get_logos_async(['BBB', 'CCC'], batches.append)
+    assert len(batches) == 2 and set(batches[1]) == {'BBB', 'CCC'}
+    assert len(urls) == 3
+
+
+def test_logo_cache_keys_by_size_and_evicts_lru(monkeypatch):
+    import utils.http_client as http_client
+    import wsapp_gui.media_manager as media_manager
+
+    urls = []
+
+    class DummyHTTP:
+        def get(self, url, params=None):  # noqa: ARG002
+            urls.append(url)
+            return DummyResp(200, b"\x89PNG\r\n\x1a\n")
+
+    monkeypatch.setattr(http_client, 'HTTPClient', lambda **kw: DummyHTTP())
+    monkeypatch.setattr(media_manager, '_LOGO_CACHE_MAX', 2)
+    mm = MediaManager(max_logo_px=24, detail_logo_px=96, ttl_sec=9999)
+
+    mm.get_logo_async('AAA', lambda _img: None)
+    mm.get_logo_async('AAA', lambda _img: None, large=True)
+    # Petit et grand logo: deux entrées distinctes, la seconde ne remplace pas la première
+    assert list(mm._logo_cache) == [('AAA', 24), ('AAA', 96)]
+    assert len(urls) == 2
+
+    mm.get_logo_async('AAA', lambda _img: None)  # hit: devient la plus récente
+    mm.get_logo_async('BBB', lambda _img: None)
+    assert list(mm._logo_cache) == [('AAA', 24), ('BBB', 24)]
+    assert set(mm._logo_cache_ts) == set(mm._logo_cache)
+    assert len(urls) == 3
+
+
+def test_expired_logo_is_revalidated_with_etag(monkeypatch):
+    import utils.http_client as http_client
+
+    sent = []
+
+    class DummyHTTP:
+        def get(self, url, params=None, headers=None):  # noqa: ARG002
+            sent.append((url, headers))
+            if headers and headers.get('If-None-Match') == '"v1"':
+                return DummyResp(304, b'')
+            r = DummyResp(200, b"\x89PNG\r\n\x1a\n")
+            r.headers['etag'] = '"v1"'
+            return r
+
+    monkeypatch.setattr(http_client, 'HTTPClient', lambda **kw: DummyHTTP())
+    mm = MediaManager(ttl_sec=0)
+
+    mm.get_logo_async('AAA', lambda _img: None)
+    first_url = sent[0][0]
+    assert sent[0][1] is None
+
+    # TTL écoulé: requête conditionnelle sur la même URL, 304 -> octets réutilisés
+    mm.get_logo_async('AAA', lambda _img: None)
+    assert sent[1] == (first_url, {'If-None-Match': '"v1"'})
+    assert len(sent) == 2
+    assert mm._logo_cache[('AAA', 64)].raw_bytes == b"\x89PNG\r\n\x1a\n"
@@ -574,3 +574,16 @@ def test_large_scale_trading_scenario():
         assert (
             snap['cash'] >= expected_remaining_cash * 0.9
         )  # Allow for rounding and fewer positions
+
+
+def test_on_change_hook_fires_on_logged_action():
+    with (
+        patch('wsapp_gui.trade_executor.TradeExecutor._load_ledger'),
+        patch('wsapp_gui.trade_executor.TradeExecutor._save_ledger'),
+    ):
+        ex = TradeExecutor(DummyAPI({'AAA': 50.0}))
+        ex.configure(enabled=True, mode='paper', base_size=500.0)
+        calls = []
+        ex.on_change = lambda: calls.append(len(ex.last_actions(100)))
+        ex.on_signal('AAA', Sig('buy', index=7))
+        assert calls and calls[-1] == len(ex.last_actions(100))
@@ -25,6 +25,22 @@ except Exception:  # pragma: no cover
     requests = None  # type: ignore
 
 
+def pooled_session(pool_connections: int = 4, pool_maxsize: int = 8):
+    """requests.Session avec un pool keep-alive dimensionné pour les workers I/O de l'app."""
+    if requests is None:
+        raise ImportError("requests is required for pooled_session")
+    sess = requests.Session()
+    try:
+        from requests.adapters import HTTPAdapter  # type: ignore
+
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        sess.mount('https://', adapter)
+        sess.mount('http://', adapter)
+    except Exception:
+        pass
+    return sess
+
+
 class HTTPClient:
     def __init__(
         self,
@@ -47,7 +63,7 @@ class HTTPClient:
         if httpx is not None:
             self._client = httpx.Client(timeout=self.timeout, headers=self.headers)
         elif requests is not None:
-            self._client = requests.Session()
+            self._client = pooled_session()
             if self.headers:
                 self._client.headers.update(self.headers)
         else:
@@ -61,13 +77,14 @@ class HTTPClient:
         params: dict[str, Any] | None = None,
         json: dict[str, Any] | None = None,
         data: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
     ):
         attempt = 0
         while True:
             try:
                 if httpx is not None:
                     resp = self._client.request(
-                        method.upper(), url, params=params, json=json, data=data
+                        method.upper(), url, params=params, json=json, data=data, headers=headers
                     )
                 else:
                     # requests.Session
@@ -77,6 +94,7 @@ class HTTPClient:
                         params=params,
                         json=json,
                         data=data,
+                        headers=headers,
                         timeout=self.timeout,
                     )
             except Exception as e:
@@ -104,8 +122,10 @@ class HTTPClient:
                 continue
             return resp
 
-    def get(self, url: str, params: dict[str, Any] | None = None):
-        return self._request('GET', url, params=params)
+    def get(
+        self, url: str, params: dict[str, Any] | None = None, headers: dict[str, str] | None = None
+    ):
+        return self._request('GET', url, params=params, headers=headers)
 
     def post(
         self, url: str, json: dict[str, Any] | None = None, data: dict[str, Any] | None = None
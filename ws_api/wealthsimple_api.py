@@ -1,5 +1,7 @@
 import re
+import threading
 import uuid
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from inspect import signature
 from typing import Any, Callable, Optional
@@ -38,6 +40,8 @@ class WealthsimpleAPIBase:
     def __init__(self, sess: Optional[WSAPISession] = None):
         self.security_market_data_cache_getter = None
         self.security_market_data_cache_setter = None
+        # Persistent HTTP session: keep-alive connections reused across API calls
+        self.http = requests.Session()
         self.session = WSAPISession()
         self.start_session(sess)
 
@@ -76,7 +80,7 @@ class WealthsimpleAPIBase:
             headers['User-Agent'] = WealthsimpleAPIBase.user_agent
 
         try:
-            response = requests.request(method, url, json=data, headers=headers)
+            response = self.http.request(method, url, json=data, headers=headers)
 
             if return_headers:
                 # Combine headers and body as a single string
@@ -363,7 +367,12 @@ class WealthsimpleAPI(WealthsimpleAPIBase):
         super().__init__(sess)
         # Caches
         self.account_cache = {}
-        self._md_cache = {}  # security_id -> (timestamp, data)
+        self._md_cache = OrderedDict()  # security_id -> (timestamp, data), LRU order
+        self._md_cache_max = 256
+        # Guards _md_cache: callers fetch market data from several worker threads
+        self._md_lock = threading.Lock()
+        self._subtypes_cache = {}  # security_id -> (timestamp, list[str])
+        self._subtypes_ttl_sec = 3600  # allowed order types rarely change
         self._fx_cache = {}  # (base, quote) -> (timestamp, rate)
         self._cache_ttl_sec = 120
         self._symbol_map = {}  # security_id -> (symbol, name)
@@ -377,9 +386,11 @@ class WealthsimpleAPI(WealthsimpleAPIBase):
     ):
         now = datetime.utcnow().timestamp()
         if not force_refresh:
-            cached = self._md_cache.get(security_id)
-            if cached and (now - cached[0]) < self._cache_ttl_sec:
-                return cached[1]
+            with self._md_lock:
+                cached = self._md_cache.get(security_id)
+                if cached and (now - cached[0]) < self._cache_ttl_sec:
+                    self._md_cache.move_to_end(security_id)
+                    return cached[1]
         data = self.do_graphql_query(
             'FetchSecurityMarketData',
             {'id': security_id},
@@ -387,9 +398,25 @@ class WealthsimpleAPI(WealthsimpleAPIBase):
             'object',
         )
         if data:
-            self._md_cache[security_id] = (now, data)
+            with self._md_lock:
+                self._md_cache[security_id] = (now, data)
+                self._md_cache.move_to_end(security_id)
+                while len(self._md_cache) > self._md_cache_max:
+                    self._md_cache.popitem(last=False)
         return data
 
+    def invalidate_market_data(self, security_id: str | None = None) -> None:
+        """Drop cached market data (and allowed order subtypes) for one or all securities."""
+        with self._md_lock:
+            if security_id is None:
+                self._md_cache.clear()
+            else:
+                self._md_cache.pop(security_id, None)
+        if security_id is None:
+            self._subtypes_cache.clear()
+        else:
+            self._subtypes_cache.pop(security_id, None)
+
     def get_fx_rate(self, base: str, quote: str = 'CAD') -> Optional[float]:
         if base == quote:
             return 1.0
@@ -1015,12 +1042,18 @@ class WealthsimpleAPI(WealthsimpleAPIBase):
 
         Wealthsimple exposes this in the market data fragment. This is useful to map UI choices.
         """
+        now = datetime.utcnow().timestamp()
+        cached = self._subtypes_cache.get(security_id)
+        if cached and (now - cached[0]) < self._subtypes_ttl_sec:
+            return list(cached[1])
         try:
             md = self.get_security_market_data(security_id)
             sub = md.get('allowedOrderSubtypes') if isinstance(md, dict) else None
             # Normalize to list[str]
             if isinstance(sub, list):
-                return [str(x) for x in sub]
+                out = [str(x) for x in sub]
+                self._subtypes_cache[security_id] = (now, out)
+                return list(out)
         except Exception:
             pass
         return None
@@ -1,22 +1,48 @@
 """GUI package refactor.
 
 Expose WSApp and modular managers.
+
+Les exports sont chargés au premier accès (PEP 562): importer un sous-module léger
+(``wsapp_gui.config``, ``wsapp_gui.media_manager``...) n'entraîne pas le chargement de
+l'application complète (Tk, matplotlib, clients API).
 """
 
-from .agent_ui import AgentUI
-from .app import WSApp
-from .charts import ChartController
-from .chat_manager import ChatManager
-from .config import app_config
-from .export_manager import ExportManager
-
-# Gestionnaires modulaires
-from .login_manager import LoginManager
-from .news_manager import NewsManager
-from .portfolio_manager import PortfolioManager
-from .search_manager import SearchManager
-from .theming import PALETTES, apply_palette
-from .ui_builder import UIBuilder
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .agent_ui import AgentUI
+    from .app import WSApp
+    from .charts import ChartController
+    from .chat_manager import ChatManager
+    from .config import app_config
+    from .export_manager import ExportManager
+    from .login_manager import LoginManager
+    from .news_manager import NewsManager
+    from .portfolio_manager import PortfolioManager
+    from .search_manager import SearchManager
+    from .theming import PALETTES, apply_palette
+    from .ui_builder import UIBuilder
+
+# Nom exporté -> sous-module qui le définit
+_EXPORTS = {
+    "WSApp": ".app",
+    "ChartController": ".charts",
+    "AgentUI": ".agent_ui",
+    "PALETTES": ".theming",
+    "apply_palette": ".theming",
+    "app_config": ".config",
+    # Gestionnaires modulaires
+    "LoginManager": ".login_manager",
+    "PortfolioManager": ".portfolio_manager",
+    "SearchManager": ".search_manager",
+    "NewsManager": ".news_manager",
+    "ChatManager": ".chat_manager",
+    "UIBuilder": ".ui_builder",
+    "ExportManager": ".export_manager",
+}
 
 __all__ = [
     "WSApp",
@@ -33,3 +59,16 @@ __all__ = [
     "UIBuilder",
     "ExportManager",
 ]
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
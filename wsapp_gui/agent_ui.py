@@ -12,28 +12,37 @@ class AgentUI:
     def __init__(self, agent: AIAgent, tree: ttk.Treeview):
         self.agent = agent
         self.tree = tree
+        # Copie Python des valeurs par iid: évite un aller-retour Tcl par ligne lors du filtrage
+        self.row_values: dict[str, tuple] = {}
 
     def refresh_signals(self):
         if not self.tree:
             return
         for row in self.tree.get_children():
             self.tree.delete(row)
+        self.row_values.clear()
         signals: Iterable[Signal] = self.agent.get_signals()
         for sig in list(signals)[-100:]:
             level_tag = f"lvl_{sig.level.lower()}"
             symbol = sig.meta.get('symbol') if isinstance(sig.meta, dict) else ''
-            self.tree.insert(
-                '',
-                tk.END,
-                values=(
-                    datetime.fromtimestamp(sig.ts).strftime('%H:%M:%S'),
-                    sig.level,
-                    symbol or '',
-                    sig.code,
-                    sig.message,
-                ),
-                tags=(level_tag,),
+            values = (
+                datetime.fromtimestamp(sig.ts).strftime('%H:%M:%S'),
+                sig.level,
+                symbol or '',
+                sig.code,
+                sig.message,
             )
+            iid = self.tree.insert('', tk.END, values=values, tags=(level_tag,))
+            self.row_values[iid] = values
+
+    def filter_level(self, level: str) -> None:
+        """Détache les lignes dont le niveau diffère de `level` (sans relire le Treeview)."""
+        if not self.tree or not level or level == 'ALL':
+            return
+        level = level.upper()
+        hidden = [iid for iid, vals in self.row_values.items() if str(vals[1]).upper() != level]
+        if hidden:
+            self.tree.detach(*hidden)
 
 
 __all__ = ["AgentUI"]
@@ -1,11 +1,24 @@
 from __future__ import annotations
 
 # Standard library
+import atexit
+import bisect
+import contextlib
 import csv
+import functools
+import heapq
+import importlib.util
+import itertools
 import os
+import queue
+import re
 import threading
+import time
 import tkinter as tk
+import traceback
 import webbrowser
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from tkinter import filedialog, messagebox, simpledialog, ttk
@@ -39,7 +52,7 @@ from .search_manager import SearchManager
 from .strategy_runner import StrategyRunner
 from .theming import PALETTES, apply_palette
 from .trade_executor import TradeExecutor
-from .ui_utils import attach_tooltip, format_money
+from .ui_utils import attach_tooltip, format_money, money_formatter
 
 # External APIs and Symbol Analyzer availability
 try:
@@ -50,19 +63,293 @@ except ImportError:
     HAS_EXTERNAL_APIS = False
     APIManager = None
 
-try:
-    from symbol_analyzer import SymbolAnalyzer
+# Symbol Analyzer: importé au premier usage (tire matplotlib/analytics), voir WSApp.symbol_analyzer
+HAS_SYMBOL_ANALYZER = importlib.util.find_spec('symbol_analyzer') is not None
+
+# Codes fréquents proposés en suggestion de recherche (en plus des positions)
+_COMMON_SYMBOLS = frozenset({'AAPL', 'MSFT', 'TSLA', 'NVDA', 'GOOGL', 'AMZN', 'META', 'BTC', 'ETH'})
+
+# Tuples de tags pré-construits pour les lignes alternées des Treeviews
+_TAG_EVEN = ('even',)
+_TAG_ODD = ('odd',)
+# Couleur P&L du portefeuille simulé (tags configurés une fois à la construction)
+_TAG_PF_POS = ('positive_pnl',)
+_TAG_PF_NEG = ('negative_pnl',)
+_PF_POS_FG = '#22c55e'  # green
+_PF_NEG_FG = '#ef4444'  # red
+# Réserve de lignes détachées du portefeuille (recyclées au lieu de insert/delete)
+_PF_POOL_SIZE = 64
+_PF_POOL_GROW = 32
+
+
+# Accesseurs numériques des dicts de position (0.0 si absent ou non numérique)
+def _pos_pnl_pct(p: dict) -> float:
+    v = p.get('pnlPct')
+    return v if isinstance(v, (int, float)) else 0.0
+
+
+def _pos_pnl_abs(p: dict) -> float:
+    v = p.get('pnlAbs')
+    return v if isinstance(v, (int, float)) else 0.0
+
+
+def _pos_value(p: dict) -> float:
+    v = p.get('value')
+    return v if isinstance(v, (int, float)) else 0.0
+
+
+# Colonnes des arbres « mouvements » construites depuis une position (une fonction par arbre)
+def _mover_cols_pnl(p: dict) -> tuple:
+    return (
+        p.get('symbol'),
+        f"{_pos_pnl_pct(p):.2f}",
+        f"{_pos_pnl_abs(p):.2f}",
+        f"{_pos_value(p):.2f}",
+        p.get('quantity'),
+    )
+
+
+def _mover_cols_active(p: dict) -> tuple:
+    return (
+        p.get('symbol'),
+        f"{_pos_value(p):.2f}",
+        f"{_pos_pnl_pct(p):.2f}{'*' if p.get('pnlIsDaily') else ''}",
+        f"{_pos_pnl_abs(p):.2f}",
+        p.get('quantity'),
+    )
+
+
+# Décorations retirées avant conversion numérique d'une cellule (flèches, %, *, milliers)
+_NUM_STRIP_TBL = str.maketrans('', '', '↑↓%*,')
+
+# Mots de sentiment des actualités, mots entiers avec leur pluriel / 3e personne
+# (gain/gains, loss/losses); le groupe capture la racine pour que chaque mot compte une fois
+_NEWS_POS_RE = re.compile(r'\b(up|gain|beat|growth|surge|rise)s?\b')
+_NEWS_NEG_RE = re.compile(r'\b(down|loss|miss|decline|drop|fall)(?:es|s)?\b')
+
+
+def _news_display_row(article: dict) -> tuple[str, str, str, str]:
+    """Valeurs `(source, titre, date, sentiment)` d'une ligne du tableau des actualités."""
+    source = article.get('source', {}).get('name', 'N/A')
+    raw_title = article.get('title', 'Sans titre')
+    title = raw_title[:80] + '...' if len(raw_title) > 80 else raw_title
+    published = article.get('publishedAt', '')[:10]
+    score = article.get('sentimentScore', 0)
+    if score > 0:
+        sentiment = f"🟢 +{score}" if score > 1 else "🟢 +1"
+    elif score < 0:
+        sentiment = f"🔴 {score}"
+    else:
+        sentiment = "🟡 0"
+    return source, title, published, sentiment
+
+
+def _pf_display_rows(
+    snap: dict, currency: str
+) -> tuple[list[tuple[str, tuple, tuple]], float, float]:
+    """Lignes `(symbole, valeurs, tags)` du portefeuille simulé, valeur de marché et P&L totaux."""
+    quotes = snap.get('quotes') or {}
+    fmt_price = money_formatter(currency, with_symbol=True)
+    fmt_value = money_formatter(currency)
+    rows = []
+    total_value = total_pnl = 0.0
+    for pos in snap.get('positions', []):
+        symbol = pos['symbol']
+        qty = pos['qty']
+        avg_price = pos['avg_price']
+        last_price = quotes.get(symbol, {}).get('last', 0.0)
+        cost_basis = qty * avg_price
+        market_value = qty * last_price if last_price > 0 else cost_basis
+        pnl_dollars = market_value - cost_basis
+        pnl_percent = (pnl_dollars / cost_basis * 100) if cost_basis != 0 else 0.0
+        total_value += market_value
+        total_pnl += pnl_dollars
+        # Prix avec symbole monétaire; valeur sans; couleur P&L seulement si coté
+        tags = ()
+        if last_price > 0:
+            last_str = fmt_price(last_price)
+            pnl_str = f"{pnl_percent:+.1f}%"
+            if pnl_percent > 0:
+                tags = _TAG_PF_POS
+            elif pnl_percent < 0:
+                tags = _TAG_PF_NEG
+        else:
+            last_str = pnl_str = "N/A"
+        values = (
+            symbol,
+            f"{qty:.4f}",
+            f"{avg_price:.2f}",
+            last_str,
+            pnl_str,
+            fmt_value(market_value),
+        )
+        rows.append((symbol, values, tags))
+    return rows, total_value, total_pnl
+
+
+# Intervalle de la surveillance AI: base, puis doublé tant que les positions sont inchangées
+_WATCHDOG_BASE_MS = 30000
+_WATCHDOG_MAX_MS = 240000
+
+# Intervalle minimal entre deux signalements d'erreur de callback UI (s)
+_UI_ERROR_REPORT_SECS = 10.0
+
+# Cache des recherches de titres (stale-while-revalidate): frais sans requête, puis servi
+# tel quel avec rafraîchissement en arrière-plan, au-delà refait au premier plan
+_SEARCH_FRESH_SECS = 60.0
+_SEARCH_STALE_SECS = 600.0
+_SEARCH_CACHE_MAX = 64
+
+# Messages conservés dans le chat: au-delà, les plus anciens sont retirés du widget Text
+_CHAT_MAX_MESSAGES = 500
+
+# Colonnes des Treeviews: (colonne, en-tête, largeur, ancrage, tri numérique)
+_POSITION_COLS = (
+    ('symbol', 'Symbole', 95, tk.W, False),
+    ('name', 'Nom', 200, tk.W, False),
+    ('qty', 'Qté', 60, tk.E, True),
+    ('last', 'Prix', 70, tk.E, True),
+    ('value', 'Valeur', 85, tk.E, True),
+    ('cur', 'Devise', 55, tk.W, False),
+    ('avg', 'PrixMoy', 70, tk.E, True),
+    ('pnl', 'PnL%', 60, tk.E, True),
+    ('pnl_abs', 'PnL$', 80, tk.E, True),
+)
+_ACTIVITY_COLS = (
+    ('date', 'Date', 155, tk.W, False),
+    ('desc', 'Description', 480, tk.W, False),
+    ('amt', 'Montant', 110, tk.E, True),
+)
+_SEARCH_COLS = (
+    ('symbol', 'Symbole', 90, tk.W, False),
+    ('name', 'Nom', 220, tk.W, False),
+    ('exchange', 'Échange', 80, tk.W, False),
+    ('status', 'Statut', 70, tk.W, False),
+    ('buyable', 'Achetable', 70, tk.W, False),
+    ('market', 'Marché', 80, tk.W, False),
+)
+# Indice de 'symbol' dans les valeurs des lignes de positions
+_POS_SYMBOL_IDX = [c[0] for c in _POSITION_COLS].index('symbol')
+# Gagnants / Perdants / Opportunités
+_MOVER_PNL_COLS = (
+    ('symbol', 'Symbole', 80, tk.W, False),
+    ('pnlpct', 'PnL%', 65, tk.E, True),
+    ('pnlabs', 'PnL$', 80, tk.E, True),
+    ('value', 'Valeur', 90, tk.E, True),
+    ('qty', 'Qté', 60, tk.E, True),
+)
+# Résultats de recherche de l'onglet Découverte
+_SEARCH_RESULT_COLS = (
+    ('symbol', 'Symbole', 90, tk.W, False),
+    ('name', 'Nom', 200, tk.W, False),
+    ('exchange', 'Échange', 80, tk.W, False),
+    ('status', 'Statut', 70, tk.W, False),
+    ('buyable', 'Achetable', 70, tk.W, False),
+    ('market', 'Marché', 80, tk.W, False),
+)
+# Gagnants / Perdants compacts de l'onglet Découverte
+_MOVER_COMPACT_COLS = (
+    ('symbol', 'Symb', 80, tk.W, False),
+    ('chg', '%Chg', 60, tk.E, True),
+    ('price', 'Prix', 70, tk.E, True),
+    ('vol', 'Vol', 80, tk.E, True),
+)
+# Plus actifs
+_ACTIVE_COLS = (
+    ('symbol', 'Symbole', 80, tk.W, False),
+    ('value', 'Valeur', 90, tk.E, True),
+    ('pnlpct', 'PnL%', 65, tk.E, True),
+    ('pnlabs', 'PnL$', 80, tk.E, True),
+    ('qty', 'Qté', 60, tk.E, True),
+)
+# Actualités
+_NEWS_COLS = (
+    ('source', 'Source', 100, tk.W, False),
+    ('title', 'Titre', 380, tk.W, False),
+    ('publishedAt', 'Date', 100, tk.W, False),
+    ('sentiment', 'Sentiment', 90, tk.W, False),
+)
+# Portefeuille simulé
+_PF_COLS = (
+    ('symbol', 'Symbole', 80, tk.W, False),
+    ('qty', 'Qté', 80, tk.E, True),
+    ('avg_price', 'Prix moy.', 80, tk.E, True),
+    ('last', 'Dernier', 80, tk.E, True),
+    ('pnl', 'PnL%', 60, tk.E, True),
+    ('value', 'Valeur', 80, tk.E, True),
+)
+_PF_COL_IDS = tuple(c[0] for c in _PF_COLS)
+# Journal d'idempotence (en-têtes fixes)
+_LEDGER_COLS = (
+    ('timestamp', 'Timestamp', 140, tk.W),
+    ('symbol', 'Symbole', 80, tk.W),
+    ('kind', 'Type', 60, tk.W),
+    ('index', 'Index', 80, tk.W),
+)
 
-    HAS_SYMBOL_ANALYZER = True
-except ImportError:
-    HAS_SYMBOL_ANALYZER = False
-    SymbolAnalyzer = None
+
+def _fast_tree_insert(tree: ttk.Treeview):
+    """Retourne `insert(text, values, tags) -> iid` appelant Tcl directement (ajout en fin).
+
+    Évite l'enveloppe Python de `Treeview.insert` dans les boucles de remplissage;
+    repli sur `tree.insert` si le widget n'expose pas `tk.call`/`_w`.
+    """
+    try:
+        call, path = tree.tk.call, tree._w
+    except AttributeError:
+        return lambda text, values, tags: tree.insert(
+            '', tk.END, text=text, values=values, tags=tags
+        )
+    return lambda text, values, tags: call(
+        path, 'insert', '', 'end', '-text', text, '-values', values, '-tags', tags
+    )
+
+
+@contextlib.contextmanager
+def _bulk_tree_update(tree: ttk.Treeview, n_rows: int, threshold: int = 50):
+    """Suspend la synchro de la barre de défilement pendant un remplissage.
+
+    `yscrollcommand` est désactivé pendant toute insertion non vide (tableaux courts des
+    movers, opportunités, journal, news compris), puis rétabli. Au-delà de `threshold` lignes,
+    les colonnes affichées sont aussi masquées (`displaycolumns=()`, pas de mesure par
+    insertion) et un seul `update_idletasks()` final fait une unique passe de mise en page.
+    """
+    if n_rows <= 0:
+        yield
+        return
+    big = n_rows > threshold
+    try:
+        yscroll = tree.cget('yscrollcommand')
+        tree.configure(yscrollcommand='')
+    except Exception:
+        yscroll = None
+    display = None
+    if big:
+        try:
+            display = tree.cget('displaycolumns')
+            tree.configure(displaycolumns=())
+        except Exception:
+            display = None
+    try:
+        yield
+    finally:
+        try:
+            if display is not None:
+                tree.configure(displaycolumns=display)
+            if yscroll:
+                tree.configure(yscrollcommand=yscroll)
+            if big:
+                tree.update_idletasks()
+        except Exception:
+            pass
 
 
 class WSApp(tk.Tk):
     def __init__(self):
         """Initialise la fenêtre principale et l'état de l'application."""
         super().__init__()
+        # Préférences UI: sauvegardes regroupées (au plus une écriture disque par seconde)
+        app_config.enable_write_behind(1.0)
         # Setup logging & env (idempotent)
         try:
             setup_logging()
@@ -105,15 +392,115 @@ class WSApp(tk.Tk):
         self.current_account_id: str | None = None
         self._positions_cache: list[dict] = []
         self._activities_cache: list[dict] = []
+        # Lignes d'activités formatées + clé de filtre en minuscules, reconstruites quand
+        # _activities_cache est remplacé (comparaison d'identité)
+        self._activities_index: list[tuple[str, tuple]] = []
+        self._activities_index_src: list[dict] | None = None
         self.base_currency = 'CAD'
+        # Formatteur monétaire pré-lié à la devise de base (chemins de formatage fréquents)
+        self._fmt_money_cur = functools.partial(
+            format_money, currency=self.base_currency, with_symbol=True
+        )
+        # Actualisation périodique: un seul worker, résultats appliqués sur le thread Tk
+        self._refresh_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix='wsapp-refresh'
+        )
+        self._refresh_future: Future | None = None
+        self._pending_refresh: dict | None = None
+        self._chat_autoscroll_pending = False
+        # Nombre de lignes de chaque message affiché (du plus ancien au plus récent)
+        self._chat_msg_lines: deque[int] = deque()
+        # Dernier texte affiché par _set_readonly_text, par widget
+        self._readonly_text: dict[tk.Text, str] = {}
+        # Pool partagé (threads réutilisés) pour les requêtes ponctuelles et les rafraîchissements
+        # réseau: comptes, détails, watchlist IA, stratégie, mouvements, actualités, notifications
+        self._io_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix='wsapp-io')
+        atexit.register(self._io_pool.shutdown, wait=False)
 
         # Theming / helpers
         self._theme = 'light'
         self._palettes = PALETTES
+        self._pal = PALETTES[self._theme]  # palette courante, mise à jour par apply_theme
+        # Onglets à construction différée: chemin du cadre -> constructeur (retiré une fois construit)
+        self._tab_builders: dict = {}
+        # Valeurs insérées par iid pour les grands Treeviews (tri sans relire les cellules Tk)
+        self._tree_values: dict[ttk.Treeview, dict[str, tuple]] = {}
+        self._system_theme: str | None = None  # thème OS mémorisé (voir _detect_system_theme)
 
         # Agents / controllers
         self.agent = AIAgent()
         self.agent_ui = None  # will be set in _build_ui
+        self._signal_values: dict[str, tuple] = {}  # shadow des valeurs de tree_signals
+        self._context_menus: dict[int, tuple] = {}  # id(tree) -> (menu, popup)
+        self._chart_pending_markers: list[dict] = []
+        self._symbol_col_idx_by_tree: dict[int, int | None] = {}
+        # Widgets optionnels de l'onglet Recherche (None tant que non construits)
+        self.tree_search2: ttk.Treeview | None = None
+        self.lst_search_suggestions2: tk.Listbox | None = None
+        self._signals_flush_pending = False
+        self._recent_signal_rows: dict[tuple, str] = {}
+        # Univers de suggestions de recherche (trié), invalidé quand les positions changent
+        self._symbol_universe_sorted: tuple[str, ...] = ()
+        self._symbol_universe_dirty = True
+        self._search_debounce_id: str | None = None
+        # Requête normalisée -> (horodatage monotone, résultats normalisés)
+        self._search_cache: dict[str, tuple[float, list[dict]]] = {}
+        self._search_inflight: set[str] = set()
+        self._last_suggestions: tuple[str, ...] = ()
+        self._positions_filter_index: list[tuple[str, str, dict]] | None = None
+        self._positions_top20: list[dict] | None = None
+        self._positions_columns_cache: tuple[list[float], list[float], list[float]] | None = None
+        # Items de tree_positions et tags P&L, alignés sur _positions_cache
+        self._positions_iids: list[str] = []
+        self._positions_pnl_tags: list[tuple[str, ...]] = []
+        # File de callbacks à exécuter sur le thread Tk (alimentée par les workers via _post)
+        self._ui_queue: queue.SimpleQueue = queue.SimpleQueue()
+        # Échecs des callbacks UI (compteur + dernière erreur) au lieu d'except muets par ligne;
+        # signalés dans le journal et la barre d'état, au plus une fois par intervalle
+        self._ui_errors = 0
+        self._ui_last_error: str | None = None
+        self._ui_errors_reported = 0
+        self._ui_error_shown_at = 0.0
+        # Surveillance AI: empreinte des positions et intervalle adaptatif
+        self._watchdog_hash: int | None = None
+        self._watchdog_interval_ms = _WATCHDOG_BASE_MS
+        # Un seul worker réseau à la fois par source (mouvements, actualités, aperçu marché,
+        # cotations du portefeuille simulé)
+        self._movers_inflight = threading.Lock()
+        self._news_inflight = threading.Lock()
+        self._overview_inflight = threading.Lock()
+        self._pf_inflight = threading.Lock()
+        # Rafraîchissements de comptes en cours ('accounts', 'details:<id>'), gérés sur le
+        # thread Tk: un second déclenchement (Auto, bouton, watchdog) est ignoré
+        self._refresh_inflight: set[str] = set()
+        # Portefeuille simulé: ligne par symbole et dernières valeurs affichées (mise à jour
+        # différentielle); lignes du journal affichées (rien à faire si inchangées)
+        self._pf_row_iids: dict[str, str] = {}
+        self._pf_row_state: dict[str, tuple] = {}
+        self._pf_pool: list[str] = []
+        self._ledger_rows: list[tuple] | None = None
+        self._pf_summary: tuple[str, str | None] | None = None
+        # Mises à jour différées tant que l'onglet concerné est masqué
+        self._movers_dirty = False
+        self._news_pending: tuple[list[dict], list[tuple]] | None = None
+        self._hidden_flush_pending = False
+        # Intervalles d'auto-rafraîchissement (s), validés à chaque changement de réglage
+        self._news_secs = 120
+        self._movers_secs = 120
+        self._search_secs = 180
+        # Écritures de configuration différées (regroupées en une sauvegarde)
+        self._pending_cfg: dict[str, object] = {}
+        self._flush_config_id: str | None = None
+        # Application différée des réglages de stratégie (flèches des Spinbox)
+        self._strategy_apply_id: str | None = None
+        # Derniers réglages de stratégie appliqués (appel sans changement ignoré)
+        self._strategy_applied: dict | None = None
+        # Créés par l'onglet Stratégies; None d'ici là pour que les callbacks testent l'attribut
+        self._trade_exec: TradeExecutor | None = None
+        self._strategy_runner: StrategyRunner | None = None
+        self.lbl_adv_status: ttk.Label | None = None
+        self.lbl_adv_info: ttk.Label | None = None
+        self.btn_advisor_analyze: ttk.Button | None = None
         self.chart = ChartController(self)
         self.chat_manager = ChatManager(self)
         # Modular managers
@@ -125,10 +512,9 @@ class WSApp(tk.Tk):
         # External APIs
         self.api_manager = APIManager() if HAS_EXTERNAL_APIS else None
 
-        # Symbol analyzer and media helpers
-        self.symbol_analyzer = (
-            SymbolAnalyzer(self) if 'SymbolAnalyzer' in globals() and HAS_SYMBOL_ANALYZER else None
-        )
+        # Symbol analyzer (créé au premier accès à `symbol_analyzer`) and media helpers
+        self._symbol_analyzer = None
+        self._symbol_analyzer_ok = HAS_SYMBOL_ANALYZER
         # Media manager: small logos for tables; allow larger ones for detail panes
         try:
             ttl = int(app_config.get('media.cache_ttl_sec', 3600) or 3600)
@@ -248,15 +634,20 @@ class WSApp(tk.Tk):
                 app_config.set('ui.onboarded', True)
         except Exception:
             pass
+        self.after(50, self._drain_ui_queue)
         self._try_auto_login()
-        self.after(3000, self._refresh_ai_signals_periodic)
-        # Always-on AI watchdog: periodically re-evaluate signals from positions
-        self.after(10000, self._ai_watchdog_tick)
-        # Periodic insights badge refresh
-        try:
-            self.after(8000, self._refresh_insights_badge)
-        except Exception:
-            pass
+        # Tâches périodiques (signaux IA, surveillance continue, badge insights, portefeuille
+        # simulé, watchlist IA): un seul timer Tk programmé à la prochaine échéance, qui
+        # exécute toutes les tâches dues
+        now = time.monotonic()
+        self._periodic_due = {
+            self._refresh_ai_signals_step: now + 3.0,
+            self._ai_watchdog_tick: now + 10.0,
+            self._refresh_insights_badge: now + 8.0,
+            self._portfolio_tick: now + 15.0,
+            self._ai_watchlist_tick: now + 3600.0,
+        }
+        self.after(3000, self._periodic_tick)
         # Démarrage Telegram conditionnel selon la configuration
         try:
             if app_config.get('integrations.telegram.enabled', False):
@@ -270,7 +661,7 @@ class WSApp(tk.Tk):
     def _bind_shortcuts(self) -> None:
         try:
             # Rafraîchir comptes/positions
-            self.bind_all('<F5>', lambda _e: self.refresh_selected_account_details())
+            self.bind_all('<F5>', lambda _e: self._manual_refresh())
             # Basculer thème
             self.bind_all('<Control-t>', lambda _e: self.toggle_theme())
             # Focus filtre rapide Positions
@@ -413,6 +804,7 @@ class WSApp(tk.Tk):
         )
         self._banner_close.pack(side=tk.RIGHT)
         self._banner_container.pack_forget()  # caché tant qu'aucun message
+        self._configure_banner_styles()
         # Panneau de détails repliable
         self._banner_details_frame = ttk.Frame(self)
         self._banner_details_text = tk.Text(self._banner_details_frame, height=6, wrap='word')
@@ -468,6 +860,9 @@ class WSApp(tk.Tk):
         # Conserver une référence pour persistance d'onglet
         self._main_notebook = notebook
         self._main_notebook.bind('<<NotebookTabChanged>>', self._on_tab_changed)
+        # Tous les notebooks (y compris imbriqués) + ré-affichage de la fenêtre
+        self.bind_all('<<NotebookTabChanged>>', self._schedule_hidden_flush, add='+')
+        self.bind('<Map>', self._schedule_hidden_flush, add='+')
 
         # -------- Group 1: Positions + Graphique + Activités --------
         grp1 = ttk.Frame(notebook)
@@ -539,25 +934,8 @@ class WSApp(tk.Tk):
         # Tree column (#0) will hold symbol text + logo image
         self.tree_positions.heading('#0', text='Symbole')
         self.tree_positions.column('#0', width=110, anchor=tk.W, stretch=False)
-        headers = {
-            'symbol': ('Symbole', 95, tk.W, False),
-            'name': ('Nom', 200, tk.W, False),
-            'qty': ('Qté', 60, tk.E, True),
-            'last': ('Prix', 70, tk.E, True),
-            'value': ('Valeur', 85, tk.E, True),
-            'cur': ('Devise', 55, tk.W, False),
-            'avg': ('PrixMoy', 70, tk.E, True),
-            'pnl': ('PnL%', 60, tk.E, True),
-            'pnl_abs': ('PnL$', 80, tk.E, True),
-        }
-        for col, (hdr, w, anc, num) in headers.items():
-            # Add sort indicator toggle and callback
-            self.tree_positions.heading(
-                col,
-                text=hdr,
-                command=lambda c=col, n=num: self._on_tree_heading_click(self.tree_positions, c, n),
-            )
-            self.tree_positions.column(col, width=w, anchor=anc, stretch=True)
+        # En-têtes triables (indicateur de tri géré par _on_tree_heading_click)
+        self._install_columns(self.tree_positions, _POSITION_COLS)
         # Hide duplicate text 'symbol' column (we show symbol+logo in tree column)
         try:
             self.tree_positions.column('symbol', width=0, minwidth=0, stretch=False)
@@ -587,18 +965,7 @@ class WSApp(tk.Tk):
         ).pack(side=tk.LEFT, padx=4)
         act_cols = ('date', 'desc', 'amt')
         self.tree_acts = ttk.Treeview(tab_act, columns=act_cols, show='headings')
-        headings = {
-            'date': ('Date', 155, tk.W, False),
-            'desc': ('Description', 480, tk.W, False),
-            'amt': ('Montant', 110, tk.E, True),
-        }
-        for col, (hdr, w, anc, num) in headings.items():
-            self.tree_acts.heading(
-                col,
-                text=hdr,
-                command=lambda c=col, n=num: self._on_tree_heading_click(self.tree_acts, c, n),
-            )
-            self.tree_acts.column(col, width=w, anchor=anc, stretch=True)
+        self._install_columns(self.tree_acts, _ACTIVITY_COLS)
         self.tree_acts.pack(fill=tk.BOTH, expand=True, padx=4, pady=4)
         self._add_tree_context(self.tree_acts)
         try:
@@ -719,8 +1086,8 @@ class WSApp(tk.Tk):
                 return
             ok = self.chart.export_png(path)
             if ok:
-                # Keep confirmation popup for export success as requested
-                messagebox.showinfo('Export', 'Image exportée')
+                # Confirmation non bloquante (bannière temporaire)
+                self._show_banner('Image exportée', kind='info', timeout_ms=3000)
             else:
                 self.set_status('Échec export PNG', error=True)
 
@@ -732,7 +1099,7 @@ class WSApp(tk.Tk):
                 return
             ok = self.chart.export_csv(path)
             if ok:
-                messagebox.showinfo('Export', 'CSV exporté')
+                self._show_banner('CSV exporté', kind='info', timeout_ms=3000)
             else:
                 self.set_status('Échec export CSV', error=True)
 
@@ -804,36 +1171,7 @@ class WSApp(tk.Tk):
                 '<<ListboxSelect>>', lambda _e: self._apply_search_suggestion()
             )
 
-            def _on_search_query_change(*_):
-                try:
-                    app_config.set(
-                        'ui.search.last_query', (self.var_search_query.get() or '').strip()
-                    )
-                    q = (self.var_search_query.get() or '').strip()
-                    if q:
-                        lst = app_config.get('ui.search.recent', []) or []
-                        if not isinstance(lst, list):
-                            lst = []
-                        if q in lst:
-                            lst.remove(q)
-                        lst.insert(0, q)
-                        app_config.set('ui.search.recent', lst[:10])
-                        try:
-                            # Update both combo values if present
-                            if hasattr(self, 'cb_search'):
-                                self.cb_search.configure(values=lst[:10])
-                            if hasattr(self, 'cb_search2'):
-                                self.cb_search2.configure(values=lst[:10])
-                        except Exception:
-                            pass
-                except Exception:
-                    pass
-                try:
-                    self._update_search_suggestions()
-                except Exception:
-                    pass
-
-            self.var_search_query.trace_add('write', _on_search_query_change)
+            self.var_search_query.trace_add('write', self._on_search_query_change)
             ttk.Button(sr_top, text='Chercher', command=self.search_securities).pack(side=tk.LEFT)
             # Results tree
             self.tree_search2 = ttk.Treeview(
@@ -844,22 +1182,7 @@ class WSApp(tk.Tk):
             )
             self.tree_search2.heading('#0', text='Symbole')
             self.tree_search2.column('#0', width=90, anchor=tk.W, stretch=False)
-            for col, (hdr, w, anc, num) in {
-                'symbol': ('Symbole', 90, tk.W, False),
-                'name': ('Nom', 200, tk.W, False),
-                'exchange': ('Échange', 80, tk.W, False),
-                'status': ('Statut', 70, tk.W, False),
-                'buyable': ('Achetable', 70, tk.W, False),
-                'market': ('Marché', 80, tk.W, False),
-            }.items():
-                self.tree_search2.heading(
-                    col,
-                    text=hdr,
-                    command=lambda c=col, n=num: self._on_tree_heading_click(
-                        self.tree_search2, c, n
-                    ),
-                )
-                self.tree_search2.column(col, width=w, anchor=anc, stretch=True)
+            self._install_columns(self.tree_search2, _SEARCH_RESULT_COLS)
             try:
                 self.tree_search2.column('symbol', width=0, minwidth=0, stretch=False)
             except Exception:
@@ -999,20 +1322,7 @@ class WSApp(tk.Tk):
                 show='headings',
                 height=8,
             )
-            for c, (h, w, a, n) in {
-                'symbol': ('Symb', 80, tk.W, False),
-                'chg': ('%Chg', 60, tk.E, True),
-                'price': ('Prix', 70, tk.E, True),
-                'vol': ('Vol', 80, tk.E, True),
-            }.items():
-                self.tree_gainers_compact.heading(
-                    c,
-                    text=h,
-                    command=lambda col=c, nn=n: self._on_tree_heading_click(
-                        self.tree_gainers_compact, col, nn
-                    ),
-                )
-                self.tree_gainers_compact.column(c, width=w, anchor=a, stretch=True)
+            self._install_columns(self.tree_gainers_compact, _MOVER_COMPACT_COLS)
             self.tree_gainers_compact.pack(fill=tk.BOTH, expand=True)
             frm_l = ttk.Labelframe(mv_lists, text='Perdants')
             frm_l.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(2, 0))
@@ -1022,20 +1332,7 @@ class WSApp(tk.Tk):
                 show='headings',
                 height=8,
             )
-            for c, (h, w, a, n) in {
-                'symbol': ('Symb', 80, tk.W, False),
-                'chg': ('%Chg', 60, tk.E, True),
-                'price': ('Prix', 70, tk.E, True),
-                'vol': ('Vol', 80, tk.E, True),
-            }.items():
-                self.tree_losers_compact.heading(
-                    c,
-                    text=h,
-                    command=lambda col=c, nn=n: self._on_tree_heading_click(
-                        self.tree_losers_compact, col, nn
-                    ),
-                )
-                self.tree_losers_compact.column(c, width=w, anchor=a, stretch=True)
+            self._install_columns(self.tree_losers_compact, _MOVER_COMPACT_COLS)
             self.tree_losers_compact.pack(fill=tk.BOTH, expand=True)
 
             # Compact Screener (bottom-right)
@@ -1059,19 +1356,22 @@ class WSApp(tk.Tk):
             self._bind_persist_notebook(grp3_nb, 'analyse')
         except Exception:
             pass
+        # Panneaux autonomes: onglet réservé maintenant, contenu construit au premier affichage
         # --- Onglet Diagnostics ---
         self.diagnostics = DiagnosticsPanel(self)
-        self.diagnostics.build(grp3_nb)
+        self._add_lazy_tab(
+            grp3_nb, 'Diagnostics', functools.partial(self.diagnostics.build, grp3_nb)
+        )
         # --- Onglet Screener ---
         try:
             self.screener = ScreenerPanel(self)
-            self.screener.build(grp2_nb)
+            self._add_lazy_tab(grp2_nb, 'Screener', functools.partial(self.screener.build, grp2_nb))
         except Exception:
             pass
         # --- Onglet Backtest ---
         try:
             self.backtest = BacktestPanel(self)
-            self.backtest.build(grp3_nb)
+            self._add_lazy_tab(grp3_nb, 'Backtest', functools.partial(self.backtest.build, grp3_nb))
         except Exception:
             pass
         # --- Onglet Stratégies (Runner) ---
@@ -1120,6 +1420,7 @@ class WSApp(tk.Tk):
         self.tree_signals.pack(fill=tk.BOTH, expand=True)
         self._add_tree_context(self.tree_signals)
         self.agent_ui = AgentUI(self.agent, self.tree_signals)
+        self._signal_values = self.agent_ui.row_values
         self.tree_signals.bind('<Double-1>', self._on_signal_double_click)
         # Ensure non-empty state initially
         try:
@@ -1172,12 +1473,12 @@ class WSApp(tk.Tk):
         ttk.Button(
             chat_bar,
             text='📈 Movers',
-            command=lambda: self._append_chat(self.agent.chat('movers') + "\n"),
+            command=lambda: self._chat_ask('movers'),
         ).pack(side=tk.LEFT, padx=2)
         ttk.Button(
             chat_bar,
             text='💡 Insights',
-            command=lambda: self._append_chat(self.agent.chat('insights') + "\n"),
+            command=lambda: self._chat_ask('insights'),
         ).pack(side=tk.LEFT, padx=2)
         # Astuce d'utilisation
         ttk.Label(
@@ -1228,28 +1529,8 @@ class WSApp(tk.Tk):
             '<<ListboxSelect>>', lambda _e: self._apply_search_suggestion()
         )
 
-        # Mise à jour suggestions + persistance de la requête
-        def _on_search_query_change(*_):  # noqa
-            try:
-                app_config.set('ui.search.last_query', (self.var_search_query.get() or '').strip())
-                q = (self.var_search_query.get() or '').strip()
-                if q:
-                    lst = app_config.get('ui.search.recent', []) or []
-                    if not isinstance(lst, list):
-                        lst = []
-                    if q in lst:
-                        lst.remove(q)
-                    lst.insert(0, q)
-                    app_config.set('ui.search.recent', lst[:10])
-                    try:
-                        self.cb_search.configure(values=lst[:10])
-                    except Exception:
-                        pass
-            except Exception:
-                pass
-            self._update_search_suggestions()
-
-        self.var_search_query.trace_add('write', _on_search_query_change)
+        # Mise à jour suggestions + persistance de la requête (différées après la frappe)
+        self.var_search_query.trace_add('write', self._on_search_query_change)
         ttk.Button(sr_top, text='Chercher', command=self.search_securities).pack(side=tk.LEFT)
         # Auto-refresh controls (Search)
         chk_sa = ttk.Checkbutton(
@@ -1281,21 +1562,7 @@ class WSApp(tk.Tk):
         # Tree column for symbol+logo
         self.tree_search.heading('#0', text='Symbole')
         self.tree_search.column('#0', width=100, anchor=tk.W, stretch=False)
-        headers_search = {
-            'symbol': ('Symbole', 90, tk.W, False),
-            'name': ('Nom', 220, tk.W, False),
-            'exchange': ('Échange', 80, tk.W, False),
-            'status': ('Statut', 70, tk.W, False),
-            'buyable': ('Achetable', 70, tk.W, False),
-            'market': ('Marché', 80, tk.W, False),
-        }
-        for col, (hdr, w, anc, num) in headers_search.items():
-            self.tree_search.heading(
-                col,
-                text=hdr,
-                command=lambda c=col, n=num: self._on_tree_heading_click(self.tree_search, c, n),
-            )
-            self.tree_search.column(col, width=w, anchor=anc, stretch=True)
+        self._install_columns(self.tree_search, _SEARCH_COLS)
         # Hide duplicate 'symbol' column
         try:
             self.tree_search.column('symbol', width=0, minwidth=0, stretch=False)
@@ -1395,19 +1662,7 @@ class WSApp(tk.Tk):
         )
         self.tree_gainers.heading('#0', text='Symb')
         self.tree_gainers.column('#0', width=90, anchor=tk.W, stretch=False)
-        for c, (h, w, a, num) in {
-            'symbol': ('Symbole', 80, tk.W, False),
-            'pnlpct': ('PnL%', 65, tk.E, True),
-            'pnlabs': ('PnL$', 80, tk.E, True),
-            'value': ('Valeur', 90, tk.E, True),
-            'qty': ('Qté', 60, tk.E, True),
-        }.items():
-            self.tree_gainers.heading(
-                c,
-                text=h,
-                command=lambda col=c, n=num: self._on_tree_heading_click(self.tree_gainers, col, n),
-            )
-            self.tree_gainers.column(c, width=w, anchor=a, stretch=True)
+        self._install_columns(self.tree_gainers, _MOVER_PNL_COLS)
         try:
             self.tree_gainers.column('symbol', width=0, minwidth=0, stretch=False)
         except Exception:
@@ -1436,19 +1691,7 @@ class WSApp(tk.Tk):
         )
         self.tree_losers.heading('#0', text='Symb')
         self.tree_losers.column('#0', width=90, anchor=tk.W, stretch=False)
-        for c, (h, w, a, num) in {
-            'symbol': ('Symbole', 80, tk.W, False),
-            'pnlpct': ('PnL%', 65, tk.E, True),
-            'pnlabs': ('PnL$', 80, tk.E, True),
-            'value': ('Valeur', 90, tk.E, True),
-            'qty': ('Qté', 60, tk.E, True),
-        }.items():
-            self.tree_losers.heading(
-                c,
-                text=h,
-                command=lambda col=c, n=num: self._on_tree_heading_click(self.tree_losers, col, n),
-            )
-            self.tree_losers.column(c, width=w, anchor=a, stretch=True)
+        self._install_columns(self.tree_losers, _MOVER_PNL_COLS)
         try:
             self.tree_losers.column('symbol', width=0, minwidth=0, stretch=False)
         except Exception:
@@ -1479,19 +1722,7 @@ class WSApp(tk.Tk):
         )
         self.tree_active.heading('#0', text='Symb')
         self.tree_active.column('#0', width=90, anchor=tk.W, stretch=False)
-        for c, (h, w, a, num) in {
-            'symbol': ('Symbole', 80, tk.W, False),
-            'value': ('Valeur', 90, tk.E, True),
-            'pnlpct': ('PnL%', 65, tk.E, True),
-            'pnlabs': ('PnL$', 80, tk.E, True),
-            'qty': ('Qté', 60, tk.E, True),
-        }.items():
-            self.tree_active.heading(
-                c,
-                text=h,
-                command=lambda col=c, n=num: self._on_tree_heading_click(self.tree_active, col, n),
-            )
-            self.tree_active.column(c, width=w, anchor=a, stretch=True)
+        self._install_columns(self.tree_active, _ACTIVE_COLS)
         try:
             self.tree_active.column('symbol', width=0, minwidth=0, stretch=False)
         except Exception:
@@ -1520,19 +1751,7 @@ class WSApp(tk.Tk):
         )
         self.tree_opps.heading('#0', text='Symb')
         self.tree_opps.column('#0', width=90, anchor=tk.W, stretch=False)
-        for c, (h, w, a, num) in {
-            'symbol': ('Symbole', 80, tk.W, False),
-            'pnlpct': ('PnL%', 65, tk.E, True),
-            'pnlabs': ('PnL$', 80, tk.E, True),
-            'value': ('Valeur', 90, tk.E, True),
-            'qty': ('Qté', 60, tk.E, True),
-        }.items():
-            self.tree_opps.heading(
-                c,
-                text=h,
-                command=lambda col=c, n=num: self._on_tree_heading_click(self.tree_opps, col, n),
-            )
-            self.tree_opps.column(c, width=w, anchor=a, stretch=True)
+        self._install_columns(self.tree_opps, _MOVER_PNL_COLS)
         try:
             self.tree_opps.column('symbol', width=0, minwidth=0, stretch=False)
         except Exception:
@@ -1543,6 +1762,13 @@ class WSApp(tk.Tk):
             self._restore_tree_layout(self.tree_opps, 'opps')
         except Exception:
             pass
+        # Constructeur de colonnes par arbre (fallback portefeuille de update_movers)
+        self._tree_cols_fn = {
+            self.tree_gainers: _mover_cols_pnl,
+            self.tree_losers: _mover_cols_pnl,
+            self.tree_active: _mover_cols_active,
+            self.tree_opps: _mover_cols_pnl,
+        }
         try:
             if not self.tree_opps.get_children():
                 self.tree_opps.insert(
@@ -1565,8 +1791,11 @@ class WSApp(tk.Tk):
         )
 
         def _persist_news(*_):
+            # Écriture différée: une sauvegarde par rafale de frappe
             try:
-                app_config.set('ui.news.last_query', (self.var_news_query.get() or '').strip())
+                self._defer_config_set(
+                    'ui.news.last_query', (self.var_news_query.get() or '').strip(), 300
+                )
             except Exception:
                 pass
 
@@ -1600,20 +1829,7 @@ class WSApp(tk.Tk):
             show='headings',
             height=12,
         )
-        for c, (h, w, a) in {
-            'source': ('Source', 100, tk.W),
-            'title': ('Titre', 380, tk.W),
-            'publishedAt': ('Date', 100, tk.W),
-            'sentiment': ('Sentiment', 90, tk.W),
-        }.items():
-            self.tree_news.heading(
-                c,
-                text=h,
-                command=lambda col=c: self._on_tree_heading_click(
-                    self.tree_news, col, numeric=False
-                ),
-            )
-            self.tree_news.column(c, width=w, anchor=a, stretch=True)
+        self._install_columns(self.tree_news, _NEWS_COLS)
         self.tree_news.pack(fill=tk.BOTH, expand=True, padx=4, pady=4)
         self.tree_news.bind('<Double-1>', self.on_news_double_click)
         self._add_tree_context(self.tree_news)
@@ -1622,6 +1838,16 @@ class WSApp(tk.Tk):
         except Exception:
             pass
 
+        # Intervalles saisis au clavier: revalidés à l'écriture (les ticks lisent l'attribut)
+        for name, default in (('news', 120), ('movers', 120), ('search', 180)):
+            var = getattr(self, f'var_{name}_seconds')
+            var.trace_add(
+                'write',
+                lambda *_a, _n=name, _v=var, _d=default: setattr(
+                    self, f'_{_n}_secs', self._parse_secs(_v, _d)
+                ),
+            )
+
         # Schedule panel auto-refresh if enabled
         try:
             self._schedule_news_auto()
@@ -1676,7 +1902,7 @@ class WSApp(tk.Tk):
             try:
                 choice = self._var_theme_choice.get()
                 if choice == 'system':
-                    choice = self._detect_system_theme()
+                    choice = self._detect_system_theme(refresh=True)
                 self.apply_theme(choice)
             except Exception:
                 pass
@@ -1855,46 +2081,31 @@ class WSApp(tk.Tk):
         notebook.add(tab, text='Stratégies')
         top = ttk.Frame(tab)
         top.pack(fill=tk.X, padx=6, pady=6)
+        # Préférences lues en une fois par section
+        _sr = app_config.snapshot('strategy_runner')
+        _at = app_config.snapshot('autotrade')
         # Controls
-        self.var_sr_enabled = tk.BooleanVar(
-            value=bool(app_config.get('strategy_runner.enabled', False))
-        )
-        self.var_sr_interval = tk.IntVar(
-            value=int(app_config.get('strategy_runner.interval_sec', 300) or 300)
-        )
-        self.var_sr_strategy = tk.StringVar(
-            value=str(app_config.get('strategy_runner.strategy', 'auto') or 'auto')
-        )
-        self.var_sr_fast = tk.IntVar(value=int(app_config.get('strategy_runner.fast', 10) or 10))
-        self.var_sr_slow = tk.IntVar(value=int(app_config.get('strategy_runner.slow', 30) or 30))
-        self.var_sr_rsi_low = tk.IntVar(
-            value=int(app_config.get('strategy_runner.rsi_low', 30) or 30)
-        )
-        self.var_sr_rsi_high = tk.IntVar(
-            value=int(app_config.get('strategy_runner.rsi_high', 70) or 70)
-        )
+        self.var_sr_enabled = tk.BooleanVar(value=bool(_sr.get('enabled', False)))
+        self.var_sr_interval = tk.IntVar(value=int(_sr.get('interval_sec', 300) or 300))
+        self.var_sr_strategy = tk.StringVar(value=str(_sr.get('strategy', 'auto') or 'auto'))
+        self.var_sr_fast = tk.IntVar(value=int(_sr.get('fast', 10) or 10))
+        self.var_sr_slow = tk.IntVar(value=int(_sr.get('slow', 30) or 30))
+        self.var_sr_rsi_low = tk.IntVar(value=int(_sr.get('rsi_low', 30) or 30))
+        self.var_sr_rsi_high = tk.IntVar(value=int(_sr.get('rsi_high', 70) or 70))
         # Confluence/RSI period + thresholds
-        self.var_sr_rsi_period = tk.IntVar(
-            value=int(app_config.get('strategy_runner.rsi_period', 14) or 14)
-        )
-        self.var_sr_rsi_buy = tk.IntVar(
-            value=int(app_config.get('strategy_runner.rsi_buy', 55) or 55)
-        )
-        self.var_sr_rsi_sell = tk.IntVar(
-            value=int(app_config.get('strategy_runner.rsi_sell', 45) or 45)
-        )
+        self.var_sr_rsi_period = tk.IntVar(value=int(_sr.get('rsi_period', 14) or 14))
+        self.var_sr_rsi_buy = tk.IntVar(value=int(_sr.get('rsi_buy', 55) or 55))
+        self.var_sr_rsi_sell = tk.IntVar(value=int(_sr.get('rsi_sell', 45) or 45))
         # Volatility filter (Bollinger bandwidth)
         try:
-            _mbw = float(app_config.get('strategy_runner.min_bandwidth', 0.0) or 0.0)
+            _mbw = float(_sr.get('min_bandwidth', 0.0) or 0.0)
         except Exception:
             _mbw = 0.0
         self.var_sr_min_bw = tk.DoubleVar(value=_mbw)
-        self.var_sr_bb_window = tk.IntVar(
-            value=int(app_config.get('strategy_runner.bb_window', 20) or 20)
-        )
+        self.var_sr_bb_window = tk.IntVar(value=int(_sr.get('bb_window', 20) or 20))
         # Auto-window (bars) for auto strategy chooser
         try:
-            _aw = int(app_config.get('strategy_runner.auto_window', 160) or 160)
+            _aw = int(_sr.get('auto_window', 160) or 160)
         except Exception:
             _aw = 160
         self.var_sr_auto_window = tk.IntVar(value=_aw)
@@ -1909,7 +2120,7 @@ class WSApp(tk.Tk):
             to=3600,
             width=6,
             textvariable=self.var_sr_interval,
-            command=self._strategy_apply,
+            command=self._schedule_strategy_apply,
         ).pack(side=tk.LEFT)
         ttk.Label(top, text='Stratégie:').pack(side=tk.LEFT, padx=(8, 2))
         cb = ttk.Combobox(
@@ -1946,7 +2157,7 @@ class WSApp(tk.Tk):
             to=60,
             width=4,
             textvariable=self.var_sr_fast,
-            command=self._strategy_apply,
+            command=self._schedule_strategy_apply,
         )
         sp_fast.pack(side=tk.LEFT)
         ttk.Label(prm, text='Slow:').pack(side=tk.LEFT, padx=(6, 0))
@@ -1956,7 +2167,7 @@ class WSApp(tk.Tk):
             to=200,
             width=4,
             textvariable=self.var_sr_slow,
-            command=self._strategy_apply,
+            command=self._schedule_strategy_apply,
         )
         sp_slow.pack(side=tk.LEFT)
         # RSI params
@@ -1967,7 +2178,7 @@ class WSApp(tk.Tk):
             to=45,
             width=4,
             textvariable=self.var_sr_rsi_low,
-            command=self._strategy_apply,
+            command=self._schedule_strategy_apply,
         )
         sp_rsi_low.pack(side=tk.LEFT)
         ttk.Label(prm, text='RSI High:').pack(side=tk.LEFT, padx=(6, 2))
@@ -1977,7 +2188,7 @@ class WSApp(tk.Tk):
             to=95,
             width=4,
             textvariable=self.var_sr_rsi_high,
-            command=self._strategy_apply,
+            command=self._schedule_strategy_apply,
         )
         sp_rsi_high.pack(side=tk.LEFT)
         # Confluence-specific RSI/period
@@ -1988,7 +2199,7 @@ class WSApp(tk.Tk):
             to=50,
             width=4,
             textvariable=self.var_sr_rsi_period,
-            command=self._strategy_apply,
+            command=self._schedule_strategy_apply,
         )
         sp_rsi_period.pack(side=tk.LEFT)
         ttk.Label(prm, text='RSI Buy≥').pack(side=tk.LEFT, padx=(6, 2))
@@ -1998,7 +2209,7 @@ class WSApp(tk.Tk):
             to=90,
             width=4,
             textvariable=self.var_sr_rsi_buy,
-            command=self._strategy_apply,
+            command=self._schedule_strategy_apply,
         )
         sp_rsi_buy.pack(side=tk.LEFT)
         ttk.Label(prm, text='RSI Sell≤').pack(side=tk.LEFT, padx=(6, 2))
@@ -2008,7 +2219,7 @@ class WSApp(tk.Tk):
             to=50,
             width=4,
             textvariable=self.var_sr_rsi_sell,
-            command=self._strategy_apply,
+            command=self._schedule_strategy_apply,
         )
         sp_rsi_sell.pack(side=tk.LEFT)
         # Keep references for dynamic state toggle in auto mode
@@ -2034,7 +2245,7 @@ class WSApp(tk.Tk):
             increment=0.01,
             width=6,
             textvariable=self.var_sr_min_bw,
-            command=self._strategy_apply,
+            command=self._schedule_strategy_apply,
         )
         sp_bw.pack(side=tk.LEFT)
         ttk.Label(prm2, text='BBand Window:').pack(side=tk.LEFT, padx=(6, 2))
@@ -2044,7 +2255,7 @@ class WSApp(tk.Tk):
             to=60,
             width=5,
             textvariable=self.var_sr_bb_window,
-            command=self._strategy_apply,
+            command=self._schedule_strategy_apply,
         )
         sp_bb.pack(side=tk.LEFT)
         # Auto window control (only meaningful for 'auto' strategy)
@@ -2055,7 +2266,7 @@ class WSApp(tk.Tk):
             to=1000,
             width=6,
             textvariable=self.var_sr_auto_window,
-            command=self._strategy_apply,
+            command=self._schedule_strategy_apply,
         )
         self.sp_auto_window.pack(side=tk.LEFT)
         try:
@@ -2083,22 +2294,16 @@ class WSApp(tk.Tk):
         at_row1 = ttk.Frame(at_frame)
         at_row1.pack(fill=tk.X, padx=4, pady=2)
         # Auto-trade variables
-        self.var_at_enabled = tk.BooleanVar(value=bool(app_config.get('autotrade.enabled', False)))
-        self.var_at_mode = tk.StringVar(
-            value=str(app_config.get('autotrade.mode', 'paper') or 'paper')
-        )
-        self.var_at_size = tk.DoubleVar(
-            value=float(app_config.get('autotrade.base_size', 1000.0) or 1000.0)
-        )
-        self.var_at_maxtr = tk.IntVar(
-            value=int(app_config.get('autotrade.max_trades_per_day', 10) or 10)
-        )
+        self.var_at_enabled = tk.BooleanVar(value=bool(_at.get('enabled', False)))
+        self.var_at_mode = tk.StringVar(value=str(_at.get('mode', 'paper') or 'paper'))
+        self.var_at_size = tk.DoubleVar(value=float(_at.get('base_size', 1000.0) or 1000.0))
+        self.var_at_maxtr = tk.IntVar(value=int(_at.get('max_trades_per_day', 10) or 10))
         # Guardrails variables
         self.var_at_max_notional = tk.DoubleVar(
-            value=float(app_config.get('autotrade.max_position_notional_per_symbol', 0.0) or 0.0)
+            value=float(_at.get('max_position_notional_per_symbol', 0.0) or 0.0)
         )
         self.var_at_max_qty = tk.DoubleVar(
-            value=float(app_config.get('autotrade.max_position_qty_per_symbol', 0.0) or 0.0)
+            value=float(_at.get('max_position_qty_per_symbol', 0.0) or 0.0)
         )
         ttk.Checkbutton(
             at_row1, text='Activer', variable=self.var_at_enabled, command=self._strategy_apply
@@ -2121,7 +2326,7 @@ class WSApp(tk.Tk):
             increment=100,
             width=8,
             textvariable=self.var_at_size,
-            command=self._strategy_apply,
+            command=self._schedule_strategy_apply,
         ).pack(side=tk.LEFT)
         ttk.Label(at_row1, text='Max trades/jour:').pack(side=tk.LEFT, padx=(8, 2))
         ttk.Spinbox(
@@ -2130,7 +2335,7 @@ class WSApp(tk.Tk):
             to=100,
             width=5,
             textvariable=self.var_at_maxtr,
-            command=self._strategy_apply,
+            command=self._schedule_strategy_apply,
         ).pack(side=tk.LEFT)
         # Row 2: Guardrails
         at_row2 = ttk.Frame(at_frame)
@@ -2143,7 +2348,7 @@ class WSApp(tk.Tk):
             increment=1000,
             width=8,
             textvariable=self.var_at_max_notional,
-            command=self._strategy_apply,
+            command=self._schedule_strategy_apply,
         ).pack(side=tk.LEFT)
         ttk.Label(at_row2, text='(0=illimité)').pack(side=tk.LEFT, padx=(2, 8))
         ttk.Label(at_row2, text='Max qté/symbole:').pack(side=tk.LEFT)
@@ -2154,7 +2359,7 @@ class WSApp(tk.Tk):
             increment=10,
             width=8,
             textvariable=self.var_at_max_qty,
-            command=self._strategy_apply,
+            command=self._schedule_strategy_apply,
         ).pack(side=tk.LEFT)
         ttk.Label(at_row2, text='(0=illimité)').pack(side=tk.LEFT, padx=(2, 0))
 
@@ -2173,23 +2378,17 @@ class WSApp(tk.Tk):
         )
         self.tree_pf.heading('#0', text='Symb')
         self.tree_pf.column('#0', width=90, anchor=tk.W, stretch=False)
-        for col, (header, width, anchor) in {
-            'symbol': ('Symbole', 80, tk.W),
-            'qty': ('Qté', 80, tk.E),
-            'avg_price': ('Prix moy.', 80, tk.E),
-            'last': ('Dernier', 80, tk.E),
-            'pnl': ('PnL%', 60, tk.E),
-            'value': ('Valeur', 80, tk.E),
-        }.items():
-            self.tree_pf.heading(col, text=header)
-            self.tree_pf.column(col, width=width, anchor=anchor, stretch=True)
+        self._install_columns(self.tree_pf, _PF_COLS)
         try:
             self.tree_pf.column('symbol', width=0, minwidth=0, stretch=False)
         except Exception:
             pass
         pf_scroll = ttk.Scrollbar(pf_tree_frame, orient='vertical', command=self.tree_pf.yview)
         self.tree_pf.configure(yscrollcommand=pf_scroll.set)
+        self.tree_pf.tag_configure(_TAG_PF_POS[0], foreground=_PF_POS_FG)
+        self.tree_pf.tag_configure(_TAG_PF_NEG[0], foreground=_PF_NEG_FG)
         self.tree_pf.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self._grow_pf_pool(_PF_POOL_SIZE)
         pf_scroll.pack(side=tk.RIGHT, fill=tk.Y)
 
         # Ledger table
@@ -2210,12 +2409,7 @@ class WSApp(tk.Tk):
         )
         self.tree_ledger.heading('#0', text='Symb')
         self.tree_ledger.column('#0', width=90, anchor=tk.W, stretch=False)
-        for col, (header, width, anchor) in {
-            'timestamp': ('Timestamp', 140, tk.W),
-            'symbol': ('Symbole', 80, tk.W),
-            'kind': ('Type', 60, tk.W),
-            'index': ('Index', 80, tk.W),
-        }.items():
+        for col, header, width, anchor in _LEDGER_COLS:
             self.tree_ledger.heading(col, text=header)
             self.tree_ledger.column(col, width=width, anchor=anchor, stretch=True)
         try:
@@ -2250,7 +2444,7 @@ class WSApp(tk.Tk):
         self.lst_at_activity = tk.Listbox(right_rs, height=5)
         self.lst_at_activity.pack(fill=tk.BOTH, expand=True, padx=4, pady=4)
         try:
-            self.after(8000, self._recent_signals_tick)
+            self.after(60000, self._recent_signals_tick)
         except Exception:
             pass
 
@@ -2299,10 +2493,7 @@ class WSApp(tk.Tk):
                     out = 'Agent indisponible.'
                 else:
                     out = self.agent.insights() or ''
-                self.txt_advisor.configure(state=tk.NORMAL)
-                self.txt_advisor.delete('1.0', tk.END)
-                self.txt_advisor.insert('1.0', out.strip())
-                self.txt_advisor.configure(state=tk.DISABLED)
+                self._set_readonly_text(self.txt_advisor, out.strip())
             except Exception as e:
                 try:
                     self.set_status(f"Conseiller: {e}", error=True)
@@ -2355,6 +2546,8 @@ class WSApp(tk.Tk):
             trade_executor=self._trade_exec,
             on_signal=self._on_strategy_signal,
         )
+        self._strategy_runner.on_change = self._schedule_signals_flush
+        self._trade_exec.on_change = self._schedule_signals_flush
         self._strategy_apply()
         # Initial state sync for params visibility/enabling
         try:
@@ -2365,46 +2558,53 @@ class WSApp(tk.Tk):
             self._strategy_runner.start()
         except Exception:
             pass
-        try:
-            self.after(15000, self._portfolio_tick)
-        except Exception:
-            pass
-        try:
-            self.after(60 * 60 * 1000, self._ai_watchlist_tick)
-        except Exception:
-            pass
+
+    def _schedule_strategy_apply(self) -> None:
+        """Applique les réglages 250 ms après le dernier clic de flèche d'un Spinbox."""
+        self._cancel_timer('_strategy_apply_id')
+        self._strategy_apply_id = self.after(250, self._run_scheduled_strategy_apply)
+
+    def _run_scheduled_strategy_apply(self) -> None:
+        self._strategy_apply_id = None
+        self._strategy_apply()
 
     def _strategy_apply(self):
         # persist
-        try:
-            app_config.set('strategy_runner.enabled', bool(self.var_sr_enabled.get()))
-            app_config.set('strategy_runner.interval_sec', int(self.var_sr_interval.get()))
-            app_config.set('strategy_runner.strategy', str(self.var_sr_strategy.get()))
-            app_config.set('strategy_runner.fast', int(self.var_sr_fast.get()))
-            app_config.set('strategy_runner.slow', int(self.var_sr_slow.get()))
-            app_config.set('strategy_runner.rsi_low', int(self.var_sr_rsi_low.get()))
-            app_config.set('strategy_runner.rsi_high', int(self.var_sr_rsi_high.get()))
-            app_config.set('strategy_runner.rsi_period', int(self.var_sr_rsi_period.get()))
-            app_config.set('strategy_runner.rsi_buy', int(self.var_sr_rsi_buy.get()))
-            app_config.set('strategy_runner.rsi_sell', int(self.var_sr_rsi_sell.get()))
-            app_config.set('strategy_runner.min_bandwidth', float(self.var_sr_min_bw.get()))
-            app_config.set('strategy_runner.bb_window', int(self.var_sr_bb_window.get()))
-            app_config.set('strategy_runner.auto_window', int(self.var_sr_auto_window.get()))
-            # autotrade
-            app_config.set('autotrade.enabled', bool(self.var_at_enabled.get()))
-            app_config.set('autotrade.mode', str(self.var_at_mode.get()))
-            app_config.set('autotrade.base_size', float(self.var_at_size.get()))
-            app_config.set('autotrade.max_trades_per_day', int(self.var_at_maxtr.get()))
-            app_config.set(
-                'autotrade.max_position_notional_per_symbol', float(self.var_at_max_notional.get())
-            )
-            app_config.set(
-                'autotrade.max_position_qty_per_symbol', float(self.var_at_max_qty.get())
-            )
+        prefs = None
+        try:
+            # Une seule sauvegarde pour l'ensemble des réglages
+            prefs = {
+                'strategy_runner.enabled': bool(self.var_sr_enabled.get()),
+                'strategy_runner.interval_sec': int(self.var_sr_interval.get()),
+                'strategy_runner.strategy': str(self.var_sr_strategy.get()),
+                'strategy_runner.fast': int(self.var_sr_fast.get()),
+                'strategy_runner.slow': int(self.var_sr_slow.get()),
+                'strategy_runner.rsi_low': int(self.var_sr_rsi_low.get()),
+                'strategy_runner.rsi_high': int(self.var_sr_rsi_high.get()),
+                'strategy_runner.rsi_period': int(self.var_sr_rsi_period.get()),
+                'strategy_runner.rsi_buy': int(self.var_sr_rsi_buy.get()),
+                'strategy_runner.rsi_sell': int(self.var_sr_rsi_sell.get()),
+                'strategy_runner.min_bandwidth': float(self.var_sr_min_bw.get()),
+                'strategy_runner.bb_window': int(self.var_sr_bb_window.get()),
+                'strategy_runner.auto_window': int(self.var_sr_auto_window.get()),
+                # autotrade
+                'autotrade.enabled': bool(self.var_at_enabled.get()),
+                'autotrade.mode': str(self.var_at_mode.get()),
+                'autotrade.base_size': float(self.var_at_size.get()),
+                'autotrade.max_trades_per_day': int(self.var_at_maxtr.get()),
+                'autotrade.max_position_notional_per_symbol': float(self.var_at_max_notional.get()),
+                'autotrade.max_position_qty_per_symbol': float(self.var_at_max_qty.get()),
+            }
+            # Réglages identiques à la dernière application: ni sauvegarde ni reconfiguration
+            if prefs == self._strategy_applied:
+                return
+            for key, value in prefs.items():
+                app_config.set(key, value, save=False)
+            app_config.save_config()
         except Exception:
             pass
         # update runner
-        if hasattr(self, '_strategy_runner') and self._strategy_runner:
+        if self._strategy_runner:
             params = {
                 'fast': int(self.var_sr_fast.get()),
                 'slow': int(self.var_sr_slow.get()),
@@ -2426,7 +2626,7 @@ class WSApp(tk.Tk):
                     params=params,
                 )
                 # update trade executor
-                if hasattr(self, '_trade_exec') and self._trade_exec:
+                if self._trade_exec:
                     self._trade_exec.configure(
                         enabled=bool(self.var_at_enabled.get()),
                         mode=str(self.var_at_mode.get()),
@@ -2443,6 +2643,7 @@ class WSApp(tk.Tk):
                             else None
                         ),
                     )
+                self._strategy_applied = prefs
             except Exception:
                 pass
 
@@ -2469,7 +2670,7 @@ class WSApp(tk.Tk):
             pass
 
     def _strategy_run_once(self):
-        if not hasattr(self, '_strategy_runner') or not self._strategy_runner:
+        if not self._strategy_runner:
             return
 
         def worker():
@@ -2479,17 +2680,13 @@ class WSApp(tk.Tk):
             except Exception as e:
                 self.after(0, lambda e=e: self.set_status(f"Stratégies: {e}", error=True))
 
-        threading.Thread(target=worker, daemon=True).start()
+        self._io_pool.submit(worker)
 
     def _strategy_set_text(self, text: str):
         try:
-            self.txt_strategy.configure(state=tk.NORMAL)
-            self.txt_strategy.delete('1.0', tk.END)
-            self.txt_strategy.insert('end', (text or '').strip() + '\n')
-            self.txt_strategy.configure(state=tk.DISABLED)
+            self._set_readonly_text(self.txt_strategy, (text or '').strip() + '\n')
             # Refresh portfolio view after report updates
-            if hasattr(self, '_update_portfolio_view'):
-                self._update_portfolio_view()
+            self._update_portfolio_view()
         except Exception:
             pass
 
@@ -2507,14 +2704,14 @@ class WSApp(tk.Tk):
             # Refresh Advisor badge and controls live
             self._adv_enabled = bool(val or (os.getenv('AI_ENHANCED', '0') == '1'))
             try:
-                if hasattr(self, 'lbl_adv_status') and self.lbl_adv_status:
+                if self.lbl_adv_status:
                     if self._adv_enabled:
                         self.lbl_adv_status.configure(text='● Conseiller actif', foreground='green')
                     else:
                         self.lbl_adv_status.configure(
                             text='● Conseiller désactivé', foreground='red'
                         )
-                if hasattr(self, 'lbl_adv_info') and self.lbl_adv_info:
+                if self.lbl_adv_info:
                     self.lbl_adv_info.configure(
                         text=(
                             'Analyse et suggestion basées sur le portefeuille.'
@@ -2522,7 +2719,7 @@ class WSApp(tk.Tk):
                             else 'Activez le Conseiller dans Préférences > Intelligence Artificielle, ou définissez AI_ENHANCED=1 avant le lancement.'
                         )
                     )
-                if hasattr(self, 'btn_advisor_analyze') and self.btn_advisor_analyze:
+                if self.btn_advisor_analyze:
                     self.btn_advisor_analyze.configure(
                         state=(tk.NORMAL if self._adv_enabled else tk.DISABLED)
                     )
@@ -2554,78 +2751,76 @@ class WSApp(tk.Tk):
             pass
 
     def _update_portfolio_view(self):
+        """Lance la lecture du portefeuille (cotations réseau) hors du thread Tk."""
+        if not self._trade_exec:
+            return
+        trade_exec = self._trade_exec
+        currency = self.base_currency
+
+        def worker():
+            prepared = None
+            try:
+                snap = trade_exec.portfolio_snapshot(include_quotes=True)
+                if snap.get('mode') == 'paper':
+                    # Calculs et formatage des lignes faits ici, hors du thread Tk
+                    prepared = _pf_display_rows(snap, currency)
+            except Exception:
+                snap = None
+            self._post(self._render_portfolio, snap, prepared)
+
+        self._start_single_flight(self._pf_inflight, worker)
+
+    def _render_portfolio(self, snap: dict | None, prepared: tuple | None = None):
         try:
-            if not hasattr(self, '_trade_exec') or not self._trade_exec:
-                return
-            snap = self._trade_exec.portfolio_snapshot(include_quotes=True)
+            if snap is None:
+                raise ValueError('portfolio snapshot unavailable')
             if snap.get('mode') != 'paper':
-                self.lbl_pf.config(text="Mode LIVE (pas de portefeuille paper)")
-                for i in self.tree_pf.get_children():
-                    self.tree_pf.delete(i)
+                self._set_pf_summary("Mode LIVE (pas de portefeuille paper)")
+                self._release_pf_rows(list(self._pf_row_iids.values()))
+                self._pf_row_iids.clear()
+                self._pf_row_state.clear()
                 return
 
             cash = snap.get('cash') or 0.0
-            total_value = cash
-            total_pnl = 0.0
-
-            # Clear existing rows
-            for iid in self.tree_pf.get_children():
-                self.tree_pf.delete(iid)
-
-            # Process positions with quotes
-            for pos in snap.get('positions', []):
-                symbol = pos['symbol']
-                qty = pos['qty']
-                avg_price = pos['avg_price']
-
-                # Get current quote
-                quote = snap.get('quotes', {}).get(symbol, {})
-                last_price = quote.get('last', 0.0)
-
-                # Calculate values
-                cost_basis = qty * avg_price
-                market_value = qty * last_price if last_price > 0 else cost_basis
-                pnl_dollars = market_value - cost_basis
-                pnl_percent = (pnl_dollars / cost_basis * 100) if cost_basis != 0 else 0.0
-
-                total_value += market_value
-                total_pnl += pnl_dollars
-
-                # Format values for display (prices with currency symbol; totals with codes)
-                last_str = (
-                    format_money(last_price, self.base_currency, with_symbol=True)
-                    if last_price > 0
-                    else "N/A"
-                )
-                pnl_str = f"{pnl_percent:+.1f}%" if last_price > 0 else "N/A"
-                value_str = format_money(market_value, self.base_currency, with_symbol=False)
-
-                # Color-code PnL
-                tags = []
-                if last_price > 0:
-                    if pnl_percent > 0:
-                        tags = ['positive_pnl']
-                    elif pnl_percent < 0:
-                        tags = ['negative_pnl']
-
-                iid = self.tree_pf.insert(
-                    '',
-                    'end',
-                    text=symbol,
-                    values=(symbol, f"{qty:.4f}", f"{avg_price:.2f}", last_str, pnl_str, value_str),
-                    tags=tags,
-                )
-                try:
-                    self._attach_logo_to_item(self.tree_pf, iid, symbol)
-                except Exception:
-                    pass
 
-            # Configure PnL colors
-            try:
-                self.tree_pf.tag_configure('positive_pnl', foreground='#22c55e')  # green
-                self.tree_pf.tag_configure('negative_pnl', foreground='#ef4444')  # red
-            except Exception:
-                pass
+            # Mise à jour différentielle: seules les lignes modifiées sont touchées, les
+            # nouveaux symboles prennent une ligne de la réserve, les disparus y retournent
+            tree = self.tree_pf
+            row_iids = self._pf_row_iids
+            row_state = self._pf_row_state
+            seen: set[str] = set()
+            new_rows: list[tuple[str, str]] = []
+
+            rows, total_value, total_pnl = prepared or _pf_display_rows(snap, self.base_currency)
+            total_value += cash
+            for symbol, values, tags in rows:
+                seen.add(symbol)
+                iid = row_iids.get(symbol)
+                if iid is None:
+                    iid = self._acquire_pf_row()
+                    tree.move(iid, '', 'end')
+                    tree.item(iid, text=symbol, values=values, tags=tags, image='')
+                    row_iids[symbol] = iid
+                    new_rows.append((iid, symbol))
+                else:
+                    old_values, old_tags = row_state[symbol]
+                    # Seules les cellules modifiées sont réécrites (en pratique dernier, P&L
+                    # et valeur); les tags uniquement si la couleur change
+                    if old_values != values:
+                        for col, old, new in zip(_PF_COL_IDS, old_values, values):
+                            if old != new:
+                                tree.set(iid, col, new)
+                    if old_tags != tags:
+                        tree.item(iid, tags=tags)
+                row_state[symbol] = (values, tags)
+
+            gone = [sym for sym in row_iids if sym not in seen]
+            if gone:
+                self._release_pf_rows([row_iids.pop(sym) for sym in gone])
+                for sym in gone:
+                    row_state.pop(sym, None)
+            if new_rows:
+                self._attach_logos_bulk(tree, new_rows)
 
             # Update summary label
             equity = snap.get('equity') or total_value
@@ -2634,7 +2829,7 @@ class WSApp(tk.Tk):
                 if (total_value - total_pnl) != 0
                 else 0.0
             )
-            pnl_color = "#22c55e" if total_pnl >= 0 else "#ef4444"
+            pnl_color = _PF_POS_FG if total_pnl >= 0 else _PF_NEG_FG
 
             summary_text = (
                 f"Cash: {format_money(cash, self.base_currency, with_symbol=False)}  |  "
@@ -2642,7 +2837,7 @@ class WSApp(tk.Tk):
                 f"PnL: {format_money(total_pnl, self.base_currency, with_symbol=False)} ({total_pnl_pct:+.1f}%)  |  "
                 f"Positions: {len(snap.get('positions', []))}"
             )
-            self.lbl_pf.config(text=summary_text, foreground=pnl_color)
+            self._set_pf_summary(summary_text, pnl_color)
 
         except Exception:
             # Fallback to basic view on error
@@ -2650,41 +2845,66 @@ class WSApp(tk.Tk):
                 snap = self._trade_exec.portfolio_snapshot(include_quotes=False)
                 cash = snap.get('cash') or 0.0
                 equity = snap.get('equity') or cash
-                self.lbl_pf.config(
-                    text=(
-                        f"Cash: {format_money(cash, self.base_currency, with_symbol=False)}  |  "
-                        f"Équité: {format_money(equity, self.base_currency, with_symbol=False)}  |  "
-                        f"Positions: {len(snap.get('positions', []))} (quotes unavailable)"
-                    ),
-                    foreground='gray',
+                self._set_pf_summary(
+                    f"Cash: {format_money(cash, self.base_currency, with_symbol=False)}  |  "
+                    f"Équité: {format_money(equity, self.base_currency, with_symbol=False)}  |  "
+                    f"Positions: {len(snap.get('positions', []))} (quotes unavailable)",
+                    'gray',
                 )
             except Exception:
                 pass
 
-    def _portfolio_tick(self):
+    def _grow_pf_pool(self, count: int) -> None:
+        """Crée `count` lignes vides détachées de tree_pf, prêtes à être recyclées."""
+        tree = self.tree_pf
+        insert = _fast_tree_insert(tree)
+        iids = [insert('', (), ()) for _ in range(count)]
+        if iids:
+            tree.detach(*iids)
+            self._pf_pool.extend(iids)
+
+    def _acquire_pf_row(self) -> str:
+        if not self._pf_pool:
+            self._grow_pf_pool(_PF_POOL_GROW)
+        return self._pf_pool.pop()
+
+    def _release_pf_rows(self, iids: list[str]) -> None:
+        """Détache des lignes de tree_pf et les rend à la réserve (pas de delete)."""
+        if iids:
+            self.tree_pf.detach(*iids)
+            self._pf_pool.extend(iids)
+
+    def _set_pf_summary(self, text: str, foreground: str | None = None) -> None:
+        """Met à jour le résumé du portefeuille; aucun appel Tk si texte et couleur inchangés."""
+        if (text, foreground) == self._pf_summary:
+            return
+        self._pf_summary = (text, foreground)
+        if foreground is None:
+            self.lbl_pf.config(text=text)
+        else:
+            self.lbl_pf.config(text=text, foreground=foreground)
+
+    def _portfolio_tick(self) -> int:
         try:
             self._update_portfolio_view()
             self._update_ledger_view()
-            self.after(15000, self._portfolio_tick)
         except Exception:
             pass
+        return 15000
 
     def _update_ledger_view(self):
         """Update the ledger display with recent idempotency entries."""
         try:
-            if not hasattr(self, '_trade_exec') or not self._trade_exec:
+            if not self._trade_exec:
                 return
 
-            # Clear existing rows
-            for iid in self.tree_ledger.get_children():
-                self.tree_ledger.delete(iid)
-
             # Get ledger from config (persisted entries)
             ledger_data = app_config.get('autotrade.ledger', []) or []
 
             # Show most recent entries (last 10)
             recent_entries = ledger_data[-10:] if len(ledger_data) > 10 else ledger_data
 
+            rows: list[tuple] = []
             for entry in reversed(recent_entries):  # Show most recent first
                 timestamp = entry.get('timestamp', 'N/A')
                 symbol = entry.get('symbol', 'N/A')
@@ -2706,13 +2926,20 @@ class WSApp(tk.Tk):
                 else:
                     timestamp_str = 'N/A'
 
-                iid = self.tree_ledger.insert(
-                    '', 'end', text=symbol, values=(timestamp_str, symbol, kind, str(index))
-                )
-                try:
-                    self._attach_logo_to_item(self.tree_ledger, iid, symbol)
-                except Exception:
-                    pass
+                rows.append((timestamp_str, symbol, kind, str(index)))
+
+            # Journal inchangé depuis le dernier tick: rien à redessiner
+            if rows == self._ledger_rows:
+                return
+            children = self.tree_ledger.get_children()
+            if children:
+                self.tree_ledger.delete(*children)
+            pairs = []
+            for values in rows:
+                iid = self.tree_ledger.insert('', 'end', text=values[1], values=values)
+                pairs.append((iid, values[1]))
+            self._ledger_rows = rows
+            self._attach_logos_bulk(self.tree_ledger, pairs)
 
         except Exception:
             pass
@@ -2789,17 +3016,13 @@ class WSApp(tk.Tk):
         except Exception:
             pass
 
-    def _ai_watchlist_tick(self):
+    def _ai_watchlist_tick(self) -> int:
         try:
             if bool(self.var_sr_wl_auto.get()):
                 self._ai_refresh_watchlist()
         except Exception:
             pass
-        # reschedule
-        try:
-            self.after(60 * 60 * 1000, self._ai_watchlist_tick)
-        except Exception:
-            pass
+        return 60 * 60 * 1000
 
     def _ai_refresh_watchlist(self):
         # Build watchlist using Screener + current strategy params (confluence by default)
@@ -2876,12 +3099,12 @@ class WSApp(tk.Tk):
             except Exception:
                 pass
 
-        threading.Thread(target=worker, daemon=True).start()
+        self._io_pool.submit(worker)
 
     def _strategy_copy_report(self):
         try:
             rep = ''
-            if hasattr(self, '_strategy_runner') and self._strategy_runner:
+            if self._strategy_runner:
                 rep = self._strategy_runner.last_report() or ''
             self.clipboard_clear()
             self.clipboard_append(rep)
@@ -2924,7 +3147,29 @@ class WSApp(tk.Tk):
             if tree:
                 tree.tag_configure('odd', background=pal['panel'])
                 tree.tag_configure('even', background=pal['surface'])
+        # Tags P&L partagés (positions + mouvements), configurés une fois par thème
+        for tree in (
+            getattr(self, 'tree_positions', None),
+            getattr(self, 'tree_gainers', None),
+            getattr(self, 'tree_losers', None),
+            getattr(self, 'tree_active', None),
+            getattr(self, 'tree_opps', None),
+        ):
+            if tree:
+                tree.tag_configure('pnl_pos', foreground=pal.get('pnl_pos', pal['success']))
+                tree.tag_configure('pnl_neg', foreground=pal.get('pnl_neg', pal['danger']))
+        # Niveaux des signaux AI
+        tree_signals = getattr(self, 'tree_signals', None)
+        if tree_signals:
+            for tag, col in (
+                ('lvl_info', pal.get('text_muted', '#888')),
+                ('lvl_warn', '#d97706'),
+                ('lvl_alert', pal.get('danger', '#dc2626')),
+            ):
+                tree_signals.tag_configure(tag, foreground=col)
         self._theme = applied
+        self._pal = pal
+        self._configure_banner_styles()
         # Persister le thème choisi
         try:
             app_config.set('theme', applied)
@@ -3043,8 +3288,8 @@ class WSApp(tk.Tk):
             tg.start_command_handler(
                 self.agent,
                 allowed_chat_id=allowed_id,
-                trade_executor=getattr(self, '_trade_exec', None),
-                strategy_runner=getattr(self, '_strategy_runner', None),
+                trade_executor=self._trade_exec,
+                strategy_runner=self._strategy_runner,
             )
             try:
                 # update UI widget
@@ -3152,8 +3397,9 @@ class WSApp(tk.Tk):
             pass
 
     def refresh_accounts(self):
-        if not self.api:
+        if not self.api or 'accounts' in self._refresh_inflight:
             return
+        self._refresh_inflight.add('accounts')
         self.set_status('Chargement des comptes...')
         self._busy(True)
 
@@ -3163,17 +3409,7 @@ class WSApp(tk.Tk):
                 self.accounts = accounts
 
                 def upd():
-                    self.list_accounts.delete(0, tk.END)
-                    for acc in accounts:
-                        # Show bell icon depending on alerts setting
-                        enabled = app_config.get(f"alerts.{acc['id']}", True)
-                        icon = '🔔' if enabled else '🔕'
-                        self.list_accounts.insert(
-                            tk.END,
-                            f"{icon} {acc['number']} | {acc['description']} ("
-                            f"{acc['currency']})",
-                        )
-                    self.set_status(f"{len(accounts)} comptes chargés")
+                    self._fill_accounts_list(accounts)
                     # Rétablir la sélection du compte précédent si possible
                     try:
                         last_id = app_config.get('ui.last_account_id')
@@ -3199,9 +3435,23 @@ class WSApp(tk.Tk):
                     ),
                 )
             finally:
-                self.after(0, lambda: self._busy(False))
-
-        threading.Thread(target=worker, daemon=True).start()
+                self.after(0, lambda: self._end_refresh('accounts'))
+
+        self._submit_refresh('accounts', worker)
+
+    def _fill_accounts_list(self, accounts: list[dict]) -> None:
+        """Remplit la liste des comptes (icône d'alertes, numéro, description, devise)."""
+        self.accounts = accounts
+        self.list_accounts.delete(0, tk.END)
+        for acc in accounts:
+            # Show bell icon depending on alerts setting
+            enabled = app_config.get(f"alerts.{acc['id']}", True)
+            icon = '🔔' if enabled else '🔕'
+            self.list_accounts.insert(
+                tk.END,
+                f"{icon} {acc['number']} | {acc['description']} ({acc['currency']})",
+            )
+        self.set_status(f"{len(accounts)} comptes chargés")
 
     def on_account_selected(self, _=None):
         if not self.api:
@@ -3257,9 +3507,10 @@ class WSApp(tk.Tk):
             self.set_status(f"Date invalide: {s}", error=True)
             return None
 
-    def _refresh_insights_badge(self):
+    def _refresh_insights_badge(self) -> int:
         """Refresh the small insights label in the header.
         Non-blocking; uses agent._insights() if positions exist.
+        Renvoie le délai (ms) avant le prochain rafraîchissement.
         """
         try:
             txt = ''
@@ -3280,10 +3531,7 @@ class WSApp(tk.Tk):
             self.var_insights.set(s)
         except Exception:
             pass
-        try:
-            self.after(15000, self._refresh_insights_badge)
-        except Exception:
-            pass
+        return 15000
 
     def _show_insights_details(self):
         """Show full insights text in a small popup."""
@@ -3316,9 +3564,23 @@ class WSApp(tk.Tk):
         except Exception:
             pass
 
+    def _manual_refresh(self):
+        """F5: invalide les données de marché en cache puis recharge le compte courant."""
+        try:
+            if self.api:
+                self.api.invalidate_market_data()
+        except Exception:
+            pass
+        self.refresh_selected_account_details()
+
     def refresh_selected_account_details(self):
         if not (self.api and self.current_account_id):
             return
+        account_id = self.current_account_id
+        key = f'details:{account_id}'
+        if key in self._refresh_inflight:
+            return
+        self._refresh_inflight.add(key)
         start = self.parse_date(self.var_start.get())
         end = self.parse_date(self.var_end.get())
         limit = self.var_limit.get() or 10
@@ -3326,9 +3588,9 @@ class WSApp(tk.Tk):
 
         def worker():
             try:
-                positions = self.api.get_account_positions(self.current_account_id)
+                positions = self.api.get_account_positions(account_id)
                 acts = self.api.get_activities(
-                    self.current_account_id,
+                    account_id,
                     how_many=limit,
                     start_date=start,
                     end_date=end,
@@ -3339,14 +3601,86 @@ class WSApp(tk.Tk):
                     0, lambda e=e: self.set_status(f"Erreur: {e}", error=True, details=repr(e))
                 )
             finally:
-                self.after(0, lambda: self._busy(False))
+                self.after(0, lambda: self._end_refresh(key))
 
-        threading.Thread(target=worker, daemon=True).start()
+        self._submit_refresh(key, worker)
 
-    def update_details(self, positions: list[dict], acts: list[dict]):
-        for row in self.tree_positions.get_children():
-            self.tree_positions.delete(row)
+    def _submit_refresh(self, key: str, worker) -> None:
+        try:
+            self._io_pool.submit(worker)
+        except RuntimeError:  # pool arrêté (fermeture de l'application)
+            self._end_refresh(key)
+
+    def _end_refresh(self, key: str) -> None:
+        self._refresh_inflight.discard(key)
+        self._busy(False)
+
+    def _set_positions_cache(self, positions: list[dict]) -> None:
+        """Remplace le cache des positions et invalide les index qui en dérivent."""
+        self._drop_detached_position_rows()
         self._positions_cache = positions
+        self._symbol_universe_dirty = True
+        self._positions_filter_index = None
+        self._positions_top20 = None
+        self._positions_columns_cache = None
+        self._positions_iids = []
+        self._positions_pnl_tags = []
+
+    def _drop_detached_position_rows(self) -> None:
+        """Supprime les lignes masquées par le filtre rapide (détachées).
+
+        `get_children()` ne les voit pas: sans cela chaque rafraîchissement avec un filtre
+        saisi les laisserait vivantes dans le Treeview.
+        """
+        iids = self._positions_iids
+        if not iids:
+            return
+        try:
+            tree = self.tree_positions
+            attached = set(tree.get_children())
+            detached = [iid for iid in iids if iid not in attached]
+            if detached:
+                tree.delete(*detached)
+        except Exception:
+            pass
+
+    def _positions_columns(self) -> tuple[list[float], list[float], list[float]]:
+        """Colonnes numériques `(pnlPct, pnlAbs, value)` alignées sur le cache des positions.
+
+        Construites une fois par cache (invalidées par `_set_positions_cache`) pour que les
+        classements travaillent sur des listes de floats plutôt que sur les dicts.
+        """
+        cols = self._positions_columns_cache
+        if cols is None:
+            positions = self._positions_cache
+            cols = (
+                [_pos_pnl_pct(p) for p in positions],
+                [_pos_pnl_abs(p) for p in positions],
+                [_pos_value(p) for p in positions],
+            )
+            self._positions_columns_cache = cols
+        return cols
+
+    def _positions_filter_keys(self) -> list[tuple[str, str, dict]]:
+        """Clés de filtre rapide `(symbole, nom)` en minuscules, calculées une fois par cache."""
+        index = self._positions_filter_index
+        if index is None:
+            index = [
+                (str(p.get('symbol') or '').lower(), str(p.get('name') or '').lower(), p)
+                for p in self._positions_cache
+            ]
+            self._positions_filter_index = index
+        return index
+
+    def update_details(self, positions: list[dict], acts: list[dict]):
+        tree = self.tree_positions
+        # Avant l'effacement: le cache purge d'abord les lignes détachées par le filtre
+        self._set_positions_cache(positions)
+        children = tree.get_children()
+        if children:
+            tree.delete(*children)
+        # Lignes préparées (texte, valeurs, tags) puis insérées en un seul lot
+        rows: list[tuple[str, tuple, tuple]] = []
         total_value = 0.0
         cur_totals: dict[str, float] = {}
         total_pnl_abs = 0.0
@@ -3369,8 +3703,7 @@ class WSApp(tk.Tk):
                 if pos.get('pnlIsDaily'):
                     arrow_pct += '*'
             avg = pos.get('avgPrice')
-            idx = len(self.tree_positions.get_children())
-            base_tag = 'even' if idx % 2 == 0 else 'odd'
+            base_tag = 'even' if len(rows) % 2 == 0 else 'odd'
             pnl_tag = None
             if isinstance(pnl_pct, (int, float)):
                 pnl_tag = 'pnl_pos' if pnl_pct >= 0 else 'pnl_neg'
@@ -3408,36 +3741,36 @@ class WSApp(tk.Tk):
             except Exception:
                 pnl_abs_str = f"{pnl_abs:,.2f}" if isinstance(pnl_abs, (int, float)) else ''
 
-            iid = self.tree_positions.insert(
-                '',
-                tk.END,
-                text=str(pos.get('symbol') or ''),
-                values=(
-                    pos.get('symbol'),
-                    pos.get('name'),
-                    pos.get('quantity'),
-                    last_str,
-                    val_str,
-                    cur,
-                    avg_str,
-                    arrow_pct,
-                    pnl_abs_str,
-                ),
-                tags=tags,
+            rows.append(
+                (
+                    str(pos.get('symbol') or '').strip().upper(),
+                    (
+                        pos.get('symbol'),
+                        pos.get('name'),
+                        pos.get('quantity'),
+                        last_str,
+                        val_str,
+                        cur,
+                        avg_str,
+                        arrow_pct,
+                        pnl_abs_str,
+                    ),
+                    tags,
+                )
             )
-            try:
-                self._attach_logo_to_item(self.tree_positions, iid, pos.get('symbol') or '')
-            except Exception:
-                pass
-        pal = self._palettes[self._theme]
+        insert = _fast_tree_insert(tree)
+        with _bulk_tree_update(tree, len(rows)):
+            pairs = [(insert(text, values, tags), text) for text, values, tags in rows]
+        # Lignes alignées sur le cache, réutilisées par le filtre rapide
+        self._positions_iids = [iid for iid, _ in pairs]
+        self._tree_values[tree] = {iid: values for (iid, _), (_, values, _) in zip(pairs, rows)}
+        self._positions_pnl_tags = [tags[1:] for _, _, tags in rows]
+        # Filtre rapide déjà saisi: réappliqué sur les nouvelles lignes
+        if (self.var_pos_quick.get() or '').strip():
+            self._apply_positions_quick_filter()
         try:
-            self.tree_positions.tag_configure(
-                'pnl_pos', foreground=pal.get('pnl_pos', pal['success'])
-            )
-            self.tree_positions.tag_configure(
-                'pnl_neg', foreground=pal.get('pnl_neg', pal['danger'])
-            )
-        except Exception:  # noqa
+            self._attach_logos_bulk(tree, pairs)
+        except Exception:
             pass
         try:
             # Gate AI notifications by per-account alerts toggle
@@ -3492,32 +3825,15 @@ class WSApp(tk.Tk):
             )
         else:
             self.set_status('Détails chargés')
-        for row in self.tree_acts.get_children():
-            self.tree_acts.delete(row)
+        children = self.tree_acts.get_children()
+        if children:
+            self.tree_acts.delete(*children)
         self._activities_cache = acts
         if not acts:
             self.tree_acts.insert(
                 '', tk.END, values=('—', 'Aucune activité', '', ''), tags=('even',)
             )
-        for a in acts:
-            idx = len(self.tree_acts.get_children())
-            tag = 'even' if idx % 2 == 0 else 'odd'
-            amt = a.get('amount')
-            cur = a.get('currency') or self.base_currency
-            self.tree_acts.insert(
-                '',
-                tk.END,
-                values=(
-                    a.get('occurredAt'),
-                    a.get('description'),
-                    (
-                        format_money(amt, cur, with_symbol=False)
-                        if isinstance(amt, (int, float))
-                        else amt
-                    ),
-                ),
-                tags=(tag,),
-            )
+        self._fill_activities([values for _, values in self._activity_index()])
         self._refresh_ai_signals()
         # Met à jour le nouveau tab mouvements
         try:
@@ -3560,10 +3876,9 @@ class WSApp(tk.Tk):
                 with open(path, 'w', newline='', encoding='utf-8') as f:
                     w = csv.DictWriter(f, fieldnames=fields)
                     w.writeheader()
-                    for p in self._positions_cache:
-                        w.writerow({k: p.get(k) for k in fields})
-            # Confirmation conservée
-            messagebox.showinfo('Export', f'Positions exportées: {path}')
+                    w.writerows({k: p.get(k) for k in fields} for p in self._positions_cache)
+            # Confirmation conservée, en bannière non bloquante
+            self._show_banner(f'Positions exportées: {path}', kind='info', timeout_ms=3000)
         except Exception as e:  # noqa
             self.set_status(f"Erreur export positions: {e}", error=True, details=repr(e))
 
@@ -3581,35 +3896,40 @@ class WSApp(tk.Tk):
         with open(path, 'w', newline='', encoding='utf-8') as f:
             w = csv.writer(f)
             w.writerow(['Date', 'Description', 'Montant'])
-            for iid in self.tree_acts.get_children():
-                w.writerow(self.tree_acts.item(iid, 'values'))
-        # Confirmation conservée
-        messagebox.showinfo('Export', f'Activités exportées: {path}')
+            item = self.tree_acts.item
+            w.writerows(item(iid, 'values') for iid in self.tree_acts.get_children())
+        # Confirmation conservée, en bannière non bloquante
+        self._show_banner(f'Activités exportées: {path}', kind='info', timeout_ms=3000)
+
+    def _row_values(self, tree: ttk.Treeview, iid: str) -> tuple:
+        """Valeurs d'une ligne: ombre d'insertion si disponible, sinon lecture Tk."""
+        vals = self._tree_values.get(tree, {}).get(iid)
+        return vals if vals is not None else tree.item(iid, 'values')
 
     def sort_tree(self, tree: ttk.Treeview, col: str, numeric=False):
-        items = list(tree.get_children(''))
+        items = tree.get_children('')
         idx_col = tree['columns'].index(col)
+        # Valeurs mémorisées à l'insertion quand disponibles; sinon lecture de la cellule Tk
+        shadow = self._tree_values.get(tree, {})
         data = []
         for iid in items:
-            vals = tree.item(iid, 'values')
+            vals = shadow.get(iid)
+            if vals is None:
+                vals = tree.item(iid, 'values')
             key = vals[idx_col]
             if numeric:
                 try:
-                    key = float(
-                        str(key)
-                        .replace('↑', '')
-                        .replace('↓', '')
-                        .replace('%', '')
-                        .replace('*', '')
-                        .replace(',', '')
-                    )
+                    key = float(str(key).translate(_NUM_STRIP_TBL))
                 except Exception:
                     key = 0.0
+            else:
+                key = '' if key is None else str(key)
             data.append((key, iid))
         descending = getattr(tree, f'_sort_desc_{col}', False)
         data.sort(reverse=not descending)
-        for _, iid in data:
-            tree.move(iid, '', 'end')
+        move = tree.move
+        for k, (_, iid) in enumerate(data):
+            move(iid, '', k)
         setattr(tree, f'_sort_desc_{col}', not descending)
 
     # ---- Logos in Treeviews ----
@@ -3652,30 +3972,105 @@ class WSApp(tk.Tk):
         except Exception:
             pass
 
+    def _attach_logos_bulk(self, tree: ttk.Treeview, pairs: list[tuple[str, str]]):
+        """Résout les logos d'un lot de lignes `(iid, symbole)` en une seule requête média."""
+        pairs = [(iid, (sym or '').strip().upper()) for iid, sym in pairs]
+        known = {sym: self._logo_images[sym] for _, sym in pairs if sym in self._logo_images}
+        missing = [sym for _, sym in pairs if sym and sym not in known]
+        if not missing:
+            self._apply_logos_bulk(tree, pairs, known)
+            return
+
+        def on_ready(mapping):
+            mapping.update(known)
+            try:
+                self.after(0, lambda: self._apply_logos_bulk(tree, pairs, mapping))
+            except Exception:
+                pass
+
+        try:
+            self.media.get_logos_async(missing, on_ready)
+        except Exception:
+            pass
+
+    def _apply_logos_bulk(self, tree: ttk.Treeview, pairs: list[tuple[str, str]], mapping: dict):
+        try:
+            if not tree.winfo_exists():
+                return
+        except Exception:
+            return
+        item = tree.item
+        exists = tree.exists
+        for iid, sym in pairs:
+            img = mapping.get(sym) if sym else None
+            try:
+                if not exists(iid):
+                    continue
+                # Lignes recyclées du portefeuille: ignorer un logo arrivé après réaffectation
+                if tree is self.tree_pf and self._pf_row_iids.get(sym) != iid:
+                    continue
+                if img:
+                    self._logo_images[sym] = img
+                    item(iid, image=img)
+                elif sym in mapping:
+                    # Clear any stale image if fetch failed
+                    item(iid, image='')
+            except Exception:
+                pass
+
+    def _activity_index(self) -> list[tuple[str, tuple]]:
+        """`(clé minuscule "date\\x1fdescription", valeurs formatées)` par activité du cache."""
+        acts = self._activities_cache
+        if self._activities_index_src is not acts:
+            base_cur = self.base_currency
+            index = []
+            for a in acts:
+                date = a.get('occurredAt')
+                desc = a.get('description')
+                amt = a.get('amount')
+                if isinstance(amt, (int, float)):
+                    amt = format_money(amt, a.get('currency') or base_cur, with_symbol=False)
+                index.append((f"{date or ''}\x1f{desc or ''}".lower(), (date, desc, amt)))
+            self._activities_index = index
+            self._activities_index_src = acts
+        return self._activities_index
+
+    def _fill_activities(self, rows: list[tuple]) -> None:
+        tree = self.tree_acts
+        insert = _fast_tree_insert(tree)
+        with _bulk_tree_update(tree, len(rows)):
+            self._tree_values[tree] = {
+                insert('', values, _TAG_EVEN if i % 2 == 0 else _TAG_ODD): values
+                for i, values in enumerate(rows)
+            }
+
     def apply_activity_filter(self):
         flt = (self.var_act_filter.get() or '').lower()
-        for row in self.tree_acts.get_children():
-            self.tree_acts.delete(row)
-        for a in self._activities_cache:
-            if (
-                flt
-                and flt not in (a.get('description') or '').lower()
-                and flt not in (a.get('occurredAt') or '').lower()
-            ):
-                continue
-            self.tree_acts.insert(
-                '',
-                tk.END,
-                values=(
-                    a.get('occurredAt'),
-                    a.get('description'),
-                    a.get('amount'),
-                ),
-            )
+        children = self.tree_acts.get_children()
+        if children:
+            self.tree_acts.delete(*children)
+        self._fill_activities(
+            [values for key, values in self._activity_index() if not flt or flt in key]
+        )
 
-    def _refresh_ai_signals_periodic(self):
+    def _refresh_ai_signals_step(self) -> int:
         self._refresh_ai_signals()
-        self.after(15000, self._refresh_ai_signals_periodic)
+        return 15000
+
+    def _periodic_tick(self) -> None:
+        """Exécute les tâches périodiques échues (chacune renvoie son prochain délai en ms),
+        puis se replanifie une seule fois à l'échéance la plus proche."""
+        due = self._periodic_due
+        now = time.monotonic()
+        for step, at in list(due.items()):
+            if now >= at:
+                try:
+                    interval_ms = step()
+                except Exception:
+                    interval_ms = 15000
+                due[step] = time.monotonic() + interval_ms / 1000.0
+        delay_ms = int((min(due.values()) - time.monotonic()) * 1000)
+        self.after(max(50, delay_ms), self._periodic_tick)
 
     def _refresh_ai_signals(self):
         if self.agent_ui:
@@ -3685,54 +4080,63 @@ class WSApp(tk.Tk):
                 level = (
                     self.var_ai_level.get() if hasattr(self, 'var_ai_level') else 'ALL'
                 ) or 'ALL'
-                if level and level != 'ALL':
-                    lvl_idx = list(self.tree_signals['columns']).index('level')
-                    for iid in self.tree_signals.get_children():
-                        vals = self.tree_signals.item(iid, 'values')
-                        if vals and len(vals) > lvl_idx and str(vals[lvl_idx]).upper() != level:
-                            self.tree_signals.detach(iid)
+                self.agent_ui.filter_level(level)
             except Exception:
                 pass
-            pal = self._palettes[self._theme]
-            colors = {
-                'lvl_info': pal.get('text_muted', '#888'),
-                'lvl_warn': '#d97706',
-                'lvl_alert': pal.get('danger', '#dc2626'),
-            }
-            for tag, col in colors.items():
-                try:
-                    self.tree_signals.tag_configure(tag, foreground=col)
-                except Exception:  # noqa
-                    pass
 
     def _recent_signals_tick(self):
+        # Filet de sécurité: les mises à jour normales arrivent via _schedule_signals_flush
+        self._flush_signals()
         try:
-            self._update_recent_signals()
-            self._update_at_activity()
+            self.after(60000, self._recent_signals_tick)
         except Exception:
             pass
+
+    def _schedule_signals_flush(self):
+        """Hook on_change du runner/exécuteur: planifie un seul rafraîchissement au repos."""
+        if self._signals_flush_pending:
+            return
+        self._signals_flush_pending = True
         try:
-            self.after(8000, self._recent_signals_tick)
+            self.after_idle(self._flush_signals)
         except Exception:
-            pass
+            self._signals_flush_pending = False
+
+    def _flush_signals(self):
+        self._signals_flush_pending = False
+        try:
+            self._update_recent_signals()
+            self._update_at_activity()
+        except Exception:
+            pass
 
     def _update_recent_signals(self):
         try:
-            if not hasattr(self, '_strategy_runner') or not self._strategy_runner:
+            if not self._strategy_runner:
                 return
-            for iid in self.tree_recent_signals.get_children():
-                self.tree_recent_signals.delete(iid)
-            from datetime import datetime as _dt
-
-            for sym, kind, idx, reason in self._strategy_runner.recent_signals()[-20:][::-1]:
-                ts = _dt.now().strftime('%H:%M:%S')
-                self.tree_recent_signals.insert('', tk.END, values=(ts, sym, kind, reason))
+            tree = self.tree_recent_signals
+            rows = self._recent_signal_rows
+            ts = datetime.now().strftime('%H:%M:%S')
+            # Mise à jour incrémentale: (symbol, kind, index, reason) -> iid
+            wanted = list(dict.fromkeys(self._strategy_runner.recent_signals()[-20:][::-1]))
+            keep = set(wanted)
+            stale = [key for key in rows if key not in keep]
+            if stale:
+                tree.delete(*(rows.pop(key) for key in stale))
+            for pos, key in enumerate(wanted):
+                iid = rows.get(key)
+                if iid is None:
+                    sym, kind, _idx, reason = key
+                    rows[key] = tree.insert('', pos, values=(ts, sym, kind, reason))
+                else:
+                    # Seule la colonne horaire change pour une ligne existante
+                    tree.set(iid, 'time', ts)
         except Exception:
             pass
 
     def _update_at_activity(self):
         try:
-            if not hasattr(self, '_trade_exec') or not self._trade_exec:
+            if not self._trade_exec:
                 return
             acts = self._trade_exec.last_actions(10)
             self.lst_at_activity.delete(0, tk.END)
@@ -3744,38 +4148,39 @@ class WSApp(tk.Tk):
     def _on_strategy_signal(self, symbol: str, signal):
         """Callback from StrategyRunner when a fresh signal is emitted.
 
-        - Update recent signals panel immediately
+        - Recent signals panel is refreshed through the runner's on_change hook
         - If a chart view for this symbol is available, set markers accordingly
         """
-        try:
-            self._update_recent_signals()
-            self._update_at_activity()
-        except Exception:
-            pass
         # Chart markers: only if main ChartController is available and has data cached
         try:
             # Determine if analyzer window is open on this symbol; prefer it if so
-            if getattr(self, 'symbol_analyzer', None) and getattr(
-                self.symbol_analyzer, 'window', None
-            ):
-                if (
-                    str(getattr(self.symbol_analyzer, 'current_symbol', '')).upper()
-                    == str(symbol).upper()
-                ):
+            # Instance déjà créée seulement: une simple vérification ne doit pas l'instancier
+            sa = self._symbol_analyzer
+            if sa and getattr(sa, 'window', None):
+                if str(getattr(sa, 'current_symbol', '')).upper() == str(symbol).upper():
                     # symbol analyzer uses its own plotting; skip here
                     return
             # Fallback to main ChartController (account charts)
             if hasattr(self, 'chart') and getattr(self.chart, '_last_points', None):
                 # Build a marker for today
-                from datetime import datetime as _dt
-
-                d = _dt.now().strftime('%Y-%m-%d')
+                d = datetime.now().strftime('%Y-%m-%d')
                 lbl = getattr(signal, 'reason', '') or getattr(signal, 'kind', '')
                 kind = str(getattr(signal, 'kind', 'buy')).lower()
-                self.chart.set_markers([{'date': d, 'kind': kind, 'label': lbl}])
+                # Regrouper les rafales de signaux en un seul replot
+                self._chart_pending_markers.append({'date': d, 'kind': kind, 'label': lbl})
+                if len(self._chart_pending_markers) == 1:
+                    self.after_idle(self._flush_chart_markers)
         except Exception:
             pass
 
+    def _flush_chart_markers(self):
+        markers, self._chart_pending_markers = self._chart_pending_markers, []
+        if markers:
+            try:
+                self.chart.set_markers(markers)
+            except Exception:
+                pass
+
     def _ai_signal_trade(self, side: str):
         """One-click paper trade from selected AI signal."""
         try:
@@ -3789,7 +4194,7 @@ class WSApp(tk.Tk):
             symbol = str(vals[2]).strip().upper() if len(vals) > 2 else ''
             if not symbol:
                 return
-            if not hasattr(self, '_trade_exec') or not self._trade_exec:
+            if not self._trade_exec:
                 return
             if side == 'buy':
                 self._trade_exec.buy_market(symbol)
@@ -3801,16 +4206,27 @@ class WSApp(tk.Tk):
         except Exception:
             pass
 
-    def _chat_send(self):
-        msg = self.var_chat.get().strip()
-        if not msg:
-            return
-        self.var_chat.set('')
-        self._append_chat(f"Vous: {msg}\n")
+    def _chat_ask(self, msg: str):
+        """Envoie `msg` à l'agent hors du thread Tk (boutons rapides, analyse de repli).
+
+        La saisie du chat passe par `ChatManager._chat_send`.
+        """
+        try:
+            self._io_pool.submit(self._chat_worker, msg)
+        except RuntimeError:  # pool arrêté (fermeture de l'application)
+            pass
+
+    def _chat_worker(self, msg: str):
         try:
             resp = self.agent.chat(msg)
         except Exception as e:  # noqa
             resp = f"Erreur agent: {e}"
+        try:
+            self.after(0, self._chat_finish, resp)
+        except Exception:
+            pass
+
+    def _chat_finish(self, resp: str):
         self._append_chat(f"Agent: {resp}\n")
         # Log Gemini erreurs dans la zone output
         if resp.lower().startswith('(gemini erreur') or 'gemini' in resp.lower():
@@ -3827,26 +4243,42 @@ class WSApp(tk.Tk):
             ts = ''
         has_nl = text.endswith('\n')
         raw = text[:-1] if has_nl else text
+        speaker, speaker_tag = '', ''
+        if raw.startswith('Vous: '):
+            speaker, speaker_tag = 'Vous: ', 'speaker_user'
+        elif raw.startswith('Agent: '):
+            speaker, speaker_tag = 'Agent: ', 'speaker_agent'
+        # Un seul appel insert multi-segments (texte, tags, texte, tags, ...)
+        chunks: list = [f'[{ts}] ' if ts else '', 'ts']
+        if speaker:
+            chunks += [speaker, speaker_tag, raw[len(speaker) :], ()]
+        else:
+            chunks += [raw, ()]
+        if not has_nl:
+            chunks += ['\n', ()]
+        sizes = self._chat_msg_lines
+        sizes.append(raw.count('\n') + 1)
+        drop = 0
+        while len(sizes) > _CHAT_MAX_MESSAGES:
+            drop += sizes.popleft()
         self.txt_chat.configure(state=tk.NORMAL)
         try:
-            if ts:
-                self.txt_chat.insert(tk.END, f'[{ts}] ', 'ts')
-            speaker_tag = None
-            if raw.startswith('Vous: '):
-                speaker_tag = 'speaker_user'
-                self.txt_chat.insert(tk.END, 'Vous: ', speaker_tag)
-                self.txt_chat.insert(tk.END, raw[len('Vous: ') :])
-            elif raw.startswith('Agent: '):
-                speaker_tag = 'speaker_agent'
-                self.txt_chat.insert(tk.END, 'Agent: ', speaker_tag)
-                self.txt_chat.insert(tk.END, raw[len('Agent: ') :])
-            else:
-                self.txt_chat.insert(tk.END, raw)
-            if not has_nl:
-                self.txt_chat.insert(tk.END, '\n')
-            self.txt_chat.see(tk.END)
+            self.txt_chat.insert(tk.END, *chunks)
+            if drop:
+                # Historique borné: retirer les messages les plus anciens en un seul appel
+                self.txt_chat.delete('1.0', f'{drop + 1}.0')
         finally:
             self.txt_chat.configure(state=tk.DISABLED)
+        # Défiler une fois que la boucle Tk est inactive plutôt qu'à chaque ligne
+        if not self._chat_autoscroll_pending:
+            self._chat_autoscroll_pending = True
+            self.after_idle(self._flush_chat_autoscroll)
+
+    def _flush_chat_autoscroll(self):
+        try:
+            self.txt_chat.see(tk.END)
+        finally:
+            self._chat_autoscroll_pending = False
 
     # Placeholder handlers pour le champ de chat
     def _on_chat_focus_in(self, _event=None):
@@ -3866,11 +4298,33 @@ class WSApp(tk.Tk):
         except Exception:
             pass
 
+    def _defer_config_set(self, key: str, value, delay_ms: int = 500) -> None:
+        """Mémorise une préférence et planifie une sauvegarde unique (debounce)."""
+        self._pending_cfg[key] = value
+        if self._flush_config_id is not None:
+            try:
+                self.after_cancel(self._flush_config_id)
+            except Exception:
+                pass
+        self._flush_config_id = self.after(delay_ms, self._flush_config)
+
+    def _flush_config(self) -> None:
+        self._flush_config_id = None
+        pending, self._pending_cfg = self._pending_cfg, {}
+        if not pending:
+            return
+        try:
+            for key, value in pending.items():
+                app_config.set(key, value, save=False)
+            app_config.save_config()
+        except Exception:
+            pass
+
     def schedule_auto_refresh(self):
-        # Persister les préférences d'auto actualisation
+        # Persister les préférences d'auto actualisation (écriture différée)
         try:
-            app_config.set('ui.auto_refresh.enabled', bool(self.auto_refresh.get()))
-            app_config.set('ui.auto_refresh.seconds', int(self.auto_refresh_interval.get()))
+            self._defer_config_set('ui.auto_refresh.enabled', bool(self.auto_refresh.get()))
+            self._defer_config_set('ui.auto_refresh.seconds', int(self.auto_refresh_interval.get()))
         except Exception:
             pass
         if self.auto_refresh.get():
@@ -3879,24 +4333,97 @@ class WSApp(tk.Tk):
     def _auto_refresh_tick(self):
         if not self.auto_refresh.get():
             return
-        # prevent overlapping refreshes
-        if getattr(self, '_busy_refresh', False):
+        # prevent overlapping refreshes (auto précédent ou rafraîchissement manuel en cours,
+        # mêmes clés que refresh_accounts / refresh_selected_account_details)
+        acc_id = self.current_account_id
+        keys = ('accounts', f'details:{acc_id}') if acc_id else ('accounts',)
+        fut = self._refresh_future
+        if (fut is not None and not fut.done()) or not self._refresh_inflight.isdisjoint(keys):
             # reschedule sooner to catch up
             self.after(1000, self._auto_refresh_tick)
             return
-        self._busy_refresh = True
-        try:
-            self.refresh_accounts()
-            if self.current_account_id:
-                self.refresh_selected_account_details()
-        finally:
-            self._busy_refresh = False
+        if self.api:
+            # Paramètres lus sur le thread Tk; l'I/O réseau part dans le worker
+            params = {
+                'account_id': acc_id,
+                'start': self.parse_date(self.var_start.get()),
+                'end': self.parse_date(self.var_end.get()),
+                'limit': self.var_limit.get() or 10,
+                'keys': keys,
+            }
+            self._refresh_inflight.update(keys)
+            try:
+                self._refresh_future = self._refresh_executor.submit(self._do_refresh_work, params)
+            except RuntimeError:
+                # Exécuteur arrêté (fermeture en cours)
+                self._refresh_inflight.difference_update(keys)
+                return
         self.after(
             max(30, self.auto_refresh_interval.get()) * 1000,
             self._auto_refresh_tick,
         )
 
+    def _do_refresh_work(self, params: dict) -> None:
+        """Exécuté dans le worker: appels API uniquement, aucun accès aux widgets Tk."""
+        api = self.api
+        # Toujours publié, même sans API: les clés en cours sont libérées sur le thread Tk
+        result: dict = {'account_id': params.get('account_id'), 'keys': params.get('keys', ())}
+        try:
+            if api:
+                result['accounts'] = api.get_accounts()
+                acc_id = params.get('account_id')
+                if acc_id:
+                    result['positions'] = api.get_account_positions(acc_id)
+                    result['acts'] = api.get_activities(
+                        acc_id,
+                        how_many=params.get('limit') or 10,
+                        start_date=params.get('start'),
+                        end_date=params.get('end'),
+                    )
+        except Exception as e:  # noqa
+            result['error'] = e
+        self._pending_refresh = result
+        try:
+            self.after(0, self._apply_refresh_results)
+        except Exception:
+            # Fenêtre détruite entre-temps
+            pass
+
+    def _apply_refresh_results(self) -> None:
+        """Applique sur le thread Tk les résultats préparés par `_do_refresh_work`."""
+        result, self._pending_refresh = self._pending_refresh, None
+        if not result:
+            return
+        self._refresh_inflight.difference_update(result.get('keys', ()))
+        err = result.get('error')
+        if err is not None:
+            self.set_status(f"Erreur: {err}", error=True, details=repr(err))
+        accounts = result.get('accounts')
+        if accounts is not None:
+            sel = self.list_accounts.curselection()
+            self._fill_accounts_list(accounts)
+            # Conserver la sélection courante sans redéclencher on_account_selected
+            try:
+                for idx, acc in enumerate(accounts):
+                    if acc.get('id') == self.current_account_id:
+                        self.list_accounts.selection_set(idx)
+                        self.list_accounts.activate(idx)
+                        break
+                else:
+                    if sel:
+                        self.list_accounts.selection_set(sel[0])
+            except Exception:
+                pass
+        # Ignorer les détails si l'utilisateur a changé de compte pendant le fetch
+        if 'positions' in result and result.get('account_id') == self.current_account_id:
+            self.update_details(result['positions'], result.get('acts') or [])
+
     def _add_tree_context(self, tree: ttk.Treeview):
+        # Un seul menu par Treeview: réutiliser celui déjà construit
+        cached = self._context_menus.get(id(tree))
+        if cached is not None:
+            tree.bind('<Button-3>', cached[1])
+            return
         menu = tk.Menu(tree, tearoff=0)
         menu.add_command(label='Copier ligne', command=lambda: self._copy_selected(tree))
         # Extra actions contextual to symbol/news
@@ -3927,7 +4454,9 @@ class WSApp(tk.Tk):
                     except Exception:
                         pass
 
+        self._context_menus[id(tree)] = (menu, popup)
         tree.bind('<Button-3>', popup)
+        tree.bind('<Destroy>', lambda _e: self._context_menus.pop(id(tree), None), add='+')
 
     def _copy_selected(self, tree: ttk.Treeview):
         sel = tree.selection()
@@ -3950,6 +4479,17 @@ class WSApp(tk.Tk):
         except Exception:
             pass
 
+    def _symbol_col_idx(self, tree: ttk.Treeview) -> int | None:
+        """Index (mémorisé) de la colonne 'symbol' du Treeview, ou None si absente."""
+        key = id(tree)
+        try:
+            return self._symbol_col_idx_by_tree[key]
+        except KeyError:
+            cols = list(tree['columns'])
+            idx = cols.index('symbol') if 'symbol' in cols else None
+            self._symbol_col_idx_by_tree[key] = idx
+            return idx
+
     def _get_symbol_from_tree(self, tree: ttk.Treeview) -> str | None:
         try:
             sel = tree.selection()
@@ -3957,10 +4497,9 @@ class WSApp(tk.Tk):
                 return None
             item = tree.item(sel[0])
             vals = item.get('values')
-            cols = list(tree['columns'])
             # Prefer 'symbol' column if present
-            if 'symbol' in cols:
-                idx = cols.index('symbol')
+            idx = self._symbol_col_idx(tree)
+            if idx is not None:
                 return str(vals[idx]) if vals and idx < len(vals) and vals[idx] else None
             # Next, try the tree text (#0) which we now use for logos + symbol label
             txt = item.get('text')
@@ -4062,44 +4601,50 @@ class WSApp(tk.Tk):
             include_news_url = tree is getattr(self, 'tree_news', None)
             if include_news_url:
                 cols = cols + ['url']
-            with open(path, 'w', newline='', encoding='utf-8') as f:
+            # Matérialiser les lignes avant l'écriture (valeurs des signaux depuis le shadow)
+            shadow = self._signal_values if tree is getattr(self, 'tree_signals', None) else {}
+            rows = [list(shadow.get(iid) or tree.item(iid, 'values')) for iid in sel]
+            if include_news_url:
+                url_by_iid = getattr(self, '_news_url_by_iid', None)
+                articles = getattr(self, '_news_articles', None)
+                for iid, vals in zip(sel, rows):
+                    try:
+                        # Prefer iid mapping if available
+                        url = ''
+                        if isinstance(url_by_iid, dict):
+                            url = url_by_iid.get(iid, '') or ''
+                        if not url:
+                            idx = tree.index(iid)
+                            if isinstance(articles, list) and idx < len(articles):
+                                url = articles[idx].get('url') or ''
+                        vals.append(url)
+                    except Exception:
+                        vals.append('')
+            with open(path, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
                 writer = csv.writer(f)
                 writer.writerow(cols)
-                for iid in sel:
-                    vals = list(tree.item(iid, 'values'))
-                    if include_news_url:
-                        try:
-                            # Prefer iid mapping if available
-                            url = ''
-                            if isinstance(getattr(self, '_news_url_by_iid', None), dict):
-                                url = self._news_url_by_iid.get(iid, '') or ''
-                            if not url:
-                                idx = tree.index(iid)
-                                if isinstance(
-                                    getattr(self, '_news_articles', None), list
-                                ) and idx < len(self._news_articles):
-                                    url = self._news_articles[idx].get('url') or ''
-                            vals.append(url)
-                        except Exception:
-                            vals.append('')
-                    writer.writerow(vals)
+                writer.writerows(rows)
             self.set_status(f"Exporté: {path}")
         except Exception as e:
             self.set_status(f"Export: {e}", error=True)
 
-    def _on_symbol_double_click(self, event):
+    def _on_symbol_double_click(self, event=None):
         """Gestionnaire de double-clic sur un symbole dans le tableau des positions."""
-        item = self.tree_positions.selection()[0] if self.tree_positions.selection() else None
+        # Ligne sous le curseur (un seul appel Tk), sinon la sélection (bouton Analyser);
+        # valeurs lues dans l'ombre d'insertion
+        tree = self.tree_positions
+        y = getattr(event, 'y', None)
+        item = tree.identify_row(y) if y is not None else ''
         if not item:
+            sel = tree.selection()
+            if not sel:
+                return
+            item = sel[0]
+        values = self._row_values(tree, item)
+        if not values:
             return
 
-        # Récupérer les valeurs de la ligne
-        values = self.tree_positions.item(item, 'values')
-        if not values or len(values) < 1:
-            return
-
-        # Le symbole est dans la première colonne
-        symbol = values[0]
+        symbol = values[_POS_SYMBOL_IDX]
 
         if not symbol or symbol == 'N/A':
             self.set_status("Analyse: aucun symbole valide pour cette position.", error=True)
@@ -4128,9 +4673,8 @@ class WSApp(tk.Tk):
             self.set_status("Analyse: veuillez sélectionner une position.", error=True)
             return
 
-        # Simuler un double-clic
-        event = type('Event', (), {'widget': self.tree_positions})()
-        self._on_symbol_double_click(event)
+        # Même traitement qu'un double-clic, sur la ligne sélectionnée
+        self._on_symbol_double_click()
 
     def _quick_chart_selected(self):
         """Affiche un graphique rapide pour le symbole sélectionné."""
@@ -4164,11 +4708,11 @@ class WSApp(tk.Tk):
                             change_pct = quote.get('10. change percent', '0%')
                             volume = quote.get('06. volume', 'N/A')
 
-                            cur = self.base_currency
+                            fmt = self._fmt_money_cur
                             info_msg = f"""📊 Informations rapides pour {symbol}:
 
-• Prix actuel: {format_money(price, cur, with_symbol=True)}
-• Changement: {format_money(change, cur, with_symbol=True)} ({change_pct})
+• Prix actuel: {fmt(price)}
+• Changement: {fmt(change)} ({change_pct})
 • Volume: {volume}
 • Mise à jour: {quote.get('07. latest trading day', 'N/A')}
 
@@ -4194,7 +4738,7 @@ class WSApp(tk.Tk):
                             ),
                         )
 
-                threading.Thread(target=fetch_quick_info, daemon=True).start()
+                self._io_pool.submit(fetch_quick_info)
             else:
                 message = (
                     f"Symbole sélectionné: {symbol}\n\n"
@@ -4250,13 +4794,52 @@ class WSApp(tk.Tk):
                         except Exception as e:
                             self.after(0, lambda err=e: self._append_chat(f"Erreur: {err}\n"))
 
-                    threading.Thread(target=fetch_analysis, daemon=True).start()
+                    self._io_pool.submit(fetch_analysis)
                 else:
-                    resp = self.agent.chat(f"Donnez-moi une analyse générale du symbole {symbol}")
-                    self._append_chat(f"Agent: {resp}\n")
+                    self._chat_ask(f"Donnez-moi une analyse générale du symbole {symbol}")
             except Exception as e:
                 self.set_status(f"Erreur lors de l'analyse: {e}", error=True)
 
+    def _post(self, fn, *args, **kwargs) -> None:
+        """Planifie `fn(*args, **kwargs)` sur le thread Tk (sûr depuis un worker, ordre FIFO)."""
+        self._ui_queue.put((fn, args, kwargs))
+
+    def _start_single_flight(self, lock: threading.Lock, fn) -> bool:
+        """Lance `fn` sur le pool d'E/S partagé, sauf si l'exécution précédente est en cours."""
+        if not lock.acquire(blocking=False):
+            return False
+
+        def run():
+            try:
+                fn()
+            finally:
+                lock.release()
+
+        try:
+            self._io_pool.submit(run)
+        except RuntimeError:  # pool arrêté (fermeture de l'application)
+            lock.release()
+            return False
+        return True
+
+    def _drain_ui_queue(self) -> None:
+        """Exécute les callbacks en attente puis se replanifie (timer unique de 50 ms)."""
+        q = self._ui_queue
+        while True:
+            try:
+                fn, args, kwargs = q.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                fn(*args, **kwargs)
+            except Exception as e:
+                self._report_ui_error(fn, e)
+        try:
+            self.after(50, self._drain_ui_queue)
+        except Exception:
+            # Fenêtre détruite
+            pass
+
     def _busy(self, on: bool):
         try:
             if on:
@@ -4266,6 +4849,25 @@ class WSApp(tk.Tk):
         except Exception:  # noqa
             pass
 
+    def _report_ui_error(self, fn, exc: Exception) -> None:
+        """Compte l'échec d'un callback UI et le signale (bannière limitée à une par intervalle)."""
+        self._ui_errors += 1
+        self._ui_last_error = f"{getattr(fn, '__name__', fn)}: {exc}"
+        now = time.monotonic()
+        if now - self._ui_error_shown_at < _UI_ERROR_REPORT_SECS:
+            return
+        self._ui_error_shown_at = now
+        skipped = self._ui_errors - self._ui_errors_reported - 1
+        self._ui_errors_reported = self._ui_errors
+        msg = f"Erreur interface ({self._ui_last_error})"
+        if skipped > 0:
+            msg += f" (+{skipped} autre(s) depuis le dernier signalement)"
+        details = ''.join(traceback.format_exception(type(exc), exc, exc.__traceback__))
+        try:
+            self.set_status(msg, error=True, details=details)
+        except Exception:
+            pass
+
     def log(self, msg: str, clear=False):
         self.txt_output.configure(state=tk.NORMAL)
         if clear:
@@ -4274,6 +4876,22 @@ class WSApp(tk.Tk):
         self.txt_output.see(tk.END)
         self.txt_output.configure(state=tk.DISABLED)
 
+    def _set_readonly_text(self, widget: tk.Text, text: str, see_end: bool = False) -> None:
+        """Remplace le contenu d'un Text en lecture seule par un seul `replace`.
+
+        Rien n'est envoyé à Tk si le texte est identique au dernier affiché par ce helper.
+        """
+        if self._readonly_text.get(widget) == text:
+            return
+        self._readonly_text[widget] = text
+        widget.configure(state=tk.NORMAL)
+        try:
+            widget.replace('1.0', tk.END, text)
+            if see_end:
+                widget.see(tk.END)
+        finally:
+            widget.configure(state=tk.DISABLED)
+
     def _append_output(self, msg: str):
         """Ajoute un message à la zone de sortie."""
         self.log(msg)
@@ -4308,35 +4926,15 @@ class WSApp(tk.Tk):
         timeout_ms: cache automatiquement après X ms si > 0
         """
         try:
-            pal = self._palettes.get(self._theme, {})
-            bg = pal.get('panel')
-            fg = pal.get('text')
-            if kind == 'error':
-                bg = pal.get('danger_bg', bg)
-                fg = pal.get('danger', fg)
-            elif kind == 'info':
-                bg = pal.get('accent_bg', bg)
-                fg = pal.get('accent', fg)
-
-            # Configure ttk styles for banner (frame + label) to ensure background/foreground are applied
+            # Styles préconfigurés par _configure_banner_styles (au changement de thème)
+            suffix = 'Error' if kind == 'error' else 'Info'
+            frame_style = f'Banner{suffix}.TFrame'
             try:
-                style = ttk.Style(self)
-                suffix = 'Error' if kind == 'error' else 'Info'
-                frame_style = f'Banner{suffix}.TFrame'
-                label_style = f'Banner{suffix}.TLabel'
-                # Apply styles (idempotent)
-                style.configure(frame_style, background=bg)
-                style.configure(label_style, background=bg, foreground=fg)
-                # Apply styles to widgets
                 self._banner_container.configure(style=frame_style)
                 self._banner_frame.configure(style=frame_style)
-                self._banner_msg.configure(style=label_style)
+                self._banner_msg.configure(style=f'Banner{suffix}.TLabel')
             except Exception:
-                # Fallback: set foreground directly on label
-                try:
-                    self._banner_msg.configure(foreground=fg)
-                except Exception:
-                    pass
+                pass
             self._banner_msg.configure(text=text)
             # Enregistrer les détails (si fournis)
             if details:
@@ -4362,6 +4960,22 @@ class WSApp(tk.Tk):
         except Exception:
             pass
 
+    def _configure_banner_styles(self) -> None:
+        """Configure les styles ttk de la bannière (info/erreur) pour le thème courant."""
+        try:
+            pal = self._pal
+            style = ttk.Style(self)
+            panel = pal.get('panel')
+            text = pal.get('text')
+            for suffix, bg, fg in (
+                ('Error', pal.get('danger_bg', panel), pal.get('danger', text)),
+                ('Info', pal.get('accent_bg', panel), pal.get('accent', text)),
+            ):
+                style.configure(f'Banner{suffix}.TFrame', background=bg)
+                style.configure(f'Banner{suffix}.TLabel', background=bg, foreground=fg)
+        except Exception:
+            pass
+
     def _hide_banner(self):
         try:
             self._banner_frame.pack_forget()
@@ -4375,11 +4989,7 @@ class WSApp(tk.Tk):
         try:
             self._last_error_details = details
             # Préparer le texte
-            self._banner_details_text.configure(state=tk.NORMAL)
-            self._banner_details_text.delete('1.0', tk.END)
-            if details:
-                self._banner_details_text.insert(tk.END, details)
-            self._banner_details_text.configure(state=tk.DISABLED)
+            self._set_readonly_text(self._banner_details_text, details or '')
         except Exception:
             pass
 
@@ -4413,80 +5023,111 @@ class WSApp(tk.Tk):
         q = (self.var_search_query.get() or '').strip()
         if not q:
             return
+        key = q.lower()
+        ent = self._search_cache.get(key)
+        age = time.monotonic() - ent[0] if ent else None
+        if ent and age < _SEARCH_STALE_SECS:
+            # Réponse en cache affichée immédiatement; revalidée en fond si elle a vieilli
+            self._update_search_results(ent[1])
+            self.set_status(f'Recherche: {q} ({len(ent[1])} résultats en cache)')
+            if age >= _SEARCH_FRESH_SECS and key not in self._search_inflight:
+                self._search_inflight.add(key)
+                self._io_pool.submit(self._search_worker, q, key, True)
+            return
+        if key in self._search_inflight:
+            return
+        self._search_inflight.add(key)
         self.set_status(f'Recherche: {q} ...')
         self._busy(True)
-
-        def worker():
-            try:
-                results = self.api.search_security(q)
-                # results: list d'objets GraphQL -> dicts
-                # Normaliser
-                norm = []
-                for r in results:
-                    stock = r.get('stock') or {}
-                    quote_v2 = r.get('quoteV2') or {}
-                    norm.append(
-                        {
-                            'id': r.get('id'),
-                            'symbol': stock.get('symbol'),
-                            'name': stock.get('name'),
-                            'exchange': stock.get('primaryExchange'),
-                            'status': r.get('status'),
-                            'buyable': r.get('buyable'),
-                            'marketStatus': quote_v2.get('marketStatus'),
-                        }
-                    )
-                self.after(0, lambda n=norm: self._update_search_results(n))
-            except Exception as e:  # noqa
-                self.after(0, lambda e=e: self.set_status(f"Erreur recherche: {e}", error=True))
-            finally:
-                self.after(
-                    0,
-                    lambda: (
-                        self._busy(False),
-                        self.set_status('Recherche terminée'),
-                    ),
+        self._io_pool.submit(self._search_worker, q, key, False)
+
+    def _search_worker(self, q: str, key: str, background: bool) -> None:
+        norm = None
+        try:
+            results = self.api.search_security(q)
+            # results: list d'objets GraphQL -> dicts
+            # Normaliser
+            norm = []
+            for r in results:
+                stock = r.get('stock') or {}
+                quote_v2 = r.get('quoteV2') or {}
+                sym = stock.get('symbol')
+                name = stock.get('name')
+                exchange = stock.get('primaryExchange')
+                status = r.get('status')
+                buyable = r.get('buyable')
+                market_status = quote_v2.get('marketStatus')
+                norm.append(
+                    {
+                        'id': r.get('id'),
+                        'symbol': sym,
+                        'name': name,
+                        'exchange': exchange,
+                        'status': status,
+                        'buyable': buyable,
+                        'marketStatus': market_status,
+                        # Valeurs de ligne finales, calculées hors du thread Tk
+                        'values': (
+                            sym,
+                            name,
+                            exchange,
+                            status,
+                            'Oui' if buyable else 'Non',
+                            market_status,
+                        ),
+                    }
                 )
-
-        threading.Thread(target=worker, daemon=True).start()
+        except Exception as e:  # noqa
+            if not background:
+                self._post(self.set_status, f"Erreur recherche: {e}", error=True)
+        finally:
+            self._post(self._finish_search, key, norm, background)
+
+    def _finish_search(self, key: str, results: list[dict] | None, background: bool) -> None:
+        """Thread Tk: met le cache à jour et n'affiche une revalidation que si la requête
+        saisie est toujours la même."""
+        self._search_inflight.discard(key)
+        if results is not None:
+            cache = self._search_cache
+            cache.pop(key, None)
+            cache[key] = (time.monotonic(), results)
+            if len(cache) > _SEARCH_CACHE_MAX:
+                cache.pop(next(iter(cache)))
+            current = (self.var_search_query.get() or '').strip().lower()
+            if not background or current == key:
+                self._update_search_results(results)
+        if not background:
+            self._busy(False)
+            self.set_status('Recherche terminée')
 
     def _update_search_results(self, results):
         self._search_results = results
 
-        # Helper to fill a given tree
+        # Lignes pré-formatées par le worker (partagées par les deux arbres)
+        rows = [(str(r['symbol'] or ''), r['values']) for r in results]
+
+        # Helper to fill a given tree (appelé aussi hors file UI par le chemin cache)
         def _fill_tree(tree):
+            if tree is None or not tree.winfo_exists():
+                return
+            children = tree.get_children()
+            if children:
+                tree.delete(*children)
+            insert = _fast_tree_insert(tree)
+            pairs = []
+            shadow = self._tree_values[tree] = {}
+            with _bulk_tree_update(tree, len(rows)):
+                for i, (sym, values) in enumerate(rows):
+                    iid = insert(sym, values, _TAG_ODD if i % 2 else _TAG_EVEN)
+                    pairs.append((iid, sym))
+                    shadow[iid] = values
+            self._attach_logos_bulk(tree, pairs)
+
+        for tree in (self.tree_search, self.tree_search2):
             try:
-                for row in tree.get_children():
-                    tree.delete(row)
-                for i, r in enumerate(results):
-                    tag = 'even' if i % 2 == 0 else 'odd'
-                    iid = tree.insert(
-                        '',
-                        tk.END,
-                        text=str(r.get('symbol') or ''),
-                        values=(
-                            r.get('symbol'),
-                            r.get('name'),
-                            r.get('exchange'),
-                            r.get('status'),
-                            'Oui' if r.get('buyable') else 'Non',
-                            r.get('marketStatus'),
-                        ),
-                        tags=(tag,),
-                    )
-                    try:
-                        self._attach_logo_to_item(tree, iid, r.get('symbol') or '')
-                    except Exception:
-                        pass
-            except Exception:
-                pass
-
-        _fill_tree(self.tree_search)
-        try:
-            if hasattr(self, 'tree_search2'):
-                _fill_tree(self.tree_search2)
-        except Exception:
-            pass
+                _fill_tree(tree)
+            except Exception as e:
+                self._report_ui_error(_fill_tree, e)
 
     def open_search_security_details(self):
         """Open details for the selected security (search tab)."""
@@ -4515,74 +5156,47 @@ class WSApp(tk.Tk):
         def worker():
             try:
                 md = self.api.get_security_market_data(sec_id)
-                lines: list[str] = []
                 stock = md.get('stock') or {}
                 quote = md.get('quote') or {}
                 fund = md.get('fundamentals') or {}
-                lines.append(f"Nom: {stock.get('name')}")
-                lines.append(f"Symbole: {stock.get('symbol')}")
-                lines.append(f"Échange: {stock.get('primaryExchange')}")
+                lines = [
+                    f"Nom: {stock.get('name')}",
+                    f"Symbole: {stock.get('symbol')}",
+                    f"Échange: {stock.get('primaryExchange')}",
+                ]
                 if quote:
-                    lines.append(
-                        'Prix: ' + str(quote.get('last')) + ' | Volume: ' + str(quote.get('volume'))
-                    )
-                    lines.append(
-                        'High: '
-                        + str(quote.get('high'))
-                        + ' Low: '
-                        + str(quote.get('low'))
-                        + ' PrevClose: '
-                        + str(quote.get('previousClose'))
-                    )
+                    lines += [
+                        f"Prix: {quote.get('last')} | Volume: {quote.get('volume')}",
+                        f"High: {quote.get('high')} Low: {quote.get('low')} "
+                        f"PrevClose: {quote.get('previousClose')}",
+                    ]
                 if fund:
-                    lines.append(
-                        '52w High: '
-                        + str(fund.get('high52Week'))
-                        + ' 52w Low: '
-                        + str(fund.get('low52Week'))
-                        + ' PE: '
-                        + str(fund.get('peRatio'))
-                        + ' Rendement: '
-                        + str(fund.get('yield'))
-                    )
-                    lines.append(
-                        'MarketCap: '
-                        + str(fund.get('marketCap'))
-                        + ' Devise: '
-                        + str(fund.get('currency'))
-                    )
+                    lines += [
+                        f"52w High: {fund.get('high52Week')} 52w Low: {fund.get('low52Week')} "
+                        f"PE: {fund.get('peRatio')} Rendement: {fund.get('yield')}",
+                        f"MarketCap: {fund.get('marketCap')} Devise: {fund.get('currency')}",
+                    ]
                 desc = fund.get('description')
                 if desc:
-                    lines.append('--- Description ---')
-                    lines.append(desc)
+                    lines += ['--- Description ---', desc]
                 txt = '\n'.join(lines)
                 self.after(0, lambda t=txt: self._set_search_details(t))
-                # Update order subtypes (allowed types) in background
+                # Allowed order subtypes are part of the same market-data payload: the API
+                # serves them from its cache, so no second round-trip is issued here
                 try:
-
-                    def _upd_types():
-                        try:
-                            sub = self.api.get_allowed_order_subtypes(sec_id)
-                        except Exception:
-                            sub = None
-                        self.after(0, lambda s=sub: self._set_order_allowed_types(s))
-
-                    threading.Thread(target=_upd_types, daemon=True).start()
+                    sub = self.api.get_allowed_order_subtypes(sec_id)
                 except Exception:
-                    pass
+                    sub = None
+                self.after(0, lambda s=sub: self._set_order_allowed_types(s))
             except Exception as e:  # noqa
                 self.after(0, lambda e=e: self.set_status(f"Erreur détails: {e}", error=True))
             finally:
                 self.after(0, lambda: (self._busy(False), self.set_status('Prêt')))
 
-        threading.Thread(target=worker, daemon=True).start()
+        self._io_pool.submit(worker)
 
     def _set_search_details(self, text: str):
-        self.txt_search_details.configure(state=tk.NORMAL)
-        self.txt_search_details.delete('1.0', tk.END)
-        self.txt_search_details.insert(tk.END, text)
-        self.txt_search_details.see(tk.END)
-        self.txt_search_details.configure(state=tk.DISABLED)
+        self._set_readonly_text(self.txt_search_details, text, see_end=True)
 
     # --------- Logos & images (new) ---------
     def _set_logo_image(self, symbol: str | None):
@@ -4609,7 +5223,8 @@ class WSApp(tk.Tk):
 
     def _apply_logo(self, symbol: str, img):
         if img:
-            self._logo_images[symbol] = img
+            # Clé distincte: _logo_images sert aussi de cache des petits logos de tableaux
+            self._logo_images[f'{symbol}:large'] = img
             self.lbl_search_logo.configure(image=img, text='')
         else:
             self.lbl_search_logo.configure(text=symbol, image='')
@@ -4624,94 +5239,121 @@ class WSApp(tk.Tk):
     def _populate_search_defaults(self):
         """Affiche par défaut les positions actuelles (top valeur) si aucune recherche."""
         try:
-            items = sorted(self._positions_cache, key=lambda p: p.get('value') or 0, reverse=True)[
-                :20
-            ]
-            for row in self.tree_search.get_children():
-                self.tree_search.delete(row)
+            items = self._positions_top20
+            if items is None:
+                # Tri calculé une fois par cache de positions (invalidé par _set_positions_cache)
+                items = sorted(
+                    self._positions_cache, key=lambda p: p.get('value') or 0, reverse=True
+                )[:20]
+                self._positions_top20 = items
+            tree = self.tree_search
+            children = tree.get_children()
+            if children:
+                tree.delete(*children)
+            insert = _fast_tree_insert(tree)
+            pairs = []
             for i, p in enumerate(items):
-                tag = 'even' if i % 2 == 0 else 'odd'
                 sym = p.get('symbol') or ''
-                iid = self.tree_search.insert(
-                    '',
-                    tk.END,
-                    text=sym,
-                    values=(sym, p.get('name'), '', 'Held', 'Oui', p.get('currency') or ''),
-                    tags=(tag,),
+                iid = insert(
+                    sym,
+                    (sym, p.get('name'), '', 'Held', 'Oui', p.get('currency') or ''),
+                    _TAG_ODD if i % 2 else _TAG_EVEN,
                 )
-                try:
-                    self._attach_logo_to_item(self.tree_search, iid, sym)
-                except Exception:
-                    pass
+                pairs.append((iid, sym))
+            self._attach_logos_bulk(tree, pairs)
             self._set_search_details(
                 "Suggestions par défaut: vos positions principales affichées. Lancez une recherche pour plus de titres."
             )
         except Exception:
             pass
 
-    def _update_search_suggestions(self):
-        query = (self.var_search_query.get() or '').strip().upper()
-        # Cacher si vide
-        if not query:
-            try:
-                if self.lst_search_suggestions.winfo_ismapped():
-                    self.lst_search_suggestions.place_forget()
-            except Exception:
-                pass
-            try:
-                if (
-                    hasattr(self, 'lst_search_suggestions2')
-                    and self.lst_search_suggestions2.winfo_ismapped()
-                ):
-                    self.lst_search_suggestions2.place_forget()
-            except Exception:
-                pass
-            return
-        # Générer suggestions basées sur positions + codes fréquents
-        symbols = {
-            (p.get('symbol') or '').upper() for p in self._positions_cache if p.get('symbol')
-        }
-        common = {'AAPL', 'MSFT', 'TSLA', 'NVDA', 'GOOGL', 'AMZN', 'META', 'BTC', 'ETH'}
-        matches = [s for s in sorted(symbols | common) if s.startswith(query)][:8]
-        if not matches:
-            if self.lst_search_suggestions.winfo_ismapped():
-                self.lst_search_suggestions.place_forget()
-            return
-        # Debounce UI updates to avoid flicker
-
-        def _apply_list():
-            try:
-                if self.lst_search_suggestions.winfo_exists():
-                    self.lst_search_suggestions.delete(0, tk.END)
-                    for m in matches:
-                        self.lst_search_suggestions.insert(tk.END, m)
-            except Exception:
-                pass
-            try:
-                if (
-                    hasattr(self, 'lst_search_suggestions2')
-                    and self.lst_search_suggestions2.winfo_exists()
-                ):
-                    self.lst_search_suggestions2.delete(0, tk.END)
-                    for m in matches:
-                        self.lst_search_suggestions2.insert(tk.END, m)
-            except Exception:
-                pass
-
+    def _on_search_query_change(self, *_):
+        # Debounce: persistance et suggestions ne s'exécutent qu'après une pause de frappe
         try:
-            if hasattr(self, '_search_debounce_id') and self._search_debounce_id:
+            if self._search_debounce_id:
                 self.after_cancel(self._search_debounce_id)
         except Exception:
             pass
-        self._search_debounce_id = self.after(300, _apply_list)
-        # Positionner sous le champ (approx) - placement simple
+        self._search_debounce_id = self.after(250, self._flush_search_query)
+
+    def _flush_search_query(self):
+        """Persiste la requête (une seule écriture disque) puis met à jour les suggestions."""
+        self._search_debounce_id = None
+        q = (self.var_search_query.get() or '').strip()
         try:
-            self.lst_search_suggestions.place(x=200, y=0)
+            app_config.set('ui.search.last_query', q, save=False)
+            if q:
+                lst = app_config.get('ui.search.recent', []) or []
+                if not isinstance(lst, list):
+                    lst = []
+                if q in lst:
+                    lst.remove(q)
+                lst.insert(0, q)
+                app_config.set('ui.search.recent', lst[:10], save=False)
+            app_config.save_config()
+            if q:
+                # Mettre à jour les deux combobox si présentes
+                for cb in (getattr(self, 'cb_search', None), getattr(self, 'cb_search2', None)):
+                    if cb is not None:
+                        cb.configure(values=lst[:10])
         except Exception:
             pass
+        # Cacher si vide
+        if not q:
+            self._hide_search_suggestions()
+            return
+        self._apply_search_suggestions()
+
+    def _suggestion_listboxes(self) -> tuple[tk.Listbox, ...]:
+        """Listes de suggestions existantes (la seconde n'est construite qu'optionnellement)."""
+        return tuple(
+            lb
+            for lb in (self.lst_search_suggestions, self.lst_search_suggestions2)
+            if lb is not None and lb.winfo_exists()
+        )
+
+    def _hide_search_suggestions(self) -> None:
         try:
-            if hasattr(self, 'lst_search_suggestions2'):
-                self.lst_search_suggestions2.place(x=200, y=0)
+            for lb in self._suggestion_listboxes():
+                if lb.winfo_ismapped():
+                    lb.place_forget()
+        except Exception:
+            pass
+
+    def _symbol_universe(self) -> tuple[str, ...]:
+        """Symboles (positions + codes fréquents) triés; reconstruits si les positions changent."""
+        if self._symbol_universe_dirty:
+            symbols = {
+                (p.get('symbol') or '').upper() for p in self._positions_cache if p.get('symbol')
+            }
+            self._symbol_universe_sorted = tuple(sorted(symbols | _COMMON_SYMBOLS))
+            self._symbol_universe_dirty = False
+        return self._symbol_universe_sorted
+
+    def _apply_search_suggestions(self):
+        self._search_debounce_id = None
+        query = (self.var_search_query.get() or '').strip().upper()
+        if not query:
+            return
+        # Plage de préfixe par recherche dichotomique: les symboles partageant le préfixe
+        # sont contigus à partir de bisect_left, seules 8 entrées au plus sont examinées
+        universe = self._symbol_universe()
+        i = bisect.bisect_left(universe, query)
+        matches = [sym for sym in universe[i : i + 8] if sym.startswith(query)]
+        if not matches:
+            self._hide_search_suggestions()
+            return
+        # Contenu identique au dernier appliqué: pas de delete/insert, seulement le placement
+        m = tuple(matches)
+        refill = m != self._last_suggestions
+        self._last_suggestions = m
+        # Un seul try: remplissage groupé puis placement sous le champ (approx)
+        try:
+            for lb in self._suggestion_listboxes():
+                if refill:
+                    lb.delete(0, tk.END)
+                    lb.insert(tk.END, *m)
+                lb.place(x=200, y=0)
         except Exception:
             pass
 
@@ -4725,7 +5367,7 @@ class WSApp(tk.Tk):
             try:
                 sel = (
                     self.lst_search_suggestions2.curselection()
-                    if hasattr(self, 'lst_search_suggestions2')
+                    if self.lst_search_suggestions2 is not None
                     else None
                 )
             except Exception:
@@ -4737,16 +5379,11 @@ class WSApp(tk.Tk):
         except Exception:
             symbol = (
                 self.lst_search_suggestions2.get(sel[0])
-                if hasattr(self, 'lst_search_suggestions2')
+                if self.lst_search_suggestions2 is not None
                 else ''
             )
         self.var_search_query.set(symbol)
-        self.lst_search_suggestions.place_forget()
-        try:
-            if hasattr(self, 'lst_search_suggestions2'):
-                self.lst_search_suggestions2.place_forget()
-        except Exception:
-            pass
+        self._hide_search_suggestions()
         self.search_securities()
 
     # --------- Manual Order helpers ---------
@@ -4818,8 +5455,9 @@ class WSApp(tk.Tk):
         limit_p = _pfloat(self.var_order_limit.get())
         stop_p = _pfloat(self.var_order_stop.get())
         # Ensure executor
-        if not hasattr(self, '_trade_exec') or self._trade_exec is None:
+        if self._trade_exec is None:
             self._trade_exec = TradeExecutor(self.api_manager)
+            self._trade_exec.on_change = self._schedule_signals_flush
             try:
                 self._trade_exec.configure_simple(
                     enabled=True, mode='paper', base_size=notional or 1000.0
@@ -4886,6 +5524,31 @@ class WSApp(tk.Tk):
             pass
 
     # ------------------- Persistance UI divers -------------------
+    def _movers_visible(self) -> bool:
+        for name in ('tree_gainers', 'tree_gainers_compact'):
+            tree = getattr(self, name, None)
+            try:
+                if tree is not None and tree.winfo_viewable():
+                    return True
+            except Exception:
+                pass
+        return False
+
+    def _schedule_hidden_flush(self, _event=None):
+        """Onglet changé ou fenêtre affichée: applique une fois les mises à jour différées."""
+        if self._hidden_flush_pending or not (self._movers_dirty or self._news_pending is not None):
+            return
+        self._hidden_flush_pending = True
+        self.after_idle(self._flush_hidden_updates)
+
+    def _flush_hidden_updates(self):
+        self._hidden_flush_pending = False
+        if self._movers_dirty and self._movers_visible():
+            self.update_movers()
+        pending = self._news_pending
+        if pending is not None:
+            self._update_news_tree(*pending)
+
     def _on_tab_changed(self, _event=None):
         try:
             nb = self._main_notebook
@@ -4895,8 +5558,14 @@ class WSApp(tk.Tk):
             pass
 
     # ---- Accessibility & theming helpers ----
-    def _detect_system_theme(self) -> str:
-        """Best-effort detection of system theme on Windows (defaults to light)."""
+    def _detect_system_theme(self, refresh: bool = False) -> str:
+        """Best-effort detection of system theme on Windows (defaults to light).
+
+        Le résultat est mémorisé; `refresh=True` relit le registre (choix explicite).
+        """
+        if self._system_theme is not None and not refresh:
+            return self._system_theme
+        theme = 'light'
         try:
             import winreg  # type: ignore
 
@@ -4906,9 +5575,11 @@ class WSApp(tk.Tk):
             ) as key:
                 # AppsUseLightTheme == 0 means dark
                 val, _ = winreg.QueryValueEx(key, "AppsUseLightTheme")
-                return 'light' if int(val) == 1 else 'dark'
+                theme = 'light' if int(val) == 1 else 'dark'
         except Exception:
-            return 'light'
+            pass
+        self._system_theme = theme
+        return theme
 
     def _apply_font_size(self):
         try:
@@ -4940,6 +5611,29 @@ class WSApp(tk.Tk):
             pass
 
     # ---- Tree sorting and layout persistence ----
+    @property
+    def symbol_analyzer(self):
+        """Analyseur de symboles, importé et instancié au premier accès (None si indisponible)."""
+        sa = self._symbol_analyzer
+        if sa is None and self._symbol_analyzer_ok:
+            try:
+                from symbol_analyzer import SymbolAnalyzer
+
+                sa = self._symbol_analyzer = SymbolAnalyzer(self)
+            except Exception:
+                self._symbol_analyzer_ok = False
+        return sa
+
+    def _install_columns(self, tree: ttk.Treeview, cols) -> None:
+        """Configure en-têtes triables et colonnes depuis une spécification de module."""
+        for col, hdr, width, anchor, numeric in cols:
+            tree.heading(
+                col,
+                text=hdr,
+                command=functools.partial(self._on_tree_heading_click, tree, col, numeric),
+            )
+            tree.column(col, width=width, anchor=anchor, stretch=True)
+
     def _on_tree_heading_click(self, tree: ttk.Treeview, col: str, numeric=False):
         # toggle sort and update header text with indicator
         try:
@@ -4948,19 +5642,29 @@ class WSApp(tk.Tk):
             self.sort_tree(tree, col, numeric=numeric)
             new_desc = not descending
             setattr(tree, f'_sort_desc_{col}', new_desc)
-            # Update header labels to show arrow on active column
-            for c in tree['columns']:
-                txt = tree.heading(c, 'text')
-                base = str(txt).replace(' ↑', '').replace(' ↓', '')
-                if c == col:
-                    base += ' ' + ('↑' if not new_desc else '↓')
-                tree.heading(c, text=base)
+            # Update header labels: only the previously active column and the new one
+            bases = getattr(tree, '_header_base', None)
+            if bases is None:
+                # Textes de base mémorisés une fois (sans flèche) pour ce Treeview
+                bases = {
+                    c: str(tree.heading(c, 'text')).replace(' ↑', '').replace(' ↓', '')
+                    for c in tree['columns']
+                }
+                tree._header_base = bases
+                tree._active_sort_col = None
+            prev = tree._active_sort_col
+            if prev is not None and prev != col:
+                tree.heading(prev, text=bases[prev])
+            tree.heading(col, text=f"{bases[col]} ↓" if new_desc else f"{bases[col]} ↑")
+            tree._active_sort_col = col
         except Exception:
             self.sort_tree(tree, col, numeric=numeric)
 
     def _restore_tree_layout(self, tree: ttk.Treeview, key: str):
         try:
             widths = app_config.get(f'ui.tables.{key}.widths', {}) or {}
+            # Mémoriser ce qui a été restauré: _save_tree_layouts n'écrit que les différences
+            tree._restored_widths = dict(widths)
             for c in tree['columns']:
                 w = widths.get(c)
                 if isinstance(w, int) and w > 20:
@@ -4980,6 +5684,7 @@ class WSApp(tk.Tk):
                 'active': getattr(self, 'tree_active', None),
                 'opps': getattr(self, 'tree_opps', None),
             }
+            changed = False
             for key, tree in mapping.items():
                 if not tree:
                     continue
@@ -4989,7 +5694,35 @@ class WSApp(tk.Tk):
                         widths[c] = int(tree.column(c, 'width'))
                     except Exception:
                         pass
-                app_config.set(f'ui.tables.{key}.widths', widths)
+                cfg_key = f'ui.tables.{key}.widths'
+                previous = getattr(tree, '_restored_widths', None)
+                if previous is None:
+                    previous = app_config.get(cfg_key, {}) or {}
+                if widths != previous:
+                    app_config.set(cfg_key, widths, save=False)
+                    tree._restored_widths = widths
+                    changed = True
+            # Une seule écriture disque pour l'ensemble des tableaux modifiés
+            if changed:
+                app_config.save_config()
+        except Exception:
+            pass
+
+    def _add_lazy_tab(self, nb: ttk.Notebook, text: str, builder) -> ttk.Frame:
+        """Ajoute un onglet vide dont le contenu est construit par ``builder(frame)`` au
+        premier affichage (``<Map>``, y compris via un notebook parent)."""
+        frame = ttk.Frame(nb)
+        nb.add(frame, text=text)
+        self._tab_builders[str(frame)] = builder
+        frame.bind('<Map>', self._on_lazy_tab_map, add='+')
+        return frame
+
+    def _on_lazy_tab_map(self, event) -> None:
+        builder = self._tab_builders.pop(str(event.widget), None)
+        if builder is None:
+            return
+        try:
+            builder(event.widget)
         except Exception:
             pass
 
@@ -5019,6 +5752,10 @@ class WSApp(tk.Tk):
             pass
 
     def _on_close(self):
+        try:
+            self._flush_config()
+        except Exception:
+            pass
         try:
             app_config.save_window_geometry(self.geometry())
         except Exception:
@@ -5027,6 +5764,18 @@ class WSApp(tk.Tk):
             self._save_tree_layouts()
         except Exception:
             pass
+        # Écriture différée: une seule sauvegarde finale de toutes les préférences en attente
+        app_config.flush()
+        for pool in (self._refresh_executor, self._io_pool):
+            try:
+                pool.shutdown(wait=False, cancel_futures=True)
+            except Exception:
+                pass
+        try:
+            if self.api_manager:
+                self.api_manager.close()
+        except Exception:
+            pass
         self.destroy()
 
     def _apply_positions_quick_filter(self):
@@ -5034,59 +5783,29 @@ class WSApp(tk.Tk):
             q = (self.var_pos_quick.get() or '').strip().lower()
         except Exception:
             q = ''
-        # if no cache yet, nothing to do
-        if not isinstance(getattr(self, '_positions_cache', None), list):
+        tree = self.tree_positions
+        if not tree.winfo_exists():
             return
-        # Clear and re-fill
-        try:
-            for row in self.tree_positions.get_children():
-                self.tree_positions.delete(row)
-        except Exception:
+        # Les lignes insérées par update_details sont réutilisées: les non-correspondantes sont
+        # détachées, les autres rattachées dans l'ordre du cache (pas de reformatage ni de logos)
+        iids = self._positions_iids
+        keys = self._positions_filter_keys()
+        if not iids or len(iids) != len(keys):
             return
-        for pos in self._positions_cache:
-            sym = str(pos.get('symbol') or '').lower()
-            name = str(pos.get('name') or '').lower()
+        shown: list[tuple[str, tuple]] = []
+        hidden: list[str] = []
+        for iid, (sym, name, _pos), pnl_tags in zip(iids, keys, self._positions_pnl_tags):
             if q and q not in sym and q not in name:
-                continue
-            val = pos.get('value') or 0.0
-            pnl_pct = pos.get('pnlPct')
-            avg = pos.get('avgPrice')
-            arrow_pct = ''
-            if isinstance(pnl_pct, (int, float)):
-                arrow_pct = ('↑' if pnl_pct >= 0 else '↓') + f"{abs(pnl_pct):.2f}%"
-                if pos.get('pnlIsDaily'):
-                    arrow_pct += '*'
-            idx = len(self.tree_positions.get_children())
-            base_tag = 'even' if idx % 2 == 0 else 'odd'
-            pnl_tag = None
-            if isinstance(pnl_pct, (int, float)):
-                pnl_tag = 'pnl_pos' if pnl_pct >= 0 else 'pnl_neg'
-            tags = (base_tag,) + ((pnl_tag,) if pnl_tag else tuple())
-            iid = self.tree_positions.insert(
-                '',
-                tk.END,
-                text=str(pos.get('symbol') or ''),
-                values=(
-                    pos.get('symbol'),
-                    pos.get('name'),
-                    pos.get('quantity'),
-                    (pos.get('lastPrice') if pos.get('lastPrice') is not None else ''),
-                    f"{val:.2f}" if val else '',
-                    pos.get('currency') or '',
-                    f"{avg:.2f}" if isinstance(avg, (int, float)) else '',
-                    arrow_pct,
-                    (
-                        f"{pos.get('pnlAbs'):,.2f}"
-                        if isinstance(pos.get('pnlAbs'), (int, float))
-                        else ''
-                    ),
-                ),
-                tags=tags,
-            )
-            try:
-                self._attach_logo_to_item(self.tree_positions, iid, pos.get('symbol') or '')
-            except Exception:
-                pass
+                hidden.append(iid)
+            else:
+                shown.append((iid, pnl_tags))
+        move, item = tree.move, tree.item
+        with _bulk_tree_update(tree, len(iids)):
+            if hidden:
+                tree.detach(*hidden)
+            for i, (iid, pnl_tags) in enumerate(shown):
+                move(iid, '', i)
+                item(iid, tags=(_TAG_ODD if i % 2 else _TAG_EVEN) + pnl_tags)
 
     # ------------------- Paramètres: helpers -------------------
     def _refresh_profile_info(self):
@@ -5133,7 +5852,7 @@ class WSApp(tk.Tk):
             self.api = None
             self.accounts = []
             self.current_account_id = None
-            self._positions_cache = []
+            self._set_positions_cache([])
             self._activities_cache = []
             # Clear UI lists/trees
             try:
@@ -5172,13 +5891,27 @@ class WSApp(tk.Tk):
             self.set_status(f"Déconnexion: {e}", error=True)
 
     # ------------------- Surveillance AI continue -------------------
-    def _ai_watchdog_tick(self):
+    def _ai_watchdog_tick(self) -> int:
         """Background monitor: re-run agent rules and refresh UI.
 
         Keeps signals fresh even if no manual action; throttled and resilient.
+        Renvoie le délai (ms) avant le prochain passage (intervalle adaptatif).
         """
         try:
-            if getattr(self, 'agent', None) and self.agent.last_positions:
+            positions = self.agent.last_positions if getattr(self, 'agent', None) else None
+            if positions:
+                # Positions inchangées: on saute le calcul et on espace les ticks (x2), sauf au
+                # plafond où un passage complet est forcé (signaux techniques basés sur le marché)
+                h = hash(tuple((p.symbol, p.quantity, p.value, p.pnl_pct) for p in positions))
+                if h != self._watchdog_hash:
+                    self._watchdog_hash = h
+                    self._watchdog_interval_ms = _WATCHDOG_BASE_MS
+                elif self._watchdog_interval_ms < _WATCHDOG_MAX_MS:
+                    self._watchdog_interval_ms = min(
+                        self._watchdog_interval_ms * 2, _WATCHDOG_MAX_MS
+                    )
+                    positions = None
+            if positions:
                 # Produce any new signals
                 new_sigs = []
                 try:
@@ -5196,8 +5929,8 @@ class WSApp(tk.Tk):
                         pass
         except Exception:
             pass
-        # Schedule next check
-        self.after(30000, self._ai_watchdog_tick)
+        # Prochain passage (intervalle adaptatif), planifié par _periodic_tick
+        return self._watchdog_interval_ms
 
     # ------------------- Mouvements -------------------
     def update_movers(self, top_n: int | None = None):
@@ -5210,6 +5943,11 @@ class WSApp(tk.Tk):
         # Ensure at least one movers tree exists
         if not hasattr(self, 'tree_gainers') and not hasattr(self, 'tree_gainers_compact'):
             return
+        # Onglet masqué: marquer à rafraîchir, le remplissage aura lieu à l'affichage
+        if not self._movers_visible():
+            self._movers_dirty = True
+            return
+        self._movers_dirty = False
         # Déterminer le Top N effectif
         try:
             top_n = int(top_n) if top_n is not None else int(app_config.get('ui.movers.top_n', 5))
@@ -5227,23 +5965,35 @@ class WSApp(tk.Tk):
                 if movers and isinstance(movers, dict):
 
                     def _fill_from_market():
-                        def fill_tree(tree, items, cols_map):
-                            for row in tree.get_children():
-                                tree.delete(row)
-                            for i, q in enumerate(items):
-                                tag = 'even' if i % 2 == 0 else 'odd'
-                                vals = cols_map(q)
-                                sym = (q.get('symbol') or '').strip().upper()
-                                iid = tree.insert('', tk.END, text=sym, values=vals, tags=(tag,))
-                                try:
-                                    self._attach_logo_to_item(tree, iid, sym)
-                                except Exception:
-                                    pass
+                        def fill_tree(tree, items, cols_map, limit=None):
+                            children = tree.get_children()
+                            if children:
+                                tree.delete(*children)
+                            n = len(items) if limit is None else min(len(items), limit)
+                            pairs = []
+                            with _bulk_tree_update(tree, n):
+                                for i, q in enumerate(itertools.islice(items, n)):
+                                    tag = 'even' if i % 2 == 0 else 'odd'
+                                    vals = cols_map(q)
+                                    sym = (q.get('symbol') or '').strip().upper()
+                                    # Couleur P&L connue ici: pas de seconde passe de relecture
+                                    pnl_tag = (
+                                        'pnl_pos' if (q.get('changePct') or 0) >= 0 else 'pnl_neg'
+                                    )
+                                    iid = tree.insert(
+                                        '', tk.END, text=sym, values=vals, tags=(tag, pnl_tag)
+                                    )
+                                    pairs.append((iid, sym))
+                            self._attach_logos_bulk(tree, pairs)
 
                         gainers = movers.get('gainers') or []
                         losers = movers.get('losers') or []
                         actives = movers.get('actives') or []
-                        opps = movers.get('opportunities') or (losers[: max(1, top_n // 2)])
+                        # Repli: tête des perdants, parcourue sans copie de liste
+                        opps = movers.get('opportunities')
+                        opps_limit = None
+                        if not opps:
+                            opps, opps_limit = losers, max(1, top_n // 2)
                         tgt_gainers = getattr(self, 'tree_gainers', None) or getattr(
                             self, 'tree_gainers_compact', None
                         )
@@ -5293,34 +6043,11 @@ class WSApp(tk.Tk):
                                 f"{q.get('price', 0):.2f}",
                                 q.get('volume'),
                             ),
+                            opps_limit,
                         )
                         self.set_status(
                             f"Mouvements (CA): +{len(gainers)} / -{len(losers)} / actifs {len(actives)}"
                         )
-                        # Recolor according to Pct change
-                        try:
-                            pal = self._palettes[self._theme]
-                            for tree in [
-                                self.tree_gainers,
-                                self.tree_losers,
-                                self.tree_active,
-                                self.tree_opps,
-                            ]:
-                                for iid in tree.get_children():
-                                    cols = tree.item(iid, 'values')
-                                    pnl_idx = 2 if tree is self.tree_active else 1
-                                    try:
-                                        v = float(
-                                            str(cols[pnl_idx]).replace('%', '').replace('*', '')
-                                        )
-                                    except Exception:
-                                        v = 0.0
-                                    color = pal.get('success') if v >= 0 else pal.get('danger')
-                                    tag_name = f"pnl_{iid}"
-                                    tree.tag_configure(tag_name, foreground=color)
-                                    tree.item(iid, tags=(tree.item(iid, 'tags') + (tag_name,)))
-                        except Exception:
-                            pass
 
                     try:
                         self.after(0, _fill_from_market)
@@ -5328,97 +6055,74 @@ class WSApp(tk.Tk):
                     except Exception:
                         pass
 
-            threading.Thread(target=worker_market, daemon=True).start()
+            self._start_single_flight(self._movers_inflight, worker_market)
 
         # Fallback local basé sur portefeuille
-        positions = list(self._positions_cache)
-
-        def pnl_pct(p):  # local helpers
-            v = p.get('pnlPct')
-            return v if isinstance(v, (int, float)) else 0.0
-
-        def pnl_abs(p):
-            v = p.get('pnlAbs')
-            return v if isinstance(v, (int, float)) else 0.0
-
-        def val(p):
-            v = p.get('value')
-            return v if isinstance(v, (int, float)) else 0.0
-
-        gainers = [p for p in positions if pnl_pct(p) > 0]
-        gainers.sort(key=pnl_pct, reverse=True)
-        losers = [p for p in positions if pnl_pct(p) < 0]
-        losers.sort(key=pnl_pct)  # plus négatif en premier
-        actives = sorted(positions, key=val, reverse=True)
-        # Opportunités: combiner plusieurs heuristiques (baisses fortes, retournement possible)
-        opps = [
-            p
-            for p in losers
-            if (
-                pnl_pct(p) <= -5  # Forte baisse relative
-                or pnl_abs(p) <= -100  # Perte absolue significative
-                or (
-                    pnl_pct(p) < 0 and val(p) > 500 and abs(pnl_pct(p)) <= 8
-                )  # Baisse modérée sur grosse position
-            )
-        ]
-        opps.sort(key=pnl_pct)
+        positions = self._positions_cache
+
+        # Accesseur de module lié en locale (pas de redéfinition à chaque appel)
+        pnl_pct = _pos_pnl_pct
+
+        # Une seule passe sur les colonnes numériques alimentant des tas bornés (taille Top N):
+        # clés (valeur, -indice) en min-tas pour garder les plus grands, à égalité le premier
+        pct_col, abs_col, val_col = self._positions_columns()
+        g_cap, l_cap, o_cap = top_n, max(top_n, 3), max(top_n, 5)
+        gh: list[tuple[float, int]] = []
+        lh: list[tuple[float, int]] = []
+        ah: list[tuple[float, int]] = []
+        oh: list[tuple[float, int]] = []
+        push, pushpop = heapq.heappush, heapq.heappushpop
+        n_opps = 0
+        for i, pct in enumerate(pct_col):
+            value = val_col[i]
+            (push if len(ah) < top_n else pushpop)(ah, (value, -i))
+            if pct > 0:
+                (push if len(gh) < g_cap else pushpop)(gh, (pct, -i))
+            elif pct < 0:
+                (push if len(lh) < l_cap else pushpop)(lh, (-pct, -i))
+                # Opportunités: combiner plusieurs heuristiques (baisses fortes, retournement possible)
+                if (
+                    pct <= -5  # Forte baisse relative
+                    or abs_col[i] <= -100  # Perte absolue significative
+                    or (value > 500 and pct >= -8)  # Baisse modérée sur grosse position
+                ):
+                    n_opps += 1
+                    (push if len(oh) < o_cap else pushpop)(oh, (-pct, -i))
+        gainers = [positions[-i] for _, i in sorted(gh, reverse=True)]
+        # plus négatif en premier
+        losers = [positions[-i] for _, i in sorted(lh, reverse=True)]
+        actives = [positions[-i] for _, i in sorted(ah, reverse=True)]
+        opps = [positions[-i] for _, i in sorted(oh, reverse=True)]
         # Fallback: si aucune opportunité stricte trouvée, prendre les 3 plus grosses pertes
         if not opps:
             opps = losers[:3]
+            n_opps = len(opps)
 
         def fill(tree, items):
-            for row in tree.get_children():
-                tree.delete(row)
-            for i, p in enumerate(items[:top_n]):
-                tag = 'even' if i % 2 == 0 else 'odd'
-                pnl_or_val = (
-                    f"{pnl_pct(p):.2f}" if tree is not self.tree_active else f"{val(p):.2f}"
-                )
-                iid = tree.insert(
-                    '',
-                    tk.END,
-                    text=str(p.get('symbol') or ''),
-                    values=(
-                        p.get('symbol'),
-                        pnl_or_val,
-                        f"{pnl_abs(p):.2f}",
-                        f"{val(p):.2f}",
-                        p.get('quantity'),
-                    ),
-                    tags=(tag,),
-                )
-                try:
-                    self._attach_logo_to_item(tree, iid, p.get('symbol') or '')
-                except Exception:
-                    pass
-
-        def fill_specific(tree, items, cols):
-            for row in tree.get_children():
-                tree.delete(row)
-            for i, p in enumerate(items[:top_n]):
-                tag = 'even' if i % 2 == 0 else 'odd'
-                iid = tree.insert(
-                    '', tk.END, text=str(p.get('symbol') or ''), values=cols(p), tags=(tag,)
-                )
-                try:
-                    self._attach_logo_to_item(tree, iid, p.get('symbol') or '')
-                except Exception:
-                    pass
+            children = tree.get_children()
+            if children:
+                tree.delete(*children)
+            n = min(len(items), top_n)
+            cols = self._tree_cols_fn[tree]
+            pairs = []
+            with _bulk_tree_update(tree, n):
+                for i, p in enumerate(itertools.islice(items, n)):
+                    iid = tree.insert(
+                        '',
+                        tk.END,
+                        text=str(p.get('symbol') or ''),
+                        values=cols(p),
+                        tags=(
+                            'even' if i % 2 == 0 else 'odd',
+                            'pnl_pos' if pnl_pct(p) >= 0 else 'pnl_neg',
+                        ),
+                    )
+                    pairs.append((iid, p.get('symbol') or ''))
+            self._attach_logos_bulk(tree, pairs)
 
         fill(self.tree_gainers, gainers)
         fill(self.tree_losers, losers)
-        fill_specific(
-            self.tree_active,
-            actives,
-            lambda p: (
-                p.get('symbol'),
-                f"{val(p):.2f}",
-                f"{pnl_pct(p):.2f}{'*' if p.get('pnlIsDaily') else ''}",
-                f"{pnl_abs(p):.2f}",
-                p.get('quantity'),
-            ),
-        )
+        fill(self.tree_active, actives)
         fill(self.tree_opps, opps)
         # Résumé automatique opportunités
         try:
@@ -5431,33 +6135,9 @@ class WSApp(tk.Tk):
                     )
                     for p in opps[:5]
                 )
-                self.set_status(f"{len(opps)} opportunités détectées: {resume}")
+                self.set_status(f"{n_opps} opportunités détectées: {resume}")
         except Exception:
             pass
-        pal = self._palettes[self._theme]
-        try:
-            for tree in [
-                self.tree_gainers,
-                self.tree_losers,
-                self.tree_active,
-                self.tree_opps,
-            ]:
-                for iid in tree.get_children():
-                    cols = tree.item(iid, 'values')
-                    pnl_idx = 2 if tree is self.tree_active else 1
-                    try:
-                        v = float(str(cols[pnl_idx]).replace('%', '').replace('*', ''))
-                    except Exception:
-                        v = 0.0
-                    color = pal.get('success') if v >= 0 else pal.get('danger')
-                    tag_name = f"pnl_{iid}"
-                    tree.tag_configure(tag_name, foreground=color)
-                    tree.item(
-                        iid,
-                        tags=(tree.item(iid, 'tags') + (tag_name,)),
-                    )
-        except Exception:  # noqa
-            pass
 
     # ------------------- Actualités -------------------
 
@@ -5476,21 +6156,45 @@ class WSApp(tk.Tk):
                     articles = self.api_manager.news.get_financial_news('stock market', 15)
                 # Ajouter un score de sentiment basique
                 enriched = []
-                pos_words = {'up', 'gain', 'beat', 'growth', 'surge', 'rise'}
-                neg_words = {'down', 'loss', 'miss', 'decline', 'drop', 'fall'}
                 for a in articles:
                     text = ((a.get('title') or '') + ' ' + (a.get('description') or '')).lower()
-                    score = sum(1 for w in pos_words if w in text) - sum(
-                        1 for w in neg_words if w in text
+                    # Un balayage regex par polarité; chaque mot compte une fois (comme avant)
+                    score = len(set(_NEWS_POS_RE.findall(text))) - len(
+                        set(_NEWS_NEG_RE.findall(text))
                     )
                     a['sentimentScore'] = score
                     enriched.append(a)
                 articles = enriched
-                self.after(0, lambda: self._update_news_tree(articles))
+                # Lignes d'affichage (troncature, date, sentiment) préparées hors du thread Tk
+                rows = [_news_display_row(a) for a in articles]
+                self.after(0, lambda: self._update_news_tree(articles, rows))
             except Exception as e:
                 self.after(0, lambda e=e: self.set_status(f"Erreur actualités: {e}", error=True))
 
-        threading.Thread(target=worker, daemon=True).start()
+        self._start_single_flight(self._news_inflight, worker)
+
+    def _cancel_timer(self, attr: str) -> None:
+        """Annule le `after` mémorisé dans `attr` (s'il y en a un)."""
+        pending = getattr(self, attr, None)
+        setattr(self, attr, None)
+        if pending:
+            try:
+                self.after_cancel(pending)
+            except Exception:
+                pass
+
+    def _reschedule(self, attr: str, secs: int, fn) -> None:
+        """Replanifie `fn` en annulant le timer en attente (un seul `after` vivant par famille)."""
+        self._cancel_timer(attr)
+        setattr(self, attr, self.after(secs * 1000, fn))
+
+    @staticmethod
+    def _parse_secs(var, default: int) -> int:
+        """Intervalle d'auto-rafraîchissement validé (>= 30 s), lu au changement de réglage."""
+        try:
+            return max(30, int(var.get()))
+        except Exception:
+            return default
 
     def _schedule_news_auto(self):
         try:
@@ -5498,36 +6202,26 @@ class WSApp(tk.Tk):
             app_config.set('ui.news.seconds', int(self.var_news_seconds.get()))
         except Exception:
             pass
-        # Cancel previous if any
-        try:
-            if getattr(self, '_news_auto_id', None):
-                self.after_cancel(self._news_auto_id)
-        except Exception:
-            pass
+        self._news_secs = self._parse_secs(self.var_news_seconds, 120)
         if self.var_news_auto.get():
             # Trigger immediate refresh then schedule
             try:
                 self.refresh_news()
             except Exception:
                 pass
-            try:
-                secs = max(30, int(self.var_news_seconds.get()))
-            except Exception:
-                secs = 120
-            self._news_auto_id = self.after(secs * 1000, self._news_auto_tick)
+            self._reschedule('_news_auto_id', self._news_secs, self._news_auto_tick)
+        else:
+            self._cancel_timer('_news_auto_id')
 
     def _news_auto_tick(self):
         if not self.var_news_auto.get():
+            self._cancel_timer('_news_auto_id')
             return
         try:
             self.refresh_news()
         except Exception:
             pass
-        try:
-            secs = max(30, int(self.var_news_seconds.get()))
-        except Exception:
-            secs = 120
-        self._news_auto_id = self.after(secs * 1000, self._news_auto_tick)
+        self._reschedule('_news_auto_id', self._news_secs, self._news_auto_tick)
 
     def refresh_market_overview(self):
         """Récupère un aperçu du marché pour les positions actuelles."""
@@ -5547,50 +6241,49 @@ class WSApp(tk.Tk):
             except Exception as e:
                 self.after(0, lambda e=e: self.set_status(f"Erreur aperçu marché: {e}", error=True))
 
-        threading.Thread(target=worker, daemon=True).start()
+        self._start_single_flight(self._overview_inflight, worker)
 
-    def _update_news_tree(self, articles: list[dict]):
-        """Met à jour le TreeView des actualités."""
-        # keep for URL open action
+    def _update_news_tree(self, articles: list[dict], rows: list[tuple] | None = None):
+        """Met à jour le TreeView des actualités (`rows`: valeurs pré-formatées par le worker)."""
+        if rows is None:
+            rows = [_news_display_row(a) for a in articles or []]
+        # Onglet masqué: conserver le dernier lot, appliqué à l'affichage
         try:
-            self._news_articles = list(articles or [])
+            if not self.tree_news.winfo_viewable():
+                self._news_pending = (articles, rows)
+                return
         except Exception:
-            self._news_articles = list(articles or [])
+            pass
+        self._news_pending = None
+        # keep for URL open action
+        articles = list(articles or [])
+        self._news_articles = articles
         # Clear existing
-        try:
-            self._news_url_by_iid = {}
-        except Exception:
-            self._news_url_by_iid = {}
-        for item in self.tree_news.get_children():
-            self.tree_news.delete(item)
-
-        for article in articles:
-            source = article.get('source', {}).get('name', 'N/A')
-            raw_title = article.get('title', 'Sans titre')
-            title = raw_title[:80] + '...' if len(raw_title) > 80 else raw_title
-            published = article.get('publishedAt', '')[:10]
-            score = article.get('sentimentScore', 0)
-            if score > 0:
-                sentiment = f"🟢 +{score}" if score > 1 else "🟢 +1"
-            elif score < 0:
-                sentiment = f"🔴 {score}"
-            else:
-                sentiment = "🟡 0"
-            iid = self.tree_news.insert('', tk.END, values=(source, title, published, sentiment))
-            try:
-                url = article.get('url') or ''
-                if url:
-                    self._news_url_by_iid[str(iid)] = url
-            except Exception:
-                pass
+        children = self.tree_news.get_children()
+        if children:
+            self.tree_news.delete(*children)
+
+        insert = _fast_tree_insert(self.tree_news)
+        with _bulk_tree_update(self.tree_news, len(rows)):
+            iids = [insert('', values, ()) for values in rows]
+        self._news_url_by_iid = {
+            str(iid): a['url'] for iid, a in zip(iids, articles) if a.get('url')
+        }
 
         self.set_status(f"Actualités mises à jour: {len(articles)} articles")
 
-    def _on_signal_double_click(self, _event=None):
-        sel = self.tree_signals.selection()
-        if not sel:
-            return
-        vals = self.tree_signals.item(sel[0], 'values')
+    def _on_signal_double_click(self, event=None):
+        tree = self.tree_signals
+        iid = tree.identify_row(event.y) if event is not None else ''
+        if not iid:
+            sel = tree.selection()
+            if not sel:
+                return
+            iid = sel[0]
+        # Valeurs suivies par AgentUI à l'insertion; lecture Tk seulement en repli
+        vals = (self.agent_ui.row_values.get(iid) if self.agent_ui else None) or tree.item(
+            iid, 'values'
+        )
         if len(vals) < 3:
             return
         symbol = vals[2]
@@ -5634,35 +6327,25 @@ class WSApp(tk.Tk):
             app_config.set('ui.movers.seconds', int(self.var_movers_seconds.get()))
         except Exception:
             pass
-        # Cancel previous
-        try:
-            if getattr(self, '_movers_auto_id', None):
-                self.after_cancel(self._movers_auto_id)
-        except Exception:
-            pass
+        self._movers_secs = self._parse_secs(self.var_movers_seconds, 120)
         if self.var_movers_auto.get():
             try:
                 self.update_movers()
             except Exception:
                 pass
-            try:
-                secs = max(30, int(self.var_movers_seconds.get()))
-            except Exception:
-                secs = 120
-            self._movers_auto_id = self.after(secs * 1000, self._movers_auto_tick)
+            self._reschedule('_movers_auto_id', self._movers_secs, self._movers_auto_tick)
+        else:
+            self._cancel_timer('_movers_auto_id')
 
     def _movers_auto_tick(self):
         if not self.var_movers_auto.get():
+            self._cancel_timer('_movers_auto_id')
             return
         try:
             self.update_movers()
         except Exception:
             pass
-        try:
-            secs = max(30, int(self.var_movers_seconds.get()))
-        except Exception:
-            secs = 120
-        self._movers_auto_id = self.after(secs * 1000, self._movers_auto_tick)
+        self._reschedule('_movers_auto_id', self._movers_secs, self._movers_auto_tick)
 
     def _schedule_search_auto(self):
         try:
@@ -5670,34 +6353,25 @@ class WSApp(tk.Tk):
             app_config.set('ui.search.seconds', int(self.var_search_seconds.get()))
         except Exception:
             pass
-        try:
-            if getattr(self, '_search_auto_id', None):
-                self.after_cancel(self._search_auto_id)
-        except Exception:
-            pass
+        self._search_secs = self._parse_secs(self.var_search_seconds, 180)
         if self.var_search_auto.get():
             try:
                 self.search_securities()
             except Exception:
                 pass
-            try:
-                secs = max(30, int(self.var_search_seconds.get()))
-            except Exception:
-                secs = 180
-            self._search_auto_id = self.after(secs * 1000, self._search_auto_tick)
+            self._reschedule('_search_auto_id', self._search_secs, self._search_auto_tick)
+        else:
+            self._cancel_timer('_search_auto_id')
 
     def _search_auto_tick(self):
         if not self.var_search_auto.get():
+            self._cancel_timer('_search_auto_id')
             return
         try:
             self.search_securities()
         except Exception:
             pass
-        try:
-            secs = max(30, int(self.var_search_seconds.get()))
-        except Exception:
-            secs = 180
-        self._search_auto_id = self.after(secs * 1000, self._search_auto_tick)
+        self._reschedule('_search_auto_id', self._search_secs, self._search_auto_tick)
 
     def on_news_double_click(self, event):
         """Affiche les détails d'un article sélectionné."""
@@ -5739,13 +6413,18 @@ class WSApp(tk.Tk):
 
         def worker():
             try:
-                total_value = sum(float(p.get('value', 0)) for p in self._positions_cache)
-                total_pnl = sum(
-                    float(p.get('pnlAbs', 0)) for p in self._positions_cache if p.get('pnlAbs')
-                )
-                positions_count = len(
-                    [p for p in self._positions_cache if float(p.get('value', 0)) > 0]
-                )
+                # Une seule traversée: une lecture et une conversion par champ
+                total_value = 0.0
+                total_pnl = 0.0
+                positions_count = 0
+                for p in self._positions_cache:
+                    v = float(p.get('value') or 0)
+                    total_value += v
+                    if v > 0:
+                        positions_count += 1
+                    pa = p.get('pnlAbs')
+                    if pa:
+                        total_pnl += float(pa)
 
                 success = self.api_manager.telegram.send_portfolio_summary(
                     total_value, total_pnl, positions_count
@@ -5761,7 +6440,7 @@ class WSApp(tk.Tk):
             except Exception as e:
                 self.after(0, lambda e=e: self.set_status(f"Erreur notification: {e}", error=True))
 
-        threading.Thread(target=worker, daemon=True).start()
+        self._io_pool.submit(worker)
 
 
 # Fin de classe
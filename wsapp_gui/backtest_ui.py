@@ -51,9 +51,11 @@ class BacktestPanel:
         self.canvas = None
         self.lbl_status = None
 
-    def build(self, notebook: ttk.Notebook):
-        tab = ttk.Frame(notebook)
-        notebook.add(tab, text='Backtest')
+    def build(self, notebook: ttk.Notebook, tab: ttk.Frame | None = None):
+        # ``tab``: onglet déjà ajouté au notebook (construction différée par l'application)
+        if tab is None:
+            tab = ttk.Frame(notebook)
+            notebook.add(tab, text='Backtest')
         self.tab = tab
         # Top controls
         top = ttk.Frame(tab)
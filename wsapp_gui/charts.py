@@ -567,11 +567,11 @@ class ChartController:
         try:
             import csv
 
-            with open(path, 'w', newline='', encoding='utf-8') as f:
+            # Tampon de 1 Mio et un seul writerows pour toute la série
+            with open(path, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
                 w = csv.writer(f)
                 w.writerow(['date', 'value'])
-                for d, v in self._last_points:
-                    w.writerow([d, v])
+                w.writerows(self._last_points)
             return True
         except Exception:
             return False
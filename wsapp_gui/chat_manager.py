@@ -79,7 +79,11 @@ class ChatManager:
 
                 self.app.after(0, _reenable)
 
-        threading.Thread(target=worker, daemon=True).start()
+        # Appel à l'agent (potentiellement distant) sur le pool d'I/O partagé de l'application
+        try:
+            self.app._io_pool.submit(worker)
+        except RuntimeError:  # pool arrêté (fermeture de l'application)
+            pass
 
     # ----- Historique: navigation avec ↑ / ↓ -----
     def history_prev(self, *_args) -> str | None:
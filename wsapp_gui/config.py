@@ -5,10 +5,16 @@ Améliorations:
 - Valeurs par défaut explicites pour les préférences Telegram (include_technical, tech_format)
 """
 
+import atexit
 import json
+import os
+import threading
 from pathlib import Path
 from typing import Any
 
+# Marqueur des clés absentes dans le cache de lecture de get()
+_ABSENT = object()
+
 
 class AppConfig:
     """Gestionnaire de configuration de l'application."""
@@ -16,6 +22,14 @@ class AppConfig:
     def __init__(self, config_file: str = "ws_app_config.json"):
         self.config_file = Path(config_file)
         self.config: dict[str, Any] = {}
+        # Écriture différée (write-behind): désactivée par défaut, chaque set() sauvegarde
+        self._lock = threading.RLock()
+        self._dirty = False
+        self._write_delay: float | None = None
+        self._timer: threading.Timer | None = None
+        # Cache des lectures par clé pointée ('ui.charts.show_grid' -> valeur), vidé à chaque
+        # modification: les get() répétés ne reparcourent pas l'arborescence
+        self._memo: dict[str, Any] = {}
         self.load_config()
 
     def load_config(self) -> None:
@@ -29,6 +43,7 @@ class AppConfig:
 
         # Valeurs par défaut
         self._set_defaults()
+        self._memo.clear()
 
     def _merge_defaults(self, cfg: dict[str, Any], defaults: dict[str, Any]) -> None:
         """Fusionne récursivement les valeurs par défaut dans la config (ajoute uniquement les clés manquantes)."""
@@ -87,38 +102,97 @@ class AppConfig:
         self._merge_defaults(self.config, defaults)
 
     def save_config(self) -> None:
-        """Sauvegarde la configuration dans le fichier."""
+        """Sauvegarde la configuration dans le fichier (fichier temporaire puis remplacement)."""
+        with self._lock:
+            self._dirty = False
+            data = json.dumps(self.config, indent=2, ensure_ascii=False)
+        tmp = self.config_file.with_name(self.config_file.name + '.tmp')
         try:
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, indent=2, ensure_ascii=False)
+            with open(tmp, 'w', encoding='utf-8') as f:
+                f.write(data)
+            os.replace(tmp, self.config_file)
         except OSError as e:
             print(f"Erreur sauvegarde config: {e}")
 
+    def enable_write_behind(self, delay: float = 1.0) -> None:
+        """Regroupe les sauvegardes de ``set()``: au plus une écriture par ``delay`` secondes.
+
+        Les modifications restent en mémoire jusqu'au prochain ``flush()`` (minuterie,
+        fermeture de l'application ou sortie de l'interpréteur).
+        """
+        if self._write_delay is None:
+            atexit.register(self.flush)
+        self._write_delay = max(0.0, float(delay))
+
+    def flush(self) -> None:
+        """Écrit la configuration si des modifications sont en attente."""
+        with self._lock:
+            self._timer = None
+            if not self._dirty:
+                return
+        self.save_config()
+
+    def _schedule_save(self) -> None:
+        with self._lock:
+            self._dirty = True
+            if self._timer is not None:
+                return
+            timer = threading.Timer(self._write_delay, self.flush)
+            timer.daemon = True
+            self._timer = timer
+        timer.start()
+
     def get(self, key: str, default: Any = None) -> Any:
         """Récupère une valeur de configuration."""
+        try:
+            value = self._memo[key]
+        except KeyError:
+            with self._lock:
+                value = self.config
+                for k in key.split('.'):
+                    if isinstance(value, dict) and k in value:
+                        value = value[k]
+                    else:
+                        value = _ABSENT
+                        break
+                self._memo[key] = value
+        return default if value is _ABSENT else value
+
+    def snapshot(self, prefix: str) -> dict[str, Any]:
+        """Copie superficielle de la section ``prefix`` (``{}`` si absente ou non-dict).
+
+        Permet de lire une série de préférences d'une même section en une seule
+        recherche (construction d'un onglet).
+        """
+        section = self.get(prefix)
+        if not isinstance(section, dict):
+            return {}
+        with self._lock:
+            return dict(section)
+
+    def set(self, key: str, value: Any, *, save: bool = True) -> None:
+        """Définit une valeur de configuration.
+
+        Avec ``save=False`` la valeur est modifiée en mémoire seulement; l'appelant
+        regroupe alors plusieurs écritures et appelle ``save_config()`` une fois.
+        En mode écriture différée (``enable_write_behind``) la sauvegarde est planifiée.
+        """
         keys = key.split('.')
-        value = self.config
-
-        for k in keys:
-            if isinstance(value, dict) and k in value:
-                value = value[k]
+        with self._lock:
+            config = self.config
+
+            for k in keys[:-1]:
+                if k not in config:
+                    config[k] = {}
+                config = config[k]
+
+            config[keys[-1]] = value
+            self._memo.clear()
+        if save:
+            if self._write_delay is None:
+                self.save_config()
             else:
-                return default
-
-        return value
-
-    def set(self, key: str, value: Any) -> None:
-        """Définit une valeur de configuration."""
-        keys = key.split('.')
-        config = self.config
-
-        for k in keys[:-1]:
-            if k not in config:
-                config[k] = {}
-            config = config[k]
-
-        config[keys[-1]] = value
-        self.save_config()
+                self._schedule_save()
 
     def get_window_geometry(self) -> str:
         """Retourne la géométrie de la fenêtre."""
@@ -4,7 +4,7 @@ import json
 import threading
 import tkinter as tk
 from datetime import datetime
-from tkinter import filedialog, messagebox, ttk
+from tkinter import filedialog, ttk
 
 
 class DiagnosticsPanel:
@@ -15,9 +15,11 @@ class DiagnosticsPanel:
         self.tab = None
         self.text = None
 
-    def build(self, notebook: ttk.Notebook):
-        tab = ttk.Frame(notebook)
-        notebook.add(tab, text='Diagnostics')
+    def build(self, notebook: ttk.Notebook, tab: ttk.Frame | None = None):
+        # ``tab``: onglet déjà ajouté au notebook (construction différée par l'application)
+        if tab is None:
+            tab = ttk.Frame(notebook)
+            notebook.add(tab, text='Diagnostics')
         self.tab = tab
 
         bar = ttk.Frame(tab)
@@ -106,7 +108,7 @@ class DiagnosticsPanel:
         try:
             with open(path, 'w', encoding='utf-8') as f:
                 json.dump(snap, f, ensure_ascii=False, indent=2)
-            messagebox.showinfo('Export', 'Diagnostics exportés')
+            self.app._show_banner('Diagnostics exportés', kind='info', timeout_ms=3000)
         except Exception as e:
             self.app.set_status(f"Erreur export JSON: {e}", error=True)
 
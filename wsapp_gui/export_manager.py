@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import csv
 from datetime import datetime
-from tkinter import filedialog, messagebox
+from tkinter import filedialog
 from typing import TYPE_CHECKING
 
 from .ui_utils import format_money
@@ -81,8 +81,8 @@ class ExportManager:
                     )
 
             self.app.set_status(f"Positions exportées vers {filename}")
-            # Confirmation de réussite (popup conservée)
-            messagebox.showinfo("Export réussi", f"Positions exportées vers:\n{filename}")
+            # Confirmation de réussite (bannière non bloquante)
+            self.app._show_banner(f"Positions exportées vers: {filename}", timeout_ms=3000)
 
         except Exception as e:
             # Erreur en bannière avec détails, pas de popup bloquante
@@ -146,7 +146,7 @@ class ExportManager:
                     )
 
             self.app.set_status(f"Activités exportées vers {filename}")
-            messagebox.showinfo("Export réussi", f"Activités exportées vers:\n{filename}")
+            self.app._show_banner(f"Activités exportées vers: {filename}", timeout_ms=3000)
 
         except Exception as e:
             self.app.set_status("Erreur export activités", error=True, details=repr(e))
@@ -185,7 +185,7 @@ class ExportManager:
                     writer.writerow([symbol, name, exchange, buyable, security_id])
 
             self.app.set_status(f"Résultats de recherche exportés vers {filename}")
-            messagebox.showinfo("Export réussi", f"Résultats exportés vers:\n{filename}")
+            self.app._show_banner(f"Résultats exportés vers: {filename}", timeout_ms=3000)
 
         except Exception as e:
             self.app.set_status("Erreur export recherche", error=True, details=repr(e))
@@ -248,8 +248,8 @@ class ExportManager:
                 )
 
             self.app.set_status(f"Rapport généré: {filename}")
-            messagebox.showinfo(
-                "Rapport généré", f"Rapport de portefeuille sauvegardé:\n{filename}"
+            self.app._show_banner(
+                f"Rapport de portefeuille sauvegardé: {filename}", timeout_ms=3000
             )
 
         except Exception as e:
@@ -8,6 +8,9 @@ from __future__ import annotations
 import io
 import os
 import threading
+from collections import OrderedDict
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Callable
 
@@ -76,6 +79,9 @@ def _logo_candidates(symbol: str) -> list[str]:
     return urls
 
 
+# Nombre maximal de logos décodés conservés (clé: symbole + taille), éviction LRU
+_LOGO_CACHE_MAX = 256
+
 PLACEHOLDER_PNG = b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00@\x00\x00\x00@\x08\x06\x00\x00\x00szz\xf4\x00\x00\x00\x19tEXtSoftware\x00Python PIL\x94\xc7\xce|\x00\x00\x00\xc0IDATx\x9c\xed\xd7A\x0e\x80 \x0c\x04A\xd1\xff\x9f\xb9F\xfa\x94\x8d\n\xb4\n\x14\x07\x88\x13B~~\x17\xe7\\\x81I\xb2,\xcb\xb2,\xcb\xb2,\xcb\xb2,\xcb\xf2?\x1d\xc7q\x1cG\xffG\x9d\xe3\x00\x80\x94R\xfe\x8f;\xc6\x18c\x8c1\xc6\x18c\x8c\xf1\xff\xa3N\x0b!\x84\x10B\x08!\x84\x10B\x08!\x84\x10B\x08!\x84\x10B\x08!\x84xR\xea?\x8eo\x84W\x8a\xe3\x00\x00\x00\x00IEND\xaeB`\x82"
 
 
@@ -93,10 +99,18 @@ class MediaManager:
     ):
         self.max_logo_px = max_logo_px
         self.detail_logo_px = detail_logo_px or max(64, max_logo_px)
-        self._logo_cache: dict[str, MediaCacheEntry] = {}
+        # Logos décodés par (symbole, taille en px): petit logo de tableau et logo détaillé
+        # sont deux entrées distinctes, jamais redécodées tant qu'elles sont valides
+        self._logo_cache: OrderedDict[tuple[str, int], MediaCacheEntry] = OrderedDict()
+        # Protège les caches LRU de logos, les validateurs et la création du pool: ils sont
+        # lus et modifiés depuis les threads de récupération
+        self._lock = threading.Lock()
         self._img_cache: dict[str, MediaCacheEntry] = {}
         # tiny in-memory age tracking
-        self._logo_cache_ts: dict[str, float] = {}
+        self._logo_cache_ts: dict[tuple[str, int], float] = {}
+        # Validateurs HTTP par symbole: (url, ETag, Last-Modified, octets bruts). À l'expiration
+        # du TTL, le logo est revalidé par requête conditionnelle; un 304 réutilise les octets.
+        self._logo_validators: OrderedDict[str, tuple[str, str, str, bytes]] = OrderedDict()
         self._img_cache_ts: dict[str, float] = {}
         try:
             import time as _t
@@ -122,6 +136,8 @@ class MediaManager:
             )
         except Exception:  # pragma: no cover
             self._http = None  # type: ignore
+        # Pool (créé à la demande) pour les résolutions de logos par lot
+        self._fetch_pool: ThreadPoolExecutor | None = None
 
     # Runtime setters so Settings UI can apply without restart
     def set_ttl(self, ttl_sec: float) -> None:
@@ -144,9 +160,8 @@ class MediaManager:
             cb(None)
             return
         # cache hit with TTL
-        ent = self._logo_cache.get(symbol)
-        ts = self._logo_cache_ts.get(symbol, 0.0)
-        if ent and (self._now() - ts) < self._ttl:
+        ent = self._cached_logo(self._logo_key(symbol, large), self._now())
+        if ent:
             cb(ent.image_tk)
             return
 
@@ -163,14 +178,116 @@ class MediaManager:
         else:
             threading.Thread(target=worker, daemon=True).start()
 
+    def get_logos_async(
+        self,
+        symbols: Iterable[str],
+        cb: Callable[[dict[str, object | None]], None],
+        *,
+        large: bool = False,
+    ):
+        """Resolve several logos as one batch; ``cb(mapping)`` is invoked once.
+
+        Cached entries are served immediately; missing ones are fetched in parallel
+        (at most 8 concurrent requests) on the shared HTTP client.
+        """
+        mapping: dict[str, object | None] = {}
+        missing: list[str] = []
+        now = self._now()
+        for sym in dict.fromkeys((s or '').upper().strip() for s in symbols):
+            if not sym:
+                continue
+            ent = self._cached_logo(self._logo_key(sym, large), now)
+            if ent:
+                mapping[sym] = ent.image_tk
+            else:
+                missing.append(sym)
+        if not missing:
+            cb(mapping)
+            return
+
+        def fetch(sym: str):
+            try:
+                return sym, self._fetch_logo(sym, large=large)
+            except Exception:
+                return sym, None
+
+        def worker():
+            try:
+                if len(missing) == 1:
+                    mapping.update([fetch(missing[0])])
+                else:
+                    mapping.update(self._get_fetch_pool().map(fetch, missing))
+            except Exception:
+                pass
+            cb(mapping)
+
+        # Under pytest, run synchronously to avoid flaky thread scheduling in CI
+        if os.environ.get('PYTEST_CURRENT_TEST'):
+            worker()
+        else:
+            threading.Thread(target=worker, daemon=True).start()
+
+    def _get_fetch_pool(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._fetch_pool is None:
+                self._fetch_pool = ThreadPoolExecutor(
+                    max_workers=8, thread_name_prefix='wsapp-logo'
+                )
+            return self._fetch_pool
+
+    def _logo_key(self, symbol: str, large: bool) -> tuple[str, int]:
+        return symbol, (self.detail_logo_px if large else self.max_logo_px)
+
+    def _cached_logo(self, key: tuple[str, int], now: float) -> MediaCacheEntry | None:
+        """Entrée encore valide (TTL) pour ``key``, marquée comme récemment utilisée."""
+        with self._lock:
+            ent = self._logo_cache.get(key)
+            if ent is None or (now - self._logo_cache_ts.get(key, 0.0)) >= self._ttl:
+                return None
+            self._logo_cache.move_to_end(key)
+            return ent
+
+    def _put_logo(self, key: tuple[str, int], entry: MediaCacheEntry) -> None:
+        now = self._now()
+        with self._lock:
+            cache = self._logo_cache
+            cache[key] = entry
+            cache.move_to_end(key)
+            self._logo_cache_ts[key] = now
+            while len(cache) > _LOGO_CACHE_MAX:
+                old, _ = cache.popitem(last=False)
+                self._logo_cache_ts.pop(old, None)
+
     def _fetch_logo(self, symbol: str, large: bool = False):
         candidates = _logo_candidates(symbol)
+        with self._lock:
+            known = self._logo_validators.get(symbol)
+        if known and known[0] in candidates:
+            # L'URL qui a répondu la dernière fois est retentée en premier, conditionnellement
+            candidates.remove(known[0])
+            candidates.insert(0, known[0])
         for url in candidates:
             try:
-                r = self._http.get(url) if self._http else None
+                cond: dict[str, str] = {}
+                if known and known[0] == url:
+                    if known[1]:
+                        cond['If-None-Match'] = known[1]
+                    if known[2]:
+                        cond['If-Modified-Since'] = known[2]
+                if not self._http:
+                    r = None
+                elif cond:
+                    r = self._http.get(url, headers=cond)
+                else:
+                    r = self._http.get(url)
                 headers = getattr(r, 'headers', {}) or {}
                 ctype = str(headers.get('content-type', '')).lower()
                 status = getattr(r, 'status_code', None)
+                if status == 304 and cond:
+                    with self._lock:
+                        if symbol in self._logo_validators:
+                            self._logo_validators.move_to_end(symbol)
+                    return self._store_logo(symbol, known[3], large=large)
                 if status == 200:
                     ok = False
                     if ctype.startswith('image'):
@@ -184,25 +301,38 @@ class MediaManager:
                         ):
                             ok = True
                     if ok:
-                        return self._store_logo(symbol, getattr(r, 'content', b''), large=large)
+                        content = getattr(r, 'content', b'')
+                        self._remember_validators(symbol, url, headers, content)
+                        return self._store_logo(symbol, content, large=large)
             except Exception:
                 continue
         return self._store_logo(symbol, PLACEHOLDER_PNG, large=large)
 
+    def _remember_validators(self, symbol: str, url: str, headers, content: bytes) -> None:
+        etag = str(headers.get('etag', '') or '')
+        modified = str(headers.get('last-modified', '') or '')
+        validators = self._logo_validators
+        with self._lock:
+            if not (etag or modified):
+                validators.pop(symbol, None)
+                return
+            validators[symbol] = (url, etag, modified, content)
+            validators.move_to_end(symbol)
+            while len(validators) > _LOGO_CACHE_MAX:
+                validators.popitem(last=False)
+
     def _store_logo(self, symbol: str, content: bytes, large: bool = False):
+        key = self._logo_key(symbol, large)
         if HAS_PIL:
             try:
                 im = Image.open(io.BytesIO(content)).convert('RGBA')
-                target = self.detail_logo_px if large else self.max_logo_px
-                im.thumbnail((target, target))
+                im.thumbnail((key[1], key[1]))
                 tk_img = ImageTk.PhotoImage(im)
-                self._logo_cache[symbol] = MediaCacheEntry(tk_img, content, im.width, im.height)
-                self._logo_cache_ts[symbol] = self._now()
+                self._put_logo(key, MediaCacheEntry(tk_img, content, im.width, im.height))
                 return tk_img
             except Exception:
                 pass
-        self._logo_cache[symbol] = MediaCacheEntry(None, content, 0, 0)
-        self._logo_cache_ts[symbol] = self._now()
+        self._put_logo(key, MediaCacheEntry(None, content, 0, 0))
         return None
 
     def get_image_async(self, url: str, max_width: int, cb: Callable[[object | None], None]):
@@ -87,7 +87,7 @@ class PortfolioManager:
 
     def update_details(self, positions: list[dict], activities: list[dict]):
         """Met à jour l'affichage des positions et activités."""
-        self.app._positions_cache = positions
+        self.app._set_positions_cache(positions)
         self.app._activities_cache = activities  # Ajout du cache des activités
         self._fill_positions(positions)
         self._fill_activities(activities)
@@ -40,9 +40,11 @@ class ScreenerPanel:
         self.tree = None
         self.lbl_status = None
 
-    def build(self, notebook: ttk.Notebook):
-        tab = ttk.Frame(notebook)
-        notebook.add(tab, text="Screener")
+    def build(self, notebook: ttk.Notebook, tab: ttk.Frame | None = None):
+        # ``tab``: onglet déjà ajouté au notebook (construction différée par l'application)
+        if tab is None:
+            tab = ttk.Frame(notebook)
+            notebook.add(tab, text="Screener")
         self.tab = tab
         # Top bar
         top = ttk.Frame(tab)
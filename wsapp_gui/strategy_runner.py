@@ -36,6 +36,8 @@ class StrategyRunner:
         self.trade_executor = trade_executor
         # Optional UI callback: on_signal(symbol: str, signal: Any) -> None
         self.on_signal = on_signal
+        # Optional UI hook, called (no args) after recent_signals() changed
+        self.on_change = None
         self.enabled = False
         self.interval_sec = 300
         self.strategy = 'ma_cross'  # 'ma_cross' | 'rsi_reversion' | 'confluence'
@@ -128,6 +130,11 @@ class StrategyRunner:
                     self._recent.append((sym, s.kind, s.index, s.reason))
                     if len(self._recent) > self._recent_max:
                         self._recent = self._recent[-self._recent_max :]
+                    if self.on_change is not None:
+                        try:
+                            self.on_change()
+                        except Exception:
+                            pass
                     self._last_signals[key] = last_index
                     if s.kind == 'buy':
                         buys += 1
@@ -81,6 +81,8 @@ class TradeExecutor:
         self._trade_count_today = 0
         self._paper = PaperPortfolio(cash=100000.0)
         self._log = []
+        # Optional UI hook, called (no args) whenever the action log changes
+        self.on_change = None
         # Idempotency ledger: (symbol, kind, index)
         self._ledger = set()
         # Cooldown trackers
@@ -199,7 +201,7 @@ class TradeExecutor:
             # Fetch reference price
             price = self._get_last_price(symbol)
             if price is None or price <= 0:
-                self._log.append(f"{datetime.now().isoformat()} | SKIP {symbol} no price")
+                self._append_log(f"{datetime.now().isoformat()} | SKIP {symbol} no price")
                 return
             if str(signal.kind).lower() == 'buy':
                 if self._exec_buy(symbol, price, signal):
@@ -214,7 +216,7 @@ class TradeExecutor:
                     self._last_trade_ts = now_ts
                     self._last_symbol_trade_ts[symbol] = now_ts
         except Exception as e:
-            self._log.append(f"{datetime.now().isoformat()} | ERROR {symbol}: {e}")
+            self._append_log(f"{datetime.now().isoformat()} | ERROR {symbol}: {e}")
 
     # -------- simple order placement (paper + live hook) --------
     def place_order(
@@ -308,7 +310,7 @@ class TradeExecutor:
                         },
                     )
                 # We do not assume a fill in live mode. Mark as submitted.
-                self._log.append(
+                self._append_log(
                     f"{datetime.now().isoformat()} | LIVE SUBMIT {side.upper()} {otype} {symbol} qty={qty}"
                 )
                 return order
@@ -408,14 +410,14 @@ class TradeExecutor:
             order['filled_qty'] = exec_qty
             order['avg_fill_price'] = fill_price
             self._trade_count_today += 1
-            self._log.append(
+            self._append_log(
                 f"{datetime.now().isoformat()} | {side.upper()} {otype.upper()} {symbol} {exec_qty} @ {fill_price:.2f}"
             )
             return order
 
         # Not filled -> keep as open (paper only)
         self._open_orders.append(order)
-        self._log.append(
+        self._append_log(
             f"{datetime.now().isoformat()} | OPEN {side.upper()} {otype.upper()} {symbol} qty={qty} (tif={time_in_force})"
         )
         return order
@@ -566,6 +568,14 @@ class TradeExecutor:
     def last_actions(self, n: int = 10) -> list[str]:
         return self._log[-n:]
 
+    def _append_log(self, line: str) -> None:
+        self._log.append(line)
+        if self.on_change is not None:
+            try:
+                self.on_change()
+            except Exception:
+                pass
+
     # -------- internals --------
     def _rotate_trade_counter(self) -> None:
         today = datetime.now().date()
@@ -622,13 +632,13 @@ class TradeExecutor:
             pos.buy(price, qty)
             self._paper.cash -= cost
             self._trade_count_today += 1
-            self._log.append(
+            self._append_log(
                 f"{datetime.now().isoformat()} | BUY {symbol} {qty} @ {price:.2f} (conf={getattr(signal, 'confidence', None)})"
             )
             return True
         # live stub: no-op for safety
         self._trade_count_today += 1
-        self._log.append(
+        self._append_log(
             f"{datetime.now().isoformat()} | LIVE BUY (stub) {symbol} notional {self.base_size:.2f} @ {price:.2f}"
         )
         try:
@@ -660,13 +670,13 @@ class TradeExecutor:
             proceeds = pos.sell(price, sell_qty)
             self._paper.cash += proceeds
             self._trade_count_today += 1
-            self._log.append(
+            self._append_log(
                 f"{datetime.now().isoformat()} | SELL {symbol} {sell_qty:.4f} @ {price:.2f} (proceeds={proceeds:.2f})"
             )
             return True
         # live stub
         self._trade_count_today += 1
-        self._log.append(
+        self._append_log(
             f"{datetime.now().isoformat()} | LIVE SELL (stub) {symbol} ALL @ {price:.2f}"
         )
         try:
@@ -40,6 +40,18 @@ def format_money(
         return str(value) if value is not None else ''
 
 
+def money_formatter(currency: str | None = None, *, with_symbol: bool = False):
+    """Return a precompiled ``float -> str`` equivalent to ``format_money`` for one currency.
+
+    Meant for row-building loops: the currency lookup and template are resolved once,
+    each call is a single ``str.format``.
+    """
+    cur = (currency or '').upper() or 'CAD'
+    if with_symbol and cur in _CURR_SYM:
+        return (_CURR_SYM[cur] + '{:,.2f}').format
+    return ('{:,.2f} ' + cur.replace('{', '{{').replace('}', '}}')).format
+
+
 def set_combobox_enabled(cmb: Any, enabled: bool) -> None:
     """Enable/disable a ttk.Combobox, using 'readonly' when enabled."""
     try: